@@ -0,0 +1,176 @@
+# Path: scripts/bench_bilara_scan.py
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.db_updater.post_tasks.bilara import scan_bilara_tree  # noqa: E402
+from src.shared import FileSystemSource  # noqa: E402
+
+DEFAULT_PATH = PROJECT_ROOT / "data/raw/git/sc-data/sc_bilara_data"
+FOLDERS = ["root", "html", "reference", "variant", "translation", "comment"]
+GROUPS: List[Dict[str, List[str]]] = [
+    {"name": ["name"]},
+    {"blurb": ["blurb"]},
+    {"site": ["site"]},
+]
+
+
+def legacy_scan(base_path: Path) -> int:
+    relative_base = base_path.parent.parent
+    count = 0
+    for folder in FOLDERS:
+        scan_dir = base_path / folder
+        if not scan_dir.is_dir():
+            continue
+        for json_file in scan_dir.glob("**/*.json"):
+            path_parts = set(json_file.relative_to(relative_base).parts)
+            for group in GROUPS:
+                keywords = set(list(group.values())[0])
+                if not path_parts.isdisjoint(keywords):
+                    break
+            count += 1
+    return count
+
+
+DROP_CACHES_PATH = Path("/proc/sys/vm/drop_caches")
+
+
+def drop_page_cache() -> bool:
+    os.sync()
+    try:
+        DROP_CACHES_PATH.write_text("3\n")
+    except OSError as e:
+        print(f"⚠️  Không thể xóa page cache ({e}); số liệu 'lạnh' có thể là cache ấm.")
+        return False
+    return True
+
+
+def describe_tree(base_path: Path) -> str:
+    result = subprocess.run(
+        ["git", "-C", str(base_path), "rev-parse", "--short=10", "HEAD"],
+        capture_output=True,
+        text=True,
+    )
+    revision = result.stdout.strip() if result.returncode == 0 else "không phải git"
+    files = 0
+    total_size = 0
+    for folder in FOLDERS:
+        for json_file in (base_path / folder).glob("**/*.json"):
+            files += 1
+            total_size += json_file.stat().st_size
+    return (
+        f"rev {revision}, {files} file JSON, {total_size / 1e6:.0f} MB, "
+        f"{os.cpu_count()} CPU"
+    )
+
+
+def timed(label: str, func: Callable[[], int], repeat: int, drop_caches: bool = False):
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        if drop_caches:
+            drop_page_cache()
+        start = time.perf_counter()
+        count = func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<40} {best:8.3f}s  ({count} file)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark quét cây sc_bilara_data.")
+    parser.add_argument("path", nargs="?", type=Path, default=DEFAULT_PATH)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--drop-caches",
+        action="store_true",
+        help="Xóa page cache trước mỗi lần chạy lạnh (Linux, cần quyền root).",
+    )
+    args = parser.parse_args()
+
+    base_path: Path = args.path.resolve()
+    if not base_path.is_dir():
+        print(f"❌ Không tìm thấy thư mục: {base_path}")
+        return
+
+    source = FileSystemSource()
+    relative_base = base_path.parent.parent
+    print(f"🔎 Cây dữ liệu: {base_path}")
+    print(f"   {describe_tree(base_path)}\n")
+    cold = args.drop_caches
+
+    timed(
+        "legacy glob (chỉ liệt kê)",
+        lambda: legacy_scan(base_path),
+        args.repeat,
+        drop_caches=cold,
+    )
+
+    hashed_files = []
+
+    def cold_hashed() -> int:
+        hashed_files[:] = scan_bilara_tree(
+            base_path,
+            FOLDERS,
+            GROUPS,
+            FileSystemSource(use_git_index=False),
+            relative_base,
+        )
+        return len(hashed_files)
+
+    timed(
+        "scandir song song + hash toàn bộ (lạnh)",
+        cold_hashed,
+        args.repeat if cold else 1,
+        drop_caches=cold,
+    )
+
+    cold_files = []
+
+    def cold_indexed() -> int:
+        cold_files[:] = scan_bilara_tree(
+            base_path, FOLDERS, GROUPS, source, relative_base
+        )
+        return len(cold_files)
+
+    timed(
+        "scandir song song + git index (lạnh)",
+        cold_indexed,
+        args.repeat,
+        drop_caches=cold,
+    )
+
+    mismatched = {f.relative_path: f.sha for f in hashed_files}.items() ^ {
+        f.relative_path: f.sha for f in cold_files
+    }.items()
+    if mismatched:
+        print(f"⚠️  {len(mismatched)} sha khác nhau giữa git index và hash trực tiếp.")
+
+    previous = {
+        f.relative_path: {"size": f.size, "mtime_ns": f.mtime_ns, "sha": f.sha}
+        for f in cold_files
+    }
+    timed(
+        "scandir song song + hash (dùng lại)",
+        lambda: len(
+            scan_bilara_tree(
+                base_path,
+                FOLDERS,
+                GROUPS,
+                FileSystemSource(use_git_index=False),
+                relative_base,
+                previous=previous,
+            )
+        ),
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
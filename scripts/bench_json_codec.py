@@ -0,0 +1,159 @@
+# Path: scripts/bench_json_codec.py
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.shared import artifact_exists, json_codec  # noqa: E402
+
+DEFAULT_FILES = [
+    PROJECT_ROOT / "data/processed/prebuild/suttaplex-json/suttaplex.json",
+    PROJECT_ROOT / "data/processed/prebuild/parallels/sc_parallel_flat_segment.json",
+    PROJECT_ROOT / "data/processed/prebuild/cips-json/cips_sutta.json",
+]
+
+
+def synthetic_suttaplex(count: int) -> Dict[str, Any]:
+    rng = random.Random(42)
+    langs = ["en", "de", "vi", "pli", "lzh"]
+    data = {}
+    for i in range(count):
+        uid = f"{rng.choice(['mn', 'sn', 'an', 'dn'])}{i}"
+        data[uid] = {
+            "acronym": uid.upper(),
+            "translated_title": f"Bài kinh số {i}",
+            "original_title": "Mūlapariyāyasutta",
+            "blurb": "Evaṁ me sutaṁ. " * rng.randrange(1, 8),
+            "volpages": f"MN i {rng.randrange(1, 500)}",
+            "priority_author_uid": None,
+            "translations": [
+                {
+                    "id": f"{lang}_{uid}_author{j}",
+                    "lang": lang,
+                    "author_uid": f"author{j}",
+                    "author": f"Author {j}",
+                    "segmented": rng.random() < 0.5,
+                    "publication_date": None,
+                }
+                for j, lang in enumerate(rng.sample(langs, rng.randrange(1, 5)))
+            ],
+        }
+    return data
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def worker(inputs: List[Path], repeat: int) -> Dict[str, Any]:
+    results: Dict[str, Any] = {"backend": json_codec.JSON_BACKEND, "files": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        for path in inputs:
+            data = json_codec.read_json(path)
+            row: Dict[str, Any] = {"name": path.name}
+            row["read"] = best_of(lambda: json_codec.read_json(path), repeat)
+            for mode, compact in (("indent", False), ("compact", True)):
+                output = Path(tmp) / f"{mode}-{path.name}"
+                row[f"write_{mode}"] = best_of(
+                    lambda: json_codec.write_json(output, data, compact), repeat
+                )
+                row[f"size_{mode}"] = output.stat().st_size
+                row[f"read_{mode}"] = best_of(
+                    lambda: json_codec.read_json(output), repeat
+                )
+            results["files"].append(row)
+    return results
+
+
+def run_backend(backend: str, inputs: List[Path], repeat: int) -> Dict[str, Any]:
+    env = dict(os.environ, **{json_codec.JSON_CODEC_ENV: backend})
+    output = subprocess.run(
+        [sys.executable, __file__, "--worker", "--repeat", str(repeat)]
+        + [str(p) for p in inputs],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def print_report(reports: List[Dict[str, Any]]):
+    baseline = {row["name"]: row for row in reports[-1]["files"]}
+    header = (
+        f"{'codec':<8} {'file':<38} {'đọc':>8} {'ghi indent':>11} "
+        f"{'ghi gọn':>9} {'đọc gọn':>9} {'vòng đầy đủ':>12} {'tăng tốc':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for report in reports:
+        for row in report["files"]:
+            base = baseline[row["name"]]
+            round_trip = row["write_indent"] + row["read_indent"]
+            base_round_trip = base["write_indent"] + base["read_indent"]
+            print(
+                f"{report['backend']:<8} {row['name'][:38]:<38} "
+                f"{row['read'] * 1000:>7.0f}ms {row['write_indent'] * 1000:>9.0f}ms "
+                f"{row['write_compact'] * 1000:>7.0f}ms "
+                f"{row['read_compact'] * 1000:>7.0f}ms "
+                f"{round_trip * 1000:>10.0f}ms {base_round_trip / round_trip:>8.1f}x"
+            )
+    print()
+    for row in reports[-1]["files"]:
+        saved = 1 - row["size_compact"] / row["size_indent"]
+        print(
+            f"{row['name']}: indent {row['size_indent'] / 1e6:.1f} MB, "
+            f"gọn {row['size_compact'] / 1e6:.1f} MB (-{saved:.0%})"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="So sánh tốc độ đọc/ghi JSON giữa các codec (orjson, msgspec, stdlib)."
+    )
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--synthetic", type=int, default=30000)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker(args.files, args.repeat)))
+        return
+
+    inputs = args.files or [p for p in DEFAULT_FILES if artifact_exists(p)]
+    with tempfile.TemporaryDirectory() as tmp:
+        if not inputs:
+            synthetic = Path(tmp) / "synthetic-suttaplex.json"
+            synthetic.write_text(
+                json.dumps(
+                    synthetic_suttaplex(args.synthetic), ensure_ascii=False, indent=2
+                ),
+                encoding="utf-8",
+            )
+            print(f"Không có artifact prebuild, dùng dữ liệu giả lập: {synthetic.name}")
+            inputs = [synthetic]
+
+        backends = json_codec.available_json_backends()
+        print(f"Các codec khả dụng: {', '.join(backends)}\n")
+        reports = [run_backend(backend, inputs, args.repeat) for backend in backends]
+
+    print_report(reports)
+
+
+if __name__ == "__main__":
+    main()
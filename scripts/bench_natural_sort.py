@@ -0,0 +1,157 @@
+# Path: scripts/bench_natural_sort.py
+import argparse
+import contextlib
+import copy
+import csv
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.db_updater.post_tasks.cips import CipsIndex, cips_compiler  # noqa: E402
+from src.db_updater.post_tasks.parallels import (  # noqa: E402
+    ParallelGroups,
+    create_book_structure,
+    flatten_segment_map,
+    invert_to_segment_structure,
+    parallels_utils,
+    sort_data_naturally,
+)
+from src.shared import clear_natural_key_cache, natural_key_cache_info  # noqa: E402
+
+DEFAULT_PARALLELS = PROJECT_ROOT / "data/raw/git/sc-data/relationship/parallels.json"
+DEFAULT_CIPS = PROJECT_ROOT / "data/raw/git/cips/src/data/general-index.csv"
+REPLACEMENTS = [('"mn75.1"', '"mn75#1"')]
+
+
+@contextlib.contextmanager
+def use_natsort_library():
+    from natsort import natsort_keygen, natsorted
+
+    patched = [
+        (parallels_utils, "natsorted", natsorted),
+        (cips_compiler, "natural_key", natsort_keygen()),
+    ]
+    originals = [(module, name, getattr(module, name)) for module, name, _ in patched]
+    for module, name, value in patched:
+        setattr(module, name, value)
+    try:
+        yield
+    finally:
+        for module, name, value in originals:
+            setattr(module, name, value)
+
+
+def measure(func: Callable[[Any], Any], data: Any) -> Tuple[Any, float]:
+    working = copy.deepcopy(data)
+    start = time.perf_counter()
+    result = func(working)
+    return result, time.perf_counter() - start
+
+
+def sort_parallels(sutta_map: Dict) -> Dict[str, Any]:
+    segment_data = sort_data_naturally(invert_to_segment_structure(sutta_map))
+    return {
+        "category": sort_data_naturally(sutta_map),
+        "segment": segment_data,
+        "flat_segment": sort_data_naturally(flatten_segment_map(segment_data)),
+        "book": sort_data_naturally(create_book_structure(segment_data)),
+    }
+
+
+def sort_cips(rows: List[List[str]]) -> Dict[str, Any]:
+    index = CipsIndex()
+    for row in rows:
+        index.add_row(row)
+    index.finalize()
+    return {"topic": index.topic_index(), "sutta": index.sutta_index()}
+
+
+def read_cips_rows(tsv_path: Path) -> List[List[str]]:
+    with open(tsv_path, mode="r", encoding="utf-8") as tsvfile:
+        return list(csv.reader(tsvfile, delimiter="\t"))
+
+
+def synthetic_cips(rows: int) -> List[List[str]]:
+    rng = random.Random(41)
+    topics = [f"topic {rng.choice('abcdeghkmnprstuvyāīū')}{i}" for i in range(2000)]
+    books = ["dn", "mn", "sn", "an", "kp", "dhp", "ud", "iti", "snp"]
+    result = []
+    for _ in range(rows):
+        topic = rng.choice(topics)
+        if rng.random() < 0.05:
+            result.append([topic, "", f"xref {rng.choice(topics)}"])
+            continue
+        uid = f"{rng.choice(books)}{rng.randint(1, 150)}.{rng.randint(1, 60)}"
+        segment = f"{rng.randint(1, 30)}.{rng.randint(1, 12)}"
+        result.append([topic, f"context {rng.randint(1, 40)}", f"{uid}:{segment}"])
+    return result
+
+
+def compare(name: str, func: Callable[[Any], Any], data: Any):
+    try:
+        with use_natsort_library():
+            before, before_time = measure(func, data)
+    except ImportError:
+        before, before_time = None, None
+
+    clear_natural_key_cache()
+    after, cold_time = measure(func, data)
+    _, warm_time = measure(func, data)
+
+    if before is not None and json.dumps(before) != json.dumps(after):
+        print(f"❌ {name}: kết quả KHÔNG khớp với thư viện natsort.")
+        return
+
+    before_text = f"{before_time:>11.3f}s" if before_time is not None else f"{'-':>12}"
+    print(f"{name:<12}{before_text}{cold_time:>11.3f}s{warm_time:>11.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="So sánh sắp xếp tự nhiên (natsort) và khóa ghi nhớ dùng chung."
+    )
+    parser.add_argument("--parallels", type=Path, default=DEFAULT_PARALLELS)
+    parser.add_argument("--cips", type=Path, default=DEFAULT_CIPS)
+    parser.add_argument(
+        "--synthetic-rows",
+        type=int,
+        default=50000,
+        help="Số dòng CIPS giả lập khi không có file TSV.",
+    )
+    args = parser.parse_args()
+
+    print(f"{'':<12}{'natsort':>12}{'khóa (lạnh)':>12}{'khóa (nóng)':>12}")
+
+    if args.parallels.exists():
+        raw_content = args.parallels.read_text(encoding="utf-8")
+        for find, replace in REPLACEMENTS:
+            raw_content = raw_content.replace(find, replace)
+        sutta_map = ParallelGroups.from_data(json.loads(raw_content)).to_sutta_map()
+        compare("parallels", sort_parallels, sutta_map)
+    else:
+        print(f"⚠️  Bỏ qua parallels, không tìm thấy file: {args.parallels}")
+
+    if args.cips.exists():
+        rows = read_cips_rows(args.cips)
+    else:
+        print(
+            f"⚠️  Không tìm thấy {args.cips}, dùng {args.synthetic_rows} dòng giả lập."
+        )
+        rows = synthetic_cips(args.synthetic_rows)
+    compare("cips", sort_cips, rows)
+
+    info = natural_key_cache_info()
+    print(
+        f"\n🔎 Bộ nhớ đệm khóa: {info.currsize}/{info.maxsize} mục, "
+        f"{info.hits} lần trúng, {info.misses} lần trượt."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# Path: scripts/bench_parallels_groups.py
+import argparse
+import hashlib
+import json
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from itertools import combinations
+from pathlib import Path
+from typing import Any, Callable, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.db_updater.post_tasks.parallels import (  # noqa: E402
+    ParallelGroups,
+    flatten_segment_map,
+    invert_to_segment_structure,
+    sort_data_naturally,
+)
+from src.db_updater.post_tasks.parallels.parallels_utils import (  # noqa: E402
+    parse_sutta_id,
+)
+
+DEFAULT_PATH = PROJECT_ROOT / "data/raw/git/sc-data/relationship/parallels.json"
+REPLACEMENTS = [('"mn75.1"', '"mn75#1"')]
+
+
+def legacy_pair_map(data: list) -> defaultdict:
+    sutta_map = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+
+    for group in data:
+        relation_type = list(group.keys())[0]
+        id_list = group[relation_type]
+        full_list = [i for i in id_list if not i.startswith("~")]
+        resembling_list = [i.lstrip("~") for i in id_list if i.startswith("~")]
+        resembling_type = "resembles" if relation_type == "parallels" else relation_type
+
+        for source, target in combinations(full_list, 2):
+            sutta_map[parse_sutta_id(source)][relation_type][source].append(target)
+            sutta_map[parse_sutta_id(target)][relation_type][target].append(source)
+        for source in full_list if resembling_list else []:
+            for target in resembling_list:
+                sutta_map[parse_sutta_id(source)][resembling_type][source].append(
+                    target
+                )
+                sutta_map[parse_sutta_id(target)][resembling_type][target].append(
+                    source
+                )
+    return sutta_map
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Tuple[Any, float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def json_size(data: Any) -> int:
+    return len(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="So sánh biểu diễn parallels theo cặp và theo nhóm."
+    )
+    parser.add_argument("path", nargs="?", type=Path, default=DEFAULT_PATH)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if not args.path.exists():
+        print(f"❌ Không tìm thấy file: {args.path}")
+        return
+
+    raw_content = args.path.read_text(encoding="utf-8")
+    for find, replace in REPLACEMENTS:
+        raw_content = raw_content.replace(find, replace)
+    data = json.loads(raw_content)
+
+    pair_map, pair_time, pair_peak = measure(lambda: legacy_pair_map(data), args.repeat)
+    groups, group_time, group_peak = measure(
+        lambda: ParallelGroups.from_data(data), args.repeat
+    )
+
+    pair_category = sort_data_naturally(pair_map)
+    group_category = sort_data_naturally(groups.to_sutta_map())
+    if pair_category != group_category:
+        print("❌ Kết quả category KHÔNG khớp giữa hai cách biểu diễn.")
+        return
+
+    flat = sort_data_naturally(
+        flatten_segment_map(
+            sort_data_naturally(invert_to_segment_structure(pair_category))
+        )
+    )
+    mismatches = [
+        full_id
+        for full_id, relations in flat.items()
+        if sort_data_naturally(groups.relations_for(full_id)) != relations
+    ]
+    if mismatches:
+        print(
+            f"❌ {len(mismatches)} tra cứu relations_for không khớp: {mismatches[:5]}"
+        )
+        return
+
+    edges = sum(
+        len(targets)
+        for relations in pair_category.values()
+        for full_map in relations.values()
+        for targets in full_map.values()
+    )
+    print(f"🔎 Dữ liệu: {args.path} ({len(groups.groups)} nhóm, {edges} cạnh)")
+    print(
+        f"   sha256 {hashlib.sha256(raw_content.encode('utf-8')).hexdigest()[:12]}, "
+        f"tốt nhất trong {args.repeat} lần, bộ nhớ đỉnh đo riêng bằng tracemalloc\n"
+    )
+    print(f"{'':<22}{'thời gian':>12}{'bộ nhớ đỉnh':>16}{'JSON':>14}")
+    print(
+        f"{'cặp (combinations)':<22}{pair_time:>11.3f}s"
+        f"{pair_peak / 1e6:>14.1f}MB{json_size(pair_category) / 1e6:>12.2f}MB"
+    )
+    print(
+        f"{'nhóm (ParallelGroups)':<22}{group_time:>11.3f}s"
+        f"{group_peak / 1e6:>14.1f}MB{json_size(groups.to_dict()) / 1e6:>12.2f}MB"
+    )
+    print(f"\n✅ {len(flat)} tra cứu relations_for khớp với bản mở rộng theo cặp.")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,5 +7,7 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DATA_PATH = PROJECT_ROOT / "data"
 RAW_DATA_PATH = DATA_PATH / "raw"
 PROCESSED_DATA_PATH = DATA_PATH / "processed"
+CHANGESETS_DATA_PATH = PROCESSED_DATA_PATH / "changesets"
+CACHE_DATA_PATH = DATA_PATH / "cache"
 
 CONFIG_PATH = PROJECT_ROOT / "src" / "config"
@@ -10,7 +10,14 @@ from src.db_builder.db_builder_config_parser import load_config
 from src.db_builder.processors.biblio_processor import BiblioProcessor
 from src.db_builder.processors.bilara_tables_processor import BilaraTablesProcessor
 from src.db_builder.processors.hierarchy_processor import HierarchyProcessor
+from src.db_builder.processors.html_text_processor import (
+    HTML_TEXT_COLUMNS,
+    HtmlTextProcessor,
+)
+from src.db_builder.processors.parallels_processor import ParallelsProcessor
+from src.db_builder.processors.segment_lemma_processor import SegmentLemmaProcessor
 from src.db_builder.processors.suttaplex_processor import SuttaplexProcessor
+from src.shared import CIPS_SCHEMA_PATH, CIPS_TABLES, open_source
 
 logger = logging.getLogger(__name__)
 
@@ -36,13 +43,17 @@ def main():
 
         logger.info(f"Database sẽ được tạo tại: {db_path}")
 
-        with DatabaseManager(db_path) as db_manager:
+        with (
+            DatabaseManager(db_path) as db_manager,
+            open_source(db_config.get("source")) as source,
+        ):
             logger.info("--- Bắt đầu tạo cấu trúc bảng cho database ---")
             main_schema_path = PROJECT_ROOT / "src/db_builder/suttacentral_schema.sql"
             db_manager.create_tables_from_schema(main_schema_path)
+            db_manager.create_tables_from_schema(CIPS_SCHEMA_PATH)
 
             logger.info("--- Bắt đầu xử lý Bibliography ---")
-            b_processor = BiblioProcessor(db_config["bibliography"])
+            b_processor = BiblioProcessor(db_config["bibliography"], source)
             biblio_data, biblio_map = b_processor.process()
 
             logger.info("--- Bắt đầu xử lý Suttaplex và các dữ liệu liên quan ---")
@@ -59,7 +70,7 @@ def main():
 
             logger.info("--- Bắt đầu xử lý Hierarchy ---")
             h_processor = HierarchyProcessor(
-                db_config["tree"], valid_uids, uid_to_type_map
+                db_config["tree"], valid_uids, uid_to_type_map, source
             )
             nodes_data = h_processor.process_trees()
 
@@ -94,11 +105,71 @@ def main():
                             "author-remap": author_remap,
                         }
 
-                        segment_proc = BilaraTablesProcessor(processor_config)
+                        segment_proc = BilaraTablesProcessor(processor_config, source)
                         segment_data = segment_proc.process(target_table=table_name)
 
                         db_manager.insert_data(table_name, segment_data)
 
+            logger.info("--- Bắt đầu xử lý Html_Texts ---")
+            html_text_config = db_config.get("html-texts")
+            if not html_text_config:
+                logger.warning("⚠️  Không tìm thấy cấu hình 'html-texts'. Bỏ qua.")
+            else:
+                html_text_proc = HtmlTextProcessor(
+                    html_text_config, db_config.get("source")
+                )
+                db_manager.insert_rows(
+                    "Html_Texts",
+                    HTML_TEXT_COLUMNS,
+                    html_text_proc.iter_rows(translations_data),
+                )
+                db_manager.conn.execute(
+                    "INSERT INTO Html_Texts_Fts(Html_Texts_Fts) VALUES ('rebuild');"
+                )
+                logger.info("✅ Đã dựng lại chỉ mục FTS cho Html_Texts.")
+
+            logger.info("--- Bắt đầu xử lý Parallels ---")
+            parallels_config = db_config.get("parallels")
+            if not parallels_config:
+                logger.warning("⚠️  Không tìm thấy cấu hình 'parallels'. Bỏ qua.")
+            else:
+                parallels_data = ParallelsProcessor(parallels_config).process()
+                db_manager.insert_data("Parallels", parallels_data)
+
+            logger.info("--- Bắt đầu xử lý CIPS ---")
+            cips_config = db_config.get("cips")
+            if not cips_config:
+                logger.warning("⚠️  Không tìm thấy cấu hình 'cips'. Bỏ qua.")
+            else:
+                cips_store = PROJECT_ROOT / cips_config["store"]
+                if not cips_store.exists():
+                    logger.warning(
+                        f"⚠️  Không tìm thấy {cips_store}. Hãy chạy post-task "
+                        "'cips-json' trước. Bỏ qua."
+                    )
+                else:
+                    db_manager.copy_tables(cips_store, CIPS_TABLES)
+
+            logger.info("--- Bắt đầu xử lý Segment_Lemmas (DPD) ---")
+            lemma_config = db_config.get("segment-lemmas")
+            if not lemma_config:
+                logger.warning("⚠️  Không tìm thấy cấu hình 'segment-lemmas'. Bỏ qua.")
+            else:
+                lemma_proc = SegmentLemmaProcessor(lemma_config)
+                lemma_data = lemma_proc.load_lemmas()
+                if lemma_data is not None:
+                    db_manager.insert_data("Dpd_Lemmas", lemma_data)
+                    root_segments = db_manager.conn.execute(
+                        "SELECT sc_uid, segment, content FROM Bilara_segments "
+                        "WHERE type = 'root' AND lang = ?",
+                        (lemma_config.get("lang", "pli"),),
+                    )
+                    db_manager.insert_rows(
+                        "Segment_Lemmas",
+                        ["sc_uid", "segment", "position", "form", "lemma_id"],
+                        lemma_proc.iter_segment_lemmas(root_segments),
+                    )
+
     except Exception:
         logger.critical(
             "❌  Chương trình gặp lỗi nghiêm trọng và đã dừng lại.", exc_info=True
@@ -2,7 +2,7 @@
 import logging
 import sqlite3
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +12,7 @@ class DatabaseManager:
     def __init__(self, db_path: Path):
         self.db_path = db_path
         self.conn = None
+        self.attached: List[str] = []
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
     def __enter__(self):
@@ -48,6 +49,7 @@ class DatabaseManager:
                     self.conn.rollback()
                     logger.warning("✅ Rollback thành công.")
             finally:
+                self._detach_all()
 
                 logger.info("Khôi phục cài đặt an toàn cho database...")
                 self.conn.execute("PRAGMA foreign_keys = ON;")
@@ -118,3 +120,66 @@ class DatabaseManager:
         except sqlite3.Error as e:
             logger.error(f"Lỗi khi chèn hàng loạt vào '{table_name}': {e}")
             raise
+
+    def _detach_all(self):
+        while self.attached:
+            alias = self.attached.pop()
+            try:
+                self.conn.execute(f"DETACH DATABASE {alias};")
+            except sqlite3.Error as e:
+                logger.warning(f"Không thể tách database '{alias}': {e}")
+
+    def copy_tables(self, source_path: Path, table_names: Sequence[str]) -> int:
+        if not source_path.exists():
+            logger.error(f"Database nguồn không tồn tại: {source_path}")
+            raise FileNotFoundError(f"Database nguồn không tồn tại: {source_path}")
+
+        alias = f"source_db_{len(self.attached)}"
+        self.conn.execute(f"ATTACH DATABASE ? AS {alias};", (str(source_path),))
+        self.attached.append(alias)
+
+        total = 0
+        try:
+            for name in table_names:
+                columns = [
+                    row[1]
+                    for row in self.conn.execute(f'PRAGMA main.table_info("{name}");')
+                ]
+                column_list = ", ".join(f'"{col}"' for col in columns)
+                cursor = self.conn.execute(
+                    f'INSERT OR REPLACE INTO main."{name}" ({column_list}) '
+                    f'SELECT {column_list} FROM {alias}."{name}";'
+                )
+                logger.info(
+                    f"✅ Đã sao chép {cursor.rowcount} hàng vào '{name}' "
+                    f"từ '{source_path.name}'."
+                )
+                total += cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Lỗi khi sao chép bảng từ '{source_path}': {e}")
+            raise
+        return total
+
+    def insert_rows(
+        self,
+        table_name: str,
+        columns: Sequence[str],
+        batches: Iterable[List[Sequence[Any]]],
+    ) -> int:
+        column_list = ", ".join(columns)
+        placeholders = ", ".join("?" for _ in columns)
+        sql = f'INSERT OR REPLACE INTO "{table_name}" ({column_list}) VALUES ({placeholders});'
+
+        total = 0
+        try:
+            cursor = self.conn.cursor()
+            for batch in batches:
+                if batch:
+                    cursor.executemany(sql, batch)
+                    total += len(batch)
+        except sqlite3.Error as e:
+            logger.error(f"Lỗi khi chèn hàng loạt vào '{table_name}': {e}")
+            raise
+
+        logger.info(f"✅ Đã chèn {total} hàng vào '{table_name}'.")
+        return total
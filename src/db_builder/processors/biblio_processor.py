@@ -1,30 +1,30 @@
 # Path: src/db_builder/processors/biblio_processor.py
-import json
 import logging
 from typing import Any, Dict, List, Tuple
 
 from src.config.constants import PROJECT_ROOT
+from src.shared import FileSystemSource, SourceBackend
 
 logger = logging.getLogger(__name__)
 
 
 class BiblioProcessor:
 
-    def __init__(self, biblio_path: str):
+    def __init__(self, biblio_path: str, source: SourceBackend | None = None):
         self.biblio_path = PROJECT_ROOT / biblio_path
+        self.source = source or FileSystemSource()
 
     def process(self) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
         logger.info(f"Bắt đầu xử lý file bibliography từ: {self.biblio_path}")
         biblio_data: List[Dict[str, Any]] = []
         text_to_uid_map: Dict[str, str] = {}
 
-        if not self.biblio_path.exists():
+        if not self.source.exists(self.biblio_path):
             logger.error(f"Không tìm thấy file bibliography tại: {self.biblio_path}")
             return [], {}
 
         try:
-            with open(self.biblio_path, "r", encoding="utf-8") as f:
-                data_list = json.load(f)
+            data_list = self.source.read_json(self.biblio_path)
 
             for biblio_entry in data_list:
                 if not isinstance(biblio_entry, dict):
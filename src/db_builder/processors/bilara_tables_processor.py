@@ -1,19 +1,26 @@
 # Path: src/db_builder/processors/bilara_tables_processor.py
 
-import json
 import logging
 import re
+import sqlite3
 from pathlib import Path
 from typing import Any, Dict, List
 
 from src.config.constants import PROJECT_ROOT
+from src.shared import (
+    FileSystemSource,
+    JSONDecodeError,
+    SourceBackend,
+    load_manifest,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class BilaraTablesProcessor:
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], source: SourceBackend | None = None):
+        self.source = source or FileSystemSource()
         folder_path = PROJECT_ROOT / config.get("folder", "")
         self.base_path = folder_path.parent
         self.manifest_path = PROJECT_ROOT / config.get("json", "")
@@ -22,9 +29,8 @@ class BilaraTablesProcessor:
     def _parse_raw_data(self) -> List[Dict[str, Any]]:
         raw_data_list = []
         try:
-            with self.manifest_path.open("r", encoding="utf-8") as f:
-                manifest_data = json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
+            manifest_data = load_manifest(self.manifest_path)
+        except (JSONDecodeError, FileNotFoundError, ValueError, sqlite3.Error):
             logger.error(
                 f"Không thể đọc hoặc file manifest không tồn tại: {self.manifest_path}"
             )
@@ -36,7 +42,7 @@ class BilaraTablesProcessor:
 
             for file_uid, relative_path_str in group_dict.items():
                 full_file_path = self.base_path / relative_path_str
-                if not full_file_path.exists():
+                if not self.source.exists(full_file_path):
                     continue
 
                 try:
@@ -54,8 +60,7 @@ class BilaraTablesProcessor:
                         author_alias = self.author_remap.get(author_alias, author_alias)
 
                     sc_uid = full_file_path.stem.split("_")[0]
-                    with full_file_path.open("r", encoding="utf-8") as f:
-                        data = json.load(f)
+                    data = self.source.read_json(full_file_path)
 
                     for composite_uid, content in data.items():
                         segment_num = (
@@ -73,7 +78,7 @@ class BilaraTablesProcessor:
                                 "content": content,
                             }
                         )
-                except (ValueError, IndexError, json.JSONDecodeError) as e:
+                except (ValueError, IndexError, JSONDecodeError) as e:
                     logger.warning(
                         f"Bỏ qua file bị lỗi định dạng {relative_path_str}: {e}"
                     )
@@ -1,11 +1,11 @@
 # Path: src/db_builder/processors/hierarchy_processor.py
-import json
 import logging
 from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, List
 
 from src.config.constants import PROJECT_ROOT
+from src.shared import FileSystemSource, SourceBackend
 
 logger = logging.getLogger(__name__)
 
@@ -17,8 +17,10 @@ class HierarchyProcessor:
         tree_config: List[Dict[str, Any]],
         valid_uids: set,
         uid_to_type_map: Dict[str, str],
+        source: SourceBackend | None = None,
     ):
         self.tree_config = tree_config
+        self.source = source or FileSystemSource()
         self.valid_uids = valid_uids
         self.uid_to_type_map = uid_to_type_map
         self.nodes: List[Dict[str, Any]] = []
@@ -72,8 +74,7 @@ class HierarchyProcessor:
         logger.info("Bắt đầu xử lý các file JSON tree...")
 
         super_tree_path = PROJECT_ROOT / self.tree_config[0]["super-tree"]
-        with open(super_tree_path, "r", encoding="utf-8") as f:
-            super_tree_data = json.load(f)
+        super_tree_data = self.source.read_json(super_tree_path)
         self._learn_super_tree(super_tree_data, parent_uid=None, pitaka_root=None)
         self._apply_canonical_rules()
 
@@ -84,8 +85,14 @@ class HierarchyProcessor:
         for entry in file_entries:
             for _, path_str in entry.items():
                 path = PROJECT_ROOT / path_str
-                if path.is_dir():
-                    all_files.extend(sorted(path.glob("*.json")))
+                if self.source.is_dir(path):
+                    all_files.extend(
+                        sorted(
+                            p
+                            for p in self.source.iter_files(path, ".json")
+                            if p.parent == path
+                        )
+                    )
 
         for file_path in all_files:
             if file_path.name in self.ignore_list:
@@ -151,8 +158,7 @@ class HierarchyProcessor:
 
     def _process_file(self, file_path: Path):
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = self.source.read_json(file_path)
 
         is_super_tree = "super-tree" in file_path.name
         if is_super_tree:
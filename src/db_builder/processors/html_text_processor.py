@@ -0,0 +1,177 @@
+# Path: src/db_builder/processors/html_text_processor.py
+
+import hashlib
+import logging
+import os
+import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from bs4 import BeautifulSoup
+
+from src.config.constants import PROJECT_ROOT
+from src.shared import SourceBackend, open_source
+
+logger = logging.getLogger(__name__)
+
+HTML_TEXT_COLUMNS = [
+    "translation_uid",
+    "paragraph_id",
+    "position",
+    "tag",
+    "html",
+    "content",
+]
+BLOCK_TAGS = [
+    "p",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "blockquote",
+    "li",
+    "dt",
+    "dd",
+    "pre",
+    "td",
+    "th",
+    "caption",
+    "figcaption",
+]
+FILE_CHUNK_SIZE = 50
+WHITESPACE_RE = re.compile(r"\s+")
+
+HtmlTextRow = Tuple[str, str, int, str, str, str]
+
+_SOURCE: Optional[SourceBackend] = None
+
+
+def _init_worker(source_config: Optional[Dict[str, Any]]):
+    global _SOURCE
+    _SOURCE = open_source(source_config)
+
+
+def _paragraph_id(element, text: str, used: Dict[str, int]) -> str:
+    element_id = element.get("id")
+    base_id = (
+        element_id.strip()
+        if isinstance(element_id, str) and element_id.strip()
+        else "h" + hashlib.blake2b(text.encode("utf-8"), digest_size=6).hexdigest()
+    )
+    count = used.get(base_id, 0) + 1
+    used[base_id] = count
+    return base_id if count == 1 else f"{base_id}-{count}"
+
+
+def parse_html_paragraphs(translation_uid: str, html: str) -> List[HtmlTextRow]:
+    soup = BeautifulSoup(html, "html.parser")
+    root = soup.body or soup
+    rows: List[HtmlTextRow] = []
+    used: Dict[str, int] = {}
+    for element in root.find_all(BLOCK_TAGS):
+        if element.find(BLOCK_TAGS) is not None:
+            continue
+        text = WHITESPACE_RE.sub(" ", element.get_text(" ")).strip()
+        if not text:
+            continue
+        rows.append(
+            (
+                translation_uid,
+                _paragraph_id(element, text, used),
+                len(rows),
+                element.name,
+                str(element),
+                text,
+            )
+        )
+    return rows
+
+
+def _parse_chunk(
+    items: Sequence[Tuple[str, Path]],
+) -> Tuple[List[HtmlTextRow], List[str]]:
+    assert _SOURCE is not None
+    rows: List[HtmlTextRow] = []
+    failed: List[str] = []
+    for translation_uid, file_path in items:
+        try:
+            rows.extend(
+                parse_html_paragraphs(translation_uid, _SOURCE.read_text(file_path))
+            )
+        except (OSError, UnicodeDecodeError) as e:
+            failed.append(f"{file_path}: {e}")
+    return rows, failed
+
+
+class HtmlTextProcessor:
+
+    def __init__(
+        self, config: Dict[str, Any], source_config: Optional[Dict[str, Any]] = None
+    ):
+        self.folder = PROJECT_ROOT / config.get("folder", "")
+        self.workers = int(config.get("workers") or os.cpu_count() or 1)
+        self.source_config = source_config
+
+    def resolve_path(self, file_path: str) -> Path:
+        parts = PurePosixPath(file_path).parts
+        return self.folder.joinpath(*parts[1:])
+
+    def collect_files(
+        self, translations_data: List[Dict[str, Any]]
+    ) -> List[Tuple[str, Path]]:
+        return [
+            (
+                translation["translation_uid"],
+                self.resolve_path(translation["file_path"]),
+            )
+            for translation in translations_data
+            if translation.get("translation_uid")
+            and not translation.get("segmented")
+            and str(translation.get("file_path") or "").endswith(".html")
+        ]
+
+    def iter_rows(
+        self, translations_data: List[Dict[str, Any]]
+    ) -> Iterator[List[HtmlTextRow]]:
+        files = self.collect_files(translations_data)
+        chunks = [
+            files[i : i + FILE_CHUNK_SIZE]
+            for i in range(0, len(files), FILE_CHUNK_SIZE)
+        ]
+        logger.info(
+            f"Phân tích {len(files)} file HTML thành đoạn văn ({len(chunks)} phần, "
+            f"{self.workers} tiến trình)..."
+        )
+
+        total_rows = 0
+        failed_files: List[str] = []
+        max_pending = self.workers * 2
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.source_config,),
+        ) as executor:
+            pending: Deque[Future] = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(_parse_chunk, chunk))
+                if len(pending) >= max_pending:
+                    rows, failed = pending.popleft().result()
+                    total_rows += len(rows)
+                    failed_files.extend(failed)
+                    yield rows
+            while pending:
+                rows, failed = pending.popleft().result()
+                total_rows += len(rows)
+                failed_files.extend(failed)
+                yield rows
+
+        for message in failed_files:
+            logger.warning(f"⚠️  Không thể đọc file HTML {message}")
+        logger.info(
+            f"✅ Đã tách {total_rows} đoạn văn từ {len(files) - len(failed_files)} "
+            f"file HTML ({len(failed_files)} file lỗi)."
+        )
@@ -1,9 +1,11 @@
 # Path: src/db_builder/processors/json_path_processor.py
-import json
 import logging
+import sqlite3
 from pathlib import Path
 from typing import Dict, List
 
+from src.shared import JSONDecodeError, load_manifest, manifest_exists
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,14 +18,13 @@ class JsonPathProcessor:
     def execute(self) -> Dict[str, str]:
         logger.info(f"Bắt đầu xử lý file manifest JSON từ: {self.manifest_path.name}")
 
-        if not self.manifest_path.exists():
+        if not manifest_exists(self.manifest_path):
             logger.error(f"Không tìm thấy file manifest: {self.manifest_path}")
             return {}
 
         filepath_map = {}
         try:
-            with open(self.manifest_path, "r", encoding="utf-8") as f:
-                manifest_data = json.load(f)
+            manifest_data = load_manifest(self.manifest_path, folders=self.groups)
 
             for group_name in self.groups:
                 group_dict = manifest_data.get(group_name, {})
@@ -40,9 +41,12 @@ class JsonPathProcessor:
             logger.info(f"✅ Đã tạo map cho {count} file JSON từ file manifest.")
             return filepath_map
 
-        except json.JSONDecodeError:
+        except JSONDecodeError:
             logger.error(f"Lỗi khi giải mã file JSON: {self.manifest_path}")
             return {}
+        except sqlite3.Error as e:
+            logger.error(f"Lỗi khi đọc manifest store {self.manifest_path}: {e}")
+            return {}
         except Exception as e:
             logger.error(f"Đã xảy ra lỗi không mong muốn: {e}")
             return {}
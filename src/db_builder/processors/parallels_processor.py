@@ -0,0 +1,57 @@
+# Path: src/db_builder/processors/parallels_processor.py
+import logging
+from typing import Any, Dict, List, Tuple
+
+from src.config.constants import PROJECT_ROOT
+from src.shared import JSONDecodeError, artifact_exists, read_json
+
+logger = logging.getLogger(__name__)
+
+
+def split_parallel_id(full_id: str) -> Tuple[str, str]:
+    uid, _, segment = full_id.lstrip("~").partition("#")
+    return uid, segment
+
+
+class ParallelsProcessor:
+
+    def __init__(self, config: Dict[str, Any]):
+        self.flat_path = PROJECT_ROOT / config.get("path", "")
+
+    def process(self) -> List[Dict[str, Any]]:
+        logger.info(f"Bắt đầu xử lý parallels từ: {self.flat_path}")
+        if not artifact_exists(self.flat_path):
+            logger.error(f"Không tìm thấy file parallels: {self.flat_path}")
+            return []
+
+        try:
+            flat_map = read_json(self.flat_path)
+        except JSONDecodeError as e:
+            logger.error(f"Lỗi khi giải mã file {self.flat_path.name}: {e}")
+            return []
+
+        rows: Dict[Tuple[str, str, str, str, str], Dict[str, Any]] = {}
+        for source_id, relations in flat_map.items():
+            source_uid, source_segment = split_parallel_id(source_id)
+            for relation, targets in relations.items():
+                for target_id in targets:
+                    target_uid, target_segment = split_parallel_id(target_id)
+                    key = (
+                        source_uid,
+                        source_segment,
+                        relation,
+                        target_uid,
+                        target_segment,
+                    )
+                    rows[key] = {
+                        "source_uid": source_uid,
+                        "source_segment": source_segment,
+                        "relation": relation,
+                        "target_uid": target_uid,
+                        "target_segment": target_segment,
+                    }
+
+        logger.info(
+            f"✅ Đã tạo {len(rows)} cạnh parallels từ {len(flat_map)} tham chiếu nguồn."
+        )
+        return list(rows.values())
@@ -0,0 +1,109 @@
+# Path: src/db_builder/processors/segment_lemma_processor.py
+
+import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from src.config.constants import PROJECT_ROOT
+from src.shared import artifact_exists, read_json, tokenize_pali
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_CHUNK_SIZE = 5000
+
+_FORM_MAP: Dict[str, List[int]] = {}
+
+
+def _load_index(forms_path: Path) -> Dict[str, Any]:
+    return read_json(forms_path)
+
+
+def _init_worker(forms_path: Path):
+    global _FORM_MAP
+    _FORM_MAP = _load_index(forms_path)["forms"]
+
+
+def _resolve_chunk(
+    segments: Sequence[Tuple[str, str, str]],
+) -> Tuple[List[Tuple[str, str, int, str, int]], int]:
+    rows = []
+    unresolved = 0
+    for sc_uid, segment, content in segments:
+        for position, form in tokenize_pali(content):
+            lemma_ids = _FORM_MAP.get(form)
+            if not lemma_ids:
+                unresolved += 1
+                continue
+            for lemma_id in lemma_ids:
+                rows.append((sc_uid, segment, position, form, lemma_id))
+    return rows, unresolved
+
+
+class SegmentLemmaProcessor:
+
+    def __init__(self, config: Dict[str, Any]):
+        self.forms_path = PROJECT_ROOT / config.get("forms", "")
+        self.workers = int(config.get("workers") or os.cpu_count() or 1)
+
+    def load_lemmas(self) -> Optional[List[Dict[str, Any]]]:
+        if not artifact_exists(self.forms_path):
+            logger.error(f"Không tìm thấy file dạng từ → lemma: {self.forms_path}")
+            return None
+        lemmas = _load_index(self.forms_path).get("lemmas", {})
+        return [
+            {"lemma_id": int(lemma_id), "lemma": lemma, "lemma_clean": lemma_clean}
+            for lemma_id, (lemma, lemma_clean) in lemmas.items()
+        ]
+
+    def iter_segment_lemmas(
+        self, segments: Iterable[Tuple[str, str, str]]
+    ) -> Iterator[List[Tuple[str, str, int, str, int]]]:
+        logger.info(
+            f"Tách từ các segment gốc theo phần {SEGMENT_CHUNK_SIZE} segment "
+            f"với {self.workers} tiến trình..."
+        )
+
+        segment_iter = iter(segments)
+        chunks = iter(lambda: list(islice(segment_iter, SEGMENT_CHUNK_SIZE)), [])
+        total_segments = 0
+        total_rows = 0
+        total_unresolved = 0
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.forms_path,),
+        ) as executor:
+            pending: Deque[Future] = deque()
+            for chunk in chunks:
+                total_segments += len(chunk)
+                pending.append(executor.submit(_resolve_chunk, chunk))
+                if len(pending) < self.workers * 2:
+                    continue
+                rows, unresolved = pending.popleft().result()
+                total_rows += len(rows)
+                total_unresolved += unresolved
+                yield rows
+            while pending:
+                rows, unresolved = pending.popleft().result()
+                total_rows += len(rows)
+                total_unresolved += unresolved
+                yield rows
+
+        logger.info(
+            f"✅ Đã tạo {total_rows} liên kết segment → lemma từ {total_segments} segment "
+            f"({total_unresolved} từ không tìm thấy trong DPD)."
+        )
@@ -1,10 +1,11 @@
 # Path: src/db_builder/processors/suttaplex_extractor.py
-import json
 import logging
 import re
 from pathlib import Path
 from typing import Any, Dict, List
 
+from src.shared import artifact_exists, read_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -87,12 +88,11 @@ class SuttaplexExtractor:
     def execute(self):
         logger.info(f"Bắt đầu trích xuất dữ liệu từ file: {self.suttaplex_file}")
 
-        if not self.suttaplex_file.exists():
+        if not artifact_exists(self.suttaplex_file):
             logger.error(f"Không tìm thấy file suttaplex tại: {self.suttaplex_file}")
             return self
 
-        with open(self.suttaplex_file, "r", encoding="utf-8") as f:
-            suttaplex_dict = json.load(f)
+        suttaplex_dict = read_json(self.suttaplex_file)
 
         for uid, card in suttaplex_dict.items():
             if not isinstance(card, dict):
@@ -3,6 +3,7 @@ import logging
 from typing import Any, Dict, List, Tuple
 
 from src.config.constants import PROJECT_ROOT
+from src.shared import TranslationIdResolver, artifact_exists, manifest_exists
 
 from .blurb_processor import BlurbSupplementProcessor
 from .html_processor import HtmlFileProcessor
@@ -22,6 +23,7 @@ class SuttaplexProcessor:
 
     def _parse_config_paths(self):
         json_config, html_manifest_path, blurb_paths = {}, None, []
+        html_report_path = None
 
         item = self.suttaplex_config
 
@@ -34,7 +36,7 @@ class SuttaplexProcessor:
                 js_config = tf_config["json_segment"]
                 manifest_path = PROJECT_ROOT / js_config.get("path", "")
                 groups = js_config.get("groups", [])
-                if manifest_path.exists() and groups:
+                if manifest_exists(manifest_path) and groups:
                     json_config = {"path": manifest_path, "groups": groups}
                 else:
                     logger.warning("Cấu hình 'json_segment' không hợp lệ.")
@@ -43,21 +45,26 @@ class SuttaplexProcessor:
                 path_str = tf_config["html_text"].get("path")
                 if path_str:
                     path_obj = PROJECT_ROOT / path_str
-                    if path_obj.exists():
+                    if artifact_exists(path_obj):
                         html_manifest_path = path_obj
                     else:
                         logger.warning(f"File manifest HTML không tồn tại: {path_obj}")
+                report_str = tf_config["html_text"].get("unmatched_report")
+                if report_str:
+                    html_report_path = PROJECT_ROOT / report_str
 
         if "blurb_supplement" in item:
             blurb_paths.extend([PROJECT_ROOT / p for p in item["blurb_supplement"]])
 
-        return json_config, html_manifest_path, blurb_paths
+        return json_config, html_manifest_path, html_report_path, blurb_paths
 
     def process(self) -> Tuple[List[Dict[str, Any]], ...]:
 
         extractor = SuttaplexExtractor(self.suttaplex_file, self.biblio_map).execute()
 
-        json_config, html_manifest_path, blurb_paths = self._parse_config_paths()
+        json_config, html_manifest_path, html_report_path, blurb_paths = (
+            self._parse_config_paths()
+        )
 
         blurb_processor = BlurbSupplementProcessor(blurb_paths)
         suttaplex_data = blurb_processor.execute(extractor.suttaplex_data)
@@ -70,11 +77,11 @@ class SuttaplexProcessor:
             filepath_map = json_processor.execute()
 
         if html_manifest_path:
-            known_uids = {
-                item["translation_uid"] for item in extractor.translations_data
-            }
+            resolver = TranslationIdResolver(
+                extractor.translations_data, extractor.authors_map
+            )
             html_processor = HtmlFileProcessor(
-                html_manifest_path, extractor.authors_map, known_uids
+                html_manifest_path, resolver, html_report_path
             )
             html_filepath_map = html_processor.execute()
             filepath_map.update(html_filepath_map)
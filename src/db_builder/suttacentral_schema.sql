@@ -119,6 +119,71 @@ ON Bilara_segments (type, lang, sc_uid, segment, author_alias);
 CREATE INDEX IF NOT EXISTS idx_bilara_segments_sc_uid 
 ON Bilara_segments (sc_uid, segment);
 
+-- 5. Bảng lemma DPD và liên kết segment gốc (pli) → lemma
+CREATE TABLE IF NOT EXISTS "Dpd_Lemmas" (
+    "lemma_id" INTEGER PRIMARY KEY,
+    "lemma" TEXT NOT NULL,
+    "lemma_clean" TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_dpd_lemmas_clean
+ON Dpd_Lemmas (lemma_clean);
+
+CREATE TABLE IF NOT EXISTS "Segment_Lemmas" (
+    "sc_uid" TEXT NOT NULL,
+    "segment" TEXT NOT NULL,
+    "position" INTEGER NOT NULL,
+    "form" TEXT NOT NULL,
+    "lemma_id" INTEGER NOT NULL,
+    PRIMARY KEY ("sc_uid", "segment", "position", "lemma_id")
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_segment_lemmas_lemma
+ON Segment_Lemmas (lemma_id, sc_uid, segment);
+
+-- 6. Bảng cạnh Parallels (mỗi chiều một dòng, segment rỗng khi tham chiếu cả bài)
+CREATE TABLE IF NOT EXISTS "Parallels" (
+    "source_uid" TEXT NOT NULL,
+    "source_segment" TEXT NOT NULL DEFAULT '',
+    "relation" TEXT NOT NULL,
+    "target_uid" TEXT NOT NULL,
+    "target_segment" TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (
+        "source_uid", "source_segment", "relation", "target_uid", "target_segment"
+    )
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_parallels_target
+ON Parallels (target_uid, target_segment, relation, source_uid, source_segment);
+
+CREATE INDEX IF NOT EXISTS idx_parallels_relation
+ON Parallels (relation, source_uid, target_uid);
+
+-- 7-9. Các bảng CIPS được định nghĩa trong src/shared/cips_schema.sql
+
+-- 10. Bảng đoạn văn của các bản dịch html_text (không phân đoạn Bilara)
+CREATE TABLE IF NOT EXISTS "Html_Texts" (
+    "translation_uid" TEXT NOT NULL,
+    "paragraph_id" TEXT NOT NULL,
+    "position" INTEGER NOT NULL,
+    "tag" TEXT NOT NULL,
+    "html" TEXT NOT NULL,
+    "content" TEXT NOT NULL,
+    PRIMARY KEY ("translation_uid", "paragraph_id"),
+    FOREIGN KEY ("translation_uid") REFERENCES "Translations" ("translation_uid")
+);
+
+CREATE INDEX IF NOT EXISTS idx_html_texts_order
+ON Html_Texts (translation_uid, position);
+
+-- Bảng FTS5 external-content cho Html_Texts (rebuild sau khi chèn dữ liệu)
+CREATE VIRTUAL TABLE IF NOT EXISTS "Html_Texts_Fts" USING fts5(
+    content,
+    content='Html_Texts',
+    content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
 -- 1. VIEW cho type = 'html'
 DROP VIEW IF EXISTS V_HtmlSegments;
 CREATE VIEW V_HtmlSegments AS
@@ -0,0 +1,244 @@
+# Path: src/db_updater/handlers/archive_utils.py
+import logging
+import os
+import shutil
+import subprocess
+import tarfile
+import threading
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, List, Optional, Set, Tuple
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "STREAMABLE_SUFFIXES",
+    "extract_tar_stream",
+    "extract_zip_incremental",
+    "find_parallel_decompressor",
+    "get_tar_compression",
+    "is_safe_member_name",
+    "safe_extract_tar",
+    "safe_extract_zip",
+]
+
+PIPE_CHUNK_SIZE = 1024 * 1024
+
+TAR_COMPRESSION_BY_SUFFIX = {
+    ".tar.bz2": "bz2",
+    ".tbz2": "bz2",
+    ".tar.gz": "gz",
+    ".tgz": "gz",
+    ".tar": "",
+}
+STREAMABLE_SUFFIXES = tuple(TAR_COMPRESSION_BY_SUFFIX)
+
+PARALLEL_DECOMPRESSORS = {
+    "bz2": [["lbzip2", "-d", "-c"], ["pbzip2", "-d", "-c"]],
+    "gz": [["pigz", "-d", "-c"]],
+}
+
+
+def get_tar_compression(asset_name: str) -> Optional[str]:
+    for suffix, compression in TAR_COMPRESSION_BY_SUFFIX.items():
+        if asset_name.endswith(suffix):
+            return compression
+    return None
+
+
+def find_parallel_decompressor(compression: str) -> Optional[List[str]]:
+    for command in PARALLEL_DECOMPRESSORS.get(compression, []):
+        if shutil.which(command[0]):
+            return command
+    return None
+
+
+def is_safe_member_name(name: str) -> bool:
+    if not name or "\0" in name:
+        return False
+    path = PurePosixPath(name.replace("\\", "/"))
+    if path.is_absolute() or (path.parts and ":" in path.parts[0]):
+        return False
+    return ".." not in path.parts
+
+
+def _is_safe_tar_member(member: tarfile.TarInfo) -> bool:
+    if not is_safe_member_name(member.name):
+        return False
+    if member.isdev() or member.isfifo():
+        return False
+    if member.issym() or member.islnk():
+        link_base = (
+            PurePosixPath(member.name).parent if member.issym() else PurePosixPath()
+        )
+        return is_safe_member_name(str(link_base / member.linkname))
+    return True
+
+
+def _extract_member(tar: tarfile.TarFile, member: tarfile.TarInfo, extract_dir: Path):
+    if hasattr(tarfile, "data_filter"):
+        tar.extract(member, path=extract_dir, filter="data")
+    else:
+        tar.extract(member, path=extract_dir)
+
+
+def _extract_members(tar: tarfile.TarFile, extract_dir: Path) -> Set[str]:
+    top_names: Set[str] = set()
+    for member in tar:
+        if not _is_safe_tar_member(member):
+            log.warning(f"⚠️  Bỏ qua member không an toàn trong archive: {member.name}")
+            continue
+        _extract_member(tar, member, extract_dir)
+        top_names.add(PurePosixPath(member.name).parts[0])
+    return top_names
+
+
+def safe_extract_tar(archive_path: Path, mode: str, extract_dir: Path) -> List[Path]:
+    with tarfile.open(archive_path, mode) as tar:
+        top_names = _extract_members(tar, extract_dir)
+    return [extract_dir / name for name in sorted(top_names)]
+
+
+def safe_extract_zip(zip_ref, extract_dir: Path) -> List[Path]:
+    top_names: Set[str] = set()
+    for info in zip_ref.infolist():
+        if not is_safe_member_name(info.filename):
+            log.warning(f"⚠️  Bỏ qua member không an toàn trong zip: {info.filename}")
+            continue
+        zip_ref.extract(info, extract_dir)
+        top_names.add(PurePosixPath(info.filename).parts[0])
+    return [extract_dir / name for name in sorted(top_names)]
+
+
+def _file_crc32(path: Path) -> int:
+    crc = 0
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(PIPE_CHUNK_SIZE), b""):
+            crc = zlib.crc32(block, crc)
+    return crc
+
+
+def _is_member_current(info: zipfile.ZipInfo, target: Path) -> bool:
+    if not target.is_file():
+        return False
+    if target.stat().st_size != info.file_size:
+        return False
+    return _file_crc32(target) == info.CRC
+
+
+def _extract_zip_member(
+    zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, extract_dir: Path
+) -> bool:
+    target = extract_dir / info.filename
+    if _is_member_current(info, target):
+        return False
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = target.with_name(f".{target.name}.{threading.get_ident()}.tmp")
+    try:
+        with zip_ref.open(info) as src, open(temp_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, PIPE_CHUNK_SIZE)
+        os.replace(temp_path, target)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+    return True
+
+
+def extract_zip_incremental(
+    zip_path: Path, extract_dir: Path, workers: int = 4
+) -> Tuple[int, int]:
+    extract_dir.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        members = []
+        for info in zip_ref.infolist():
+            if not is_safe_member_name(info.filename):
+                log.warning(
+                    f"⚠️  Bỏ qua member không an toàn trong zip: {info.filename}"
+                )
+                continue
+            if info.is_dir():
+                (extract_dir / info.filename).mkdir(parents=True, exist_ok=True)
+                continue
+            members.append(info)
+
+    local = threading.local()
+    opened: List[zipfile.ZipFile] = []
+    opened_lock = threading.Lock()
+
+    def worker(info: zipfile.ZipInfo) -> bool:
+        if not hasattr(local, "zip_ref"):
+            local.zip_ref = zipfile.ZipFile(zip_path, "r")
+            with opened_lock:
+                opened.append(local.zip_ref)
+        return _extract_zip_member(local.zip_ref, info, extract_dir)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            results = list(executor.map(worker, members))
+    finally:
+        for zip_ref in opened:
+            zip_ref.close()
+
+    extracted = sum(results)
+    return extracted, len(results) - extracted
+
+
+def _pump(source: BinaryIO, sink: BinaryIO, errors: List[BaseException]):
+    try:
+        for block in iter(lambda: source.read(PIPE_CHUNK_SIZE), b""):
+            sink.write(block)
+    except BaseException as e:
+        errors.append(e)
+    finally:
+        try:
+            sink.close()
+        except OSError:
+            pass
+
+
+def _drain(source: BinaryIO):
+    for _ in iter(lambda: source.read(PIPE_CHUNK_SIZE), b""):
+        pass
+
+
+def extract_tar_stream(
+    source: BinaryIO, compression: str, extract_dir: Path
+) -> List[Path]:
+    extract_dir.mkdir(parents=True, exist_ok=True)
+    command = find_parallel_decompressor(compression) if compression else None
+
+    if not command:
+        log.info(
+            f"Giải nén streaming (tar{'.' + compression if compression else ''}) "
+            "bằng thư viện chuẩn (đơn luồng)."
+        )
+        with tarfile.open(fileobj=source, mode=f"r|{compression}") as tar:
+            top_names = _extract_members(tar, extract_dir)
+        _drain(source)
+        return [extract_dir / name for name in sorted(top_names)]
+
+    log.info(f"Giải nén streaming đa luồng bằng '{command[0]}'.")
+    process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    assert process.stdin is not None and process.stdout is not None
+    pump_errors: List[BaseException] = []
+    pump_thread = threading.Thread(
+        target=_pump, args=(source, process.stdin, pump_errors), daemon=True
+    )
+    pump_thread.start()
+    try:
+        with tarfile.open(fileobj=process.stdout, mode="r|") as tar:
+            top_names = _extract_members(tar, extract_dir)
+        _drain(process.stdout)
+    finally:
+        process.stdout.close()
+        pump_thread.join()
+        return_code = process.wait()
+
+    if pump_errors:
+        raise pump_errors[0]
+    if return_code != 0:
+        raise RuntimeError(f"'{command[0]}' kết thúc với mã lỗi {return_code}.")
+    return [extract_dir / name for name in sorted(top_names)]
@@ -0,0 +1,304 @@
+# Path: src/db_updater/handlers/download_utils.py
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+import requests
+from tqdm import tqdm
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "DownloadVerificationError",
+    "VerifyingStream",
+    "download_resumable",
+    "get_part_meta_path",
+    "get_part_path",
+    "iter_adaptive_chunks",
+    "parse_digest",
+]
+
+PART_SUFFIX = ".part"
+PART_META_SUFFIX = ".part.json"
+DOWNLOAD_TIMEOUT = 60
+MIN_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 4 * 1024 * 1024
+FAST_READ_SECONDS = 0.05
+SLOW_READ_SECONDS = 1.0
+
+
+class DownloadVerificationError(RuntimeError):
+    pass
+
+
+def get_part_path(dest_path: Path) -> Path:
+    return dest_path.with_name(dest_path.name + PART_SUFFIX)
+
+
+def get_part_meta_path(dest_path: Path) -> Path:
+    return dest_path.with_name(dest_path.name + PART_META_SUFFIX)
+
+
+def _read_part_meta(meta_path: Path) -> Optional[Dict[str, Optional[str]]]:
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    return meta if isinstance(meta, dict) else None
+
+
+def _write_part_meta(
+    meta_path: Path, source_id: Optional[str], response: requests.Response
+):
+    meta = {
+        "source": source_id,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+
+
+def _discard_part(part_path: Path, meta_path: Path):
+    part_path.unlink(missing_ok=True)
+    meta_path.unlink(missing_ok=True)
+
+
+def _range_validator(meta: Dict[str, Optional[str]]) -> Optional[str]:
+    etag = meta.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return meta.get("last_modified")
+
+
+def _unsatisfied_range_total(response: requests.Response) -> Optional[int]:
+    content_range = response.headers.get("Content-Range", "")
+    _, _, total = content_range.rpartition("/")
+    return int(total) if total.isdigit() else None
+
+
+def parse_digest(digest: Optional[str]) -> Optional[Tuple[str, str]]:
+    if not digest or ":" not in digest:
+        return None
+    algorithm, value = digest.split(":", 1)
+    algorithm = algorithm.strip().lower()
+    if algorithm not in hashlib.algorithms_available:
+        log.warning(f"Thuật toán checksum không được hỗ trợ: {algorithm}")
+        return None
+    return algorithm, value.strip().lower()
+
+
+def iter_adaptive_chunks(response: requests.Response) -> Iterator[bytes]:
+    chunk_size = MIN_CHUNK_SIZE
+    while True:
+        start_time = time.perf_counter()
+        chunk = response.raw.read(chunk_size, decode_content=True)
+        if not chunk:
+            break
+        yield chunk
+
+        elapsed = time.perf_counter() - start_time
+        if len(chunk) == chunk_size and elapsed < FAST_READ_SECONDS:
+            chunk_size = min(chunk_size * 2, MAX_CHUNK_SIZE)
+        elif elapsed > SLOW_READ_SECONDS:
+            chunk_size = max(chunk_size // 2, MIN_CHUNK_SIZE)
+
+
+def _hash_existing(path: Path, hasher) -> None:
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(MAX_CHUNK_SIZE), b""):
+            hasher.update(block)
+
+
+def _verify(
+    part_path: Path,
+    meta_path: Path,
+    expected_size: Optional[int],
+    expected_digest: Optional[Tuple[str, str]],
+    hasher,
+):
+    actual_size = part_path.stat().st_size
+    if expected_size is not None and actual_size != expected_size:
+        _discard_part(part_path, meta_path)
+        raise DownloadVerificationError(
+            f"Kích thước không khớp cho {part_path.name}: "
+            f"{actual_size} != {expected_size} (mong đợi)."
+        )
+    if expected_digest and hasher is not None:
+        actual = hasher.hexdigest()
+        if actual != expected_digest[1]:
+            _discard_part(part_path, meta_path)
+            raise DownloadVerificationError(
+                f"Checksum {expected_digest[0]} không khớp cho {part_path.name}: "
+                f"{actual} != {expected_digest[1]} (mong đợi)."
+            )
+
+
+def download_resumable(
+    url: str,
+    dest_path: Path,
+    headers: Optional[Dict[str, str]] = None,
+    expected_size: Optional[int] = None,
+    expected_digest: Optional[str] = None,
+    source_id: Optional[str] = None,
+) -> Path:
+    part_path = get_part_path(dest_path)
+    meta_path = get_part_meta_path(dest_path)
+    digest = parse_digest(expected_digest)
+    hasher = hashlib.new(digest[0]) if digest else None
+
+    offset = part_path.stat().st_size if part_path.exists() else 0
+    meta = _read_part_meta(meta_path) if offset else None
+    if offset and (meta is None or meta.get("source") != source_id):
+        log.warning(
+            f"File tạm {part_path.name} không thuộc nguồn hiện tại "
+            f"({meta.get('source') if meta else 'không rõ'} != {source_id}). "
+            "Tải lại từ đầu."
+        )
+        _discard_part(part_path, meta_path)
+        offset = 0
+    if expected_size is not None and offset > expected_size:
+        log.warning(f"File tạm {part_path.name} lớn hơn mong đợi. Tải lại từ đầu.")
+        _discard_part(part_path, meta_path)
+        offset = 0
+
+    if offset and hasher is not None:
+        _hash_existing(part_path, hasher)
+
+    if expected_size is not None and offset == expected_size:
+        log.info(f"File tạm {part_path.name} đã đủ dung lượng. Bỏ qua bước tải.")
+    else:
+        while True:
+            request_headers = dict(headers or {})
+            if offset:
+                request_headers["Range"] = f"bytes={offset}-"
+                validator = _range_validator(meta or {})
+                if validator:
+                    request_headers["If-Range"] = validator
+                log.info(f"Tiếp tục tải {dest_path.name} từ byte {offset}: {url}")
+            else:
+                log.info(f"Đang tải về: {url} -> {dest_path.name}")
+
+            with requests.get(
+                url, stream=True, headers=request_headers, timeout=DOWNLOAD_TIMEOUT
+            ) as r:
+                if offset and r.status_code == 416:
+                    total = _unsatisfied_range_total(r)
+                    if total is None or total == offset:
+                        log.info(
+                            f"File tạm {part_path.name} đã đủ dung lượng "
+                            "(máy chủ trả về 416). Chuyển sang bước xác minh."
+                        )
+                        break
+                    log.warning(
+                        f"File tạm {part_path.name} ({offset} byte) không khớp "
+                        f"kích thước trên máy chủ ({total} byte). Tải lại từ đầu."
+                    )
+                    _discard_part(part_path, meta_path)
+                    offset = 0
+                    hasher = hashlib.new(digest[0]) if digest else None
+                    continue
+                if offset and r.status_code == 200:
+                    log.warning(
+                        f"Máy chủ không tiếp tục được {dest_path.name} "
+                        "(không hỗ trợ Range hoặc nội dung đã đổi). Tải lại từ đầu."
+                    )
+                    offset = 0
+                    hasher = hashlib.new(digest[0]) if digest else None
+                r.raise_for_status()
+                if not offset:
+                    _write_part_meta(meta_path, source_id, r)
+
+                remaining = int(r.headers.get("content-length", 0))
+                with (
+                    open(part_path, "ab" if offset else "wb") as f,
+                    tqdm(
+                        total=offset + remaining,
+                        initial=offset,
+                        unit="iB",
+                        unit_scale=True,
+                        desc=dest_path.name,
+                    ) as bar,
+                ):
+                    for chunk in iter_adaptive_chunks(r):
+                        f.write(chunk)
+                        if hasher is not None:
+                            hasher.update(chunk)
+                        bar.update(len(chunk))
+            break
+
+    _verify(part_path, meta_path, expected_size, digest, hasher)
+    os.replace(part_path, dest_path)
+    meta_path.unlink(missing_ok=True)
+    if digest:
+        log.info(f"✅ Đã xác minh {digest[0]} cho {dest_path.name}.")
+    return dest_path
+
+
+class VerifyingStream:
+
+    def __init__(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        expected_size: Optional[int] = None,
+        expected_digest: Optional[str] = None,
+        desc: Optional[str] = None,
+    ):
+        self.url = url
+        self.headers = headers
+        self.expected_size = expected_size
+        self.digest = parse_digest(expected_digest)
+        self.hasher = hashlib.new(self.digest[0]) if self.digest else None
+        self.desc = desc
+        self.bytes_read = 0
+        self._response: Optional[requests.Response] = None
+        self._bar: Optional[tqdm] = None
+
+    def __enter__(self) -> "VerifyingStream":
+        log.info(f"Đang tải streaming: {self.url}")
+        self._response = requests.get(
+            self.url, stream=True, headers=self.headers, timeout=DOWNLOAD_TIMEOUT
+        )
+        self._response.raise_for_status()
+        total = int(self._response.headers.get("content-length", 0))
+        self._bar = tqdm(total=total, unit="iB", unit_scale=True, desc=self.desc)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._bar is not None:
+            self._bar.close()
+        if self._response is not None:
+            self._response.close()
+
+    def read(self, size: int = -1) -> bytes:
+        assert self._response is not None
+        if size is None or size < 0:
+            return b"".join(iter(lambda: self.read(MAX_CHUNK_SIZE), b""))
+        chunk = self._response.raw.read(size, decode_content=True)
+        if chunk:
+            self.bytes_read += len(chunk)
+            if self.hasher is not None:
+                self.hasher.update(chunk)
+            if self._bar is not None:
+                self._bar.update(len(chunk))
+        return chunk
+
+    def verify(self):
+        if self.expected_size is not None and self.bytes_read != self.expected_size:
+            raise DownloadVerificationError(
+                f"Kích thước stream không khớp cho {self.desc}: "
+                f"{self.bytes_read} != {self.expected_size} (mong đợi)."
+            )
+        if self.digest and self.hasher is not None:
+            actual = self.hasher.hexdigest()
+            if actual != self.digest[1]:
+                raise DownloadVerificationError(
+                    f"Checksum {self.digest[0]} không khớp cho {self.desc}: "
+                    f"{actual} != {self.digest[1]} (mong đợi)."
+                )
@@ -4,17 +4,21 @@ import logging
 import os
 import re
 from pathlib import Path
-from zipfile import ZipFile, is_zipfile
+from zipfile import is_zipfile
 
-import gdown
+import requests
 from dotenv import load_dotenv
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from src.db_updater.handlers import archive_utils, download_utils
 from src.db_updater.handlers.base_handler import BaseHandler
 
 log = logging.getLogger(__name__)
 
+DRIVE_DOWNLOAD_URL = "https://www.googleapis.com/drive/v3/files/{file_id}?alt=media"
+DEFAULT_EXTRACT_WORKERS = 4
+
 
 class GDriveHandler(BaseHandler):
 
@@ -22,6 +26,10 @@ class GDriveHandler(BaseHandler):
         super().__init__(handler_config, destination_dir)
         load_dotenv()
         self.api_key = os.getenv("GOOGLE_API_KEY")
+        self.download_url = handler_config.get("download_url", DRIVE_DOWNLOAD_URL)
+        self.extract_workers = int(
+            handler_config.get("extract_workers", DEFAULT_EXTRACT_WORKERS)
+        )
 
     def _get_folder_id_from_url(self, url: str) -> str | None:
         match = re.search(r"/folders/([a-zA-Z0-9_-]+)", url)
@@ -52,6 +60,24 @@ class GDriveHandler(BaseHandler):
             json.dump(version_data, f, indent=2)
         log.info(f"Đã cập nhật file version.json với phiên bản {version}.")
 
+    def _download_zip(self, file_info: dict, zip_path: Path):
+        size = file_info.get("size")
+        md5 = file_info.get("md5Checksum")
+        if not md5:
+            log.warning(
+                f"Drive API không trả về md5Checksum cho {zip_path.name}. "
+                "Chỉ kiểm tra kích thước."
+            )
+        url = self.download_url.format(file_id=file_info["id"])
+        download_utils.download_resumable(
+            url,
+            zip_path,
+            headers={"X-Goog-Api-Key": self.api_key} if self.api_key else None,
+            expected_size=int(size) if size is not None else None,
+            expected_digest=f"md5:{md5}" if md5 else None,
+            source_id=f"{file_info['id']}/{md5 or size}",
+        )
+
     def execute(self):
         if not self.api_key:
             log.error(
@@ -68,7 +94,11 @@ class GDriveHandler(BaseHandler):
         try:
             service = build("drive", "v3", developerKey=self.api_key)
             query = f"'{folder_id}' in parents and trashed = false"
-            results = service.files().list(q=query, fields="files(id, name)").execute()
+            results = (
+                service.files()
+                .list(q=query, fields="files(id, name, size, md5Checksum)")
+                .execute()
+            )
             files = results.get("files", [])
             if not files:
                 log.warning(
@@ -122,25 +152,35 @@ class GDriveHandler(BaseHandler):
             )
             return
 
-        self.destination_dir.mkdir(parents=True, exist_ok=True)
-        zip_path = self.destination_dir / file_name
-        log.info(f"Đang tải file mới: {file_name}...")
-        gdown.download(id=latest_file["id"], output=str(zip_path), quiet=False)
-
         extract_dir_name = self.handler_config.get("extract")
 
         if not isinstance(extract_dir_name, str):
             log.error(
                 "Thiếu cấu hình 'extract' (string) trong updater_config.yaml. Dừng."
             )
-            zip_path.unlink()
+            return
+
+        self.destination_dir.mkdir(parents=True, exist_ok=True)
+        zip_path = self.destination_dir / file_name
+        log.info(f"Đang tải file mới: {file_name}...")
+        try:
+            self._download_zip(latest_file, zip_path)
+        except download_utils.DownloadVerificationError as e:
+            log.error(f"File tải về không khớp với Drive API: {e}")
+            return
+        except requests.exceptions.RequestException as e:
+            log.error(f"Tải file thất bại (có thể tiếp tục ở lần chạy sau): {e}")
             return
 
         extract_path = self.destination_dir / extract_dir_name
-        log.info(f"Đang giải nén vào: {extract_path}...")
+        log.info(f"Đang giải nén vào: {extract_path} ({self.extract_workers} luồng)...")
         if is_zipfile(zip_path):
-            with ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(extract_path)
+            extracted, skipped = archive_utils.extract_zip_incremental(
+                zip_path, extract_path, workers=self.extract_workers
+            )
+            log.info(
+                f"Đã giải nén {extracted} file, bỏ qua {skipped} file không thay đổi."
+            )
         else:
             log.error("File tải về không phải là file zip hợp lệ.")
             zip_path.unlink()
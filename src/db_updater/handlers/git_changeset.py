@@ -0,0 +1,113 @@
+# Path: src/db_updater/handlers/git_changeset.py
+import logging
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from src.config import constants
+from src.shared import JSONDecodeError, decode_json, encode_json
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "EMPTY_TREE_SHA",
+    "SubmoduleChangeset",
+    "get_changeset_path",
+    "load_changeset",
+    "parse_name_status",
+    "write_changeset",
+]
+
+EMPTY_TREE_SHA = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"
+
+
+@dataclass
+class SubmoduleChangeset:
+    name: str
+    old_sha: Optional[str]
+    new_sha: Optional[str]
+    added: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    renamed: List[Dict[str, str]] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.modified or self.deleted or self.renamed)
+
+    def changed_paths(self) -> Set[str]:
+        paths = set(self.added) | set(self.modified)
+        paths.update(item["to"] for item in self.renamed)
+        return paths
+
+    def removed_paths(self) -> Set[str]:
+        paths = set(self.deleted)
+        paths.update(item["from"] for item in self.renamed)
+        return paths
+
+
+def parse_name_status(
+    output: str, name: str, old_sha: Optional[str], new_sha: Optional[str]
+) -> SubmoduleChangeset:
+    changeset = SubmoduleChangeset(name=name, old_sha=old_sha, new_sha=new_sha)
+    fields = [f for f in output.split("\0") if f]
+
+    i = 0
+    while i < len(fields):
+        status = fields[i].strip()
+        code = status[:1]
+
+        if code in ("R", "C"):
+            if i + 2 >= len(fields):
+                log.warning(f"Dòng diff không đầy đủ cho trạng thái '{status}'.")
+                break
+            source, target = fields[i + 1], fields[i + 2]
+            if code == "R":
+                changeset.renamed.append({"from": source, "to": target})
+            else:
+                changeset.added.append(target)
+            i += 3
+            continue
+
+        if i + 1 >= len(fields):
+            log.warning(f"Dòng diff không đầy đủ cho trạng thái '{status}'.")
+            break
+        path = fields[i + 1]
+        if code == "A":
+            changeset.added.append(path)
+        elif code == "D":
+            changeset.deleted.append(path)
+        elif code in ("M", "T"):
+            changeset.modified.append(path)
+        else:
+            log.debug(f"Bỏ qua trạng thái diff không hỗ trợ '{status}': {path}")
+        i += 2
+
+    return changeset
+
+
+def get_changeset_path(name: str) -> Path:
+    return constants.CHANGESETS_DATA_PATH / f"{name}.json"
+
+
+def write_changeset(changeset: SubmoduleChangeset) -> Path:
+    output_path = get_changeset_path(changeset.name)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(encode_json(asdict(changeset)))
+    log.info(
+        f"Đã ghi change set '{changeset.name}' "
+        f"(+{len(changeset.added)} ~{len(changeset.modified)} "
+        f"-{len(changeset.deleted)} R{len(changeset.renamed)}): {output_path}"
+    )
+    return output_path
+
+
+def load_changeset(name: str) -> Optional[SubmoduleChangeset]:
+    changeset_path = get_changeset_path(name)
+    if not changeset_path.exists():
+        return None
+    try:
+        return SubmoduleChangeset(**decode_json(changeset_path.read_bytes()))
+    except (JSONDecodeError, TypeError) as e:
+        log.warning(f"Không thể đọc change set {changeset_path}: {e}")
+        return None
@@ -2,21 +2,28 @@
 import configparser
 import logging
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from src.config import constants
+from src.db_updater.handlers import git_changeset
 from src.db_updater.handlers.base_handler import BaseHandler
 
 log = logging.getLogger(__name__)
 
+DEFAULT_UPDATE_JOBS = 2
+NON_SUBMODULE_KEYS = {"post_tasks", "jobs"}
+
 
 class GitHandler(BaseHandler):
 
     def __init__(self, handler_config: dict, destination_dir: Path):
         super().__init__(handler_config, destination_dir)
         self.project_root = constants.PROJECT_ROOT
+        self.jobs = int(handler_config.get("jobs", DEFAULT_UPDATE_JOBS))
 
-    def _run_command(self, command: list[str], cwd: Path):
+    def _run_command(self, command: list[str], cwd: Path, log_output: bool = True):
         log.info(f"Đang chạy lệnh: {' '.join(command)}...")
         log.info("(Tiến trình này có thể mất vài phút, vui lòng chờ...)")
         try:
@@ -29,7 +36,7 @@ class GitHandler(BaseHandler):
                 cwd=cwd,
             )
 
-            if result.stdout:
+            if result.stdout and log_output:
                 log.debug(f"STDOUT:\n{result.stdout.strip()}")
             if result.stderr:
                 log.debug(f"STDERR:\n{result.stderr.strip()}")
@@ -54,6 +61,83 @@ class GitHandler(BaseHandler):
             log.exception(f"Một lỗi không mong muốn đã xảy ra: {e}")
             return False, str(e)
 
+    def _get_submodule_sha(self, submodule_path: Path) -> str | None:
+        if not (submodule_path / ".git").exists():
+            return None
+        success, output = self._run_command(
+            ["git", "rev-parse", "HEAD"], cwd=submodule_path
+        )
+        return output if success and output else None
+
+    def _record_changeset(
+        self,
+        name: str,
+        submodule_path: Path,
+        old_sha: str | None,
+        new_sha: str | None,
+    ):
+        if not new_sha:
+            log.warning(f"Không xác định được SHA mới của submodule '{name}'.")
+            return
+
+        if old_sha == new_sha:
+            log.info(
+                f"Submodule '{name}' không đổi SHA, giữ nguyên change set hiện có."
+            )
+            return
+
+        base_sha = old_sha or git_changeset.EMPTY_TREE_SHA
+        diff_command = [
+            "git",
+            "diff",
+            "--name-status",
+            "-z",
+            "-M",
+            base_sha,
+            new_sha,
+        ]
+        success, diff_output = self._run_command(
+            diff_command, cwd=submodule_path, log_output=False
+        )
+        if not success:
+            log.error(f"Không thể tạo change set cho submodule '{name}'.")
+            return
+        changeset = git_changeset.parse_name_status(diff_output, name, old_sha, new_sha)
+
+        git_changeset.write_changeset(changeset)
+
+    def _relative_to_root(self, path: Path) -> Path:
+        return Path(*path.parts[len(self.project_root.parts) :])
+
+    def _update_submodule(self, name: str) -> bool:
+        submodule_path = self.destination_dir / name
+        old_sha = self._get_submodule_sha(submodule_path)
+        update_command = [
+            "git",
+            "submodule",
+            "update",
+            "--remote",
+            "--force",
+            "--",
+            str(self._relative_to_root(submodule_path)),
+        ]
+
+        start_time = time.perf_counter()
+        success, _ = self._run_command(update_command, cwd=self.project_root)
+        elapsed = time.perf_counter() - start_time
+
+        if not success:
+            log.error(f"❌ Cập nhật submodule '{name}' thất bại sau {elapsed:.1f}s.")
+            return False
+
+        new_sha = self._get_submodule_sha(submodule_path)
+        log.info(
+            f"✅ Đã cập nhật submodule '{name}' trong {elapsed:.1f}s "
+            f"({(old_sha or '-')[:10]} -> {(new_sha or '-')[:10]})."
+        )
+        self._record_changeset(name, submodule_path, old_sha, new_sha)
+        return True
+
     def execute(self):
         log.info("Bắt đầu cập nhật dữ liệu Git Submodule.")
         self.destination_dir.mkdir(parents=True, exist_ok=True)
@@ -64,14 +148,13 @@ class GitHandler(BaseHandler):
             config.read(gitmodules_path)
 
         submodule_repos = {
-            k: v for k, v in self.handler_config.items() if k != "post_tasks"
+            k: v for k, v in self.handler_config.items() if k not in NON_SUBMODULE_KEYS
         }
         has_new_submodules = False
 
         for name, url in submodule_repos.items():
-            submodule_path = self.destination_dir / name
-            submodule_relative_path = Path(
-                *submodule_path.parts[len(self.project_root.parts) :]
+            submodule_relative_path = self._relative_to_root(
+                self.destination_dir / name
             )
             section_name = f'submodule "{submodule_relative_path}"'
             if section_name not in config:
@@ -94,12 +177,42 @@ class GitHandler(BaseHandler):
         if not has_new_submodules:
             log.info("Không có submodule mới nào để thêm.")
 
-        log.info("Bắt đầu cập nhật tất cả các submodule đã đăng ký...")
-        update_command = ["git", "submodule", "update", "--init", "--remote", "--force"]
-
-        success, _ = self._run_command(update_command, cwd=self.project_root)
+        relative_paths = [
+            str(self._relative_to_root(self.destination_dir / name))
+            for name in submodule_repos
+        ]
+        init_command = ["git", "submodule", "init", "--"] + relative_paths
+        success, _ = self._run_command(init_command, cwd=self.project_root)
         if not success:
-            raise RuntimeError("Cập nhật submodule thất bại.")
+            raise RuntimeError("Khởi tạo submodule thất bại.")
+
+        max_workers = max(1, min(self.jobs, len(submodule_repos)))
+        log.info(
+            f"Bắt đầu cập nhật {len(submodule_repos)} submodule "
+            f"({', '.join(submodule_repos)}) với {max_workers} luồng..."
+        )
+        failed_submodules = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._update_submodule, name): name
+                for name in submodule_repos
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    if not future.result():
+                        failed_submodules.append(name)
+                except Exception:
+                    log.error(
+                        f"Lỗi nghiêm trọng khi cập nhật submodule '{name}'.",
+                        exc_info=True,
+                    )
+                    failed_submodules.append(name)
+
+        if failed_submodules:
+            raise RuntimeError(
+                f"Cập nhật submodule thất bại: {', '.join(sorted(failed_submodules))}."
+            )
 
         log.info("Kiểm tra trạng thái sau khi cập nhật để xác định các thay đổi...")
         status_command = ["git", "status", "--porcelain"]
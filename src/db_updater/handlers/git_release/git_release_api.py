@@ -1,20 +1,94 @@
 # Path: src/db_updater/handlers/git_release/git_release_api.py
+import json
 import logging
 import os
 import re
-from typing import Any, Dict, Optional, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 from dotenv import load_dotenv
 
+from src.config import constants
+
 log = logging.getLogger(__name__)
 
 __all__ = [
+    "ReleaseMetadataCache",
     "get_github_headers",
     "parse_repo_url",
     "get_release_info",
+    "get_release_infos",
 ]
 
+API_TIMEOUT = 30
+DEFAULT_CACHE_TTL = 15 * 60
+MAX_API_WORKERS = 4
+CACHE_FILE_NAME = "github_releases.json"
+
+
+class ReleaseMetadataCache:
+
+    def __init__(self, path: Optional[Path] = None, ttl: int = DEFAULT_CACHE_TTL):
+        self.path = path or constants.CACHE_DATA_PATH / CACHE_FILE_NAME
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        self._dirty = False
+
+    @staticmethod
+    def make_key(owner: str, repo: str, version: str) -> str:
+        return f"{owner}/{repo}@{version}"
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (json.JSONDecodeError, OSError) as e:
+            log.warning(f"Không thể đọc cache release {self.path}: {e}")
+            return {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def is_fresh(self, entry: Optional[Dict[str, Any]]) -> bool:
+        if not entry or self.ttl <= 0:
+            return False
+        return time.time() - entry.get("checked_at", 0) < self.ttl
+
+    def put(self, key: str, etag: Optional[str], data: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = {
+                "etag": etag,
+                "checked_at": time.time(),
+                "data": data,
+            }
+            self._dirty = True
+
+    def touch(self, key: str):
+        with self._lock:
+            if key in self._entries:
+                self._entries[key]["checked_at"] = time.time()
+                self._dirty = True
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+            self._dirty = False
+
 
 def get_github_headers() -> Optional[Dict[str, str]]:
     load_dotenv()
@@ -36,18 +110,69 @@ def parse_repo_url(url: str) -> Optional[Tuple[str, str]]:
     return None
 
 
+def _get_release_url(owner: str, repo: str, version: str) -> str:
+    if version == "latest":
+        return f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
+    return f"https://api.github.com/repos/{owner}/{repo}/releases/tags/{version}"
+
+
 def get_release_info(
-    owner: str, repo: str, version: str, headers: Optional[Dict[str, str]]
+    owner: str,
+    repo: str,
+    version: str,
+    headers: Optional[Dict[str, str]],
+    cache: Optional[ReleaseMetadataCache] = None,
 ) -> Optional[Dict[str, Any]]:
-    if version == "latest":
-        url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
-    else:
-        url = f"https://api.github.com/repos/{owner}/{repo}/releases/tags/{version}"
+    key = ReleaseMetadataCache.make_key(owner, repo, version)
+    entry = cache.get(key) if cache else None
+    if cache and cache.is_fresh(entry):
+        assert entry is not None
+        log.info(f"Dùng metadata release đã cache cho '{key}' (chưa hết hạn).")
+        return entry["data"]
+
+    request_headers = dict(headers or {})
+    if entry and entry.get("etag"):
+        request_headers["If-None-Match"] = entry["etag"]
 
     try:
-        response = requests.get(url, headers=headers)
+        response = requests.get(
+            _get_release_url(owner, repo, version),
+            headers=request_headers,
+            timeout=API_TIMEOUT,
+        )
+        if response.status_code == 304 and cache and entry:
+            log.info(f"Metadata release '{key}' không đổi (304 Not Modified).")
+            cache.touch(key)
+            return entry["data"]
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+        if cache:
+            cache.put(key, response.headers.get("ETag"), data)
+        return data
     except requests.exceptions.RequestException as e:
         log.error(f"Lỗi khi gọi GitHub API cho repo '{owner}/{repo}': {e}")
+        if entry:
+            log.warning(f"Dùng metadata release đã cache (có thể cũ) cho '{key}'.")
+            return entry["data"]
         return None
+
+
+def get_release_infos(
+    lookups: List[Tuple[str, str, str]],
+    headers: Optional[Dict[str, str]],
+    cache: Optional[ReleaseMetadataCache] = None,
+    max_workers: int = MAX_API_WORKERS,
+) -> List[Optional[Dict[str, Any]]]:
+    if not lookups:
+        return []
+    workers = max(1, min(max_workers, len(lookups)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(
+                lambda lookup: get_release_info(*lookup, headers, cache=cache),
+                lookups,
+            )
+        )
+    if cache:
+        cache.save()
+    return results
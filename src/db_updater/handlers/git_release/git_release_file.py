@@ -1,93 +1,222 @@
 # Path: src/db_updater/handlers/git_release/git_release_file.py
 import logging
 import os
-import tarfile
+import shutil
 import zipfile
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Collection, Dict, List, Optional
 
 import requests
-from tqdm import tqdm
+
+from src.db_updater.handlers import archive_utils, download_utils
 
 log = logging.getLogger(__name__)
 
-__all__ = ["download_file", "decompress_archive"]
+__all__ = ["download_file", "decompress_archive", "stream_extract_asset"]
 
 
-def download_file(url: str, dest_path: Path, headers: Optional[Dict[str, str]]):
-    log.info(f"Đang tải về: {url} -> {dest_path.name}")
+def download_file(
+    url: str,
+    dest_path: Path,
+    headers: Optional[Dict[str, str]],
+    expected_size: Optional[int] = None,
+    expected_digest: Optional[str] = None,
+    source_id: Optional[str] = None,
+):
     try:
-        with requests.get(url, stream=True, headers=headers) as r:
-            r.raise_for_status()
-            total_size = int(r.headers.get("content-length", 0))
-            with (
-                open(dest_path, "wb") as f,
-                tqdm(
-                    total=total_size, unit="iB", unit_scale=True, desc=dest_path.name
-                ) as bar,
-            ):
-                for chunk in r.iter_content(chunk_size=8192):
-                    size = f.write(chunk)
-                    bar.update(size)
+        download_utils.download_resumable(
+            url,
+            dest_path,
+            headers=headers,
+            expected_size=expected_size,
+            expected_digest=expected_digest,
+            source_id=source_id,
+        )
     except requests.exceptions.RequestException as e:
-        log.error(f"Tải file thất bại: {e}")
+        log.error(f"Tải file thất bại (có thể tiếp tục ở lần chạy sau): {e}")
         raise
 
 
-def decompress_archive(
+STAGING_PREFIX = ".staging-"
+
+
+def _remove_paths(paths: List[Path]):
+    for path in paths:
+        if path.is_dir() and not path.is_symlink():
+            shutil.rmtree(path, ignore_errors=True)
+        elif path.exists() or path.is_symlink():
+            path.unlink()
+
+
+def _owns_extract_dir(extract_dir: Path, replace_paths: Collection[Path]) -> bool:
+    return any(p == extract_dir or p in extract_dir.parents for p in replace_paths)
+
+
+def _staging_dir(extract_dir: Path, asset_name: str, swap_whole: bool) -> Path:
+    parent = extract_dir.parent if swap_whole else extract_dir
+    staging = parent / f"{STAGING_PREFIX}{asset_name}"
+    _remove_paths([staging])
+    staging.mkdir(parents=True)
+    return staging
+
+
+def _swap_dir(staging: Path, extract_dir: Path):
+    backup = extract_dir.with_name(f"{STAGING_PREFIX}old-{extract_dir.name}")
+    _remove_paths([backup])
+    if extract_dir.exists() or extract_dir.is_symlink():
+        os.replace(extract_dir, backup)
+    os.replace(staging, extract_dir)
+    _remove_paths([backup])
+
+
+def _merge_into(staged: Path, target: Path):
+    if (
+        staged.is_dir()
+        and not staged.is_symlink()
+        and target.is_dir()
+        and not target.is_symlink()
+    ):
+        for child in staged.iterdir():
+            _merge_into(child, target / child.name)
+        return
+    _remove_paths([target])
+    os.replace(staged, target)
+
+
+def _install_staged(
+    staging: Path,
+    staged_paths: List[Path],
+    extract_dir: Path,
+    replace_paths: Collection[Path],
+) -> List[Path]:
+    if _owns_extract_dir(extract_dir, replace_paths):
+        _swap_dir(staging, extract_dir)
+        return [extract_dir / staged.name for staged in staged_paths]
+
+    installed = []
+    for staged in staged_paths:
+        target = extract_dir / staged.name
+        if any(p == target or p in target.parents for p in replace_paths):
+            _remove_paths([target])
+            os.replace(staged, target)
+        else:
+            _merge_into(staged, target)
+        installed.append(target)
+    return installed
+
+
+def stream_extract_asset(
+    url: str,
+    asset_name: str,
+    extract_dir: Path,
+    headers: Optional[Dict[str, str]],
+    expected_size: Optional[int] = None,
+    expected_digest: Optional[str] = None,
+    replace_paths: Collection[Path] = (),
+) -> List[Path]:
+    compression = archive_utils.get_tar_compression(asset_name)
+    if compression is None:
+        raise ValueError(f"Asset '{asset_name}' không hỗ trợ giải nén streaming.")
+
+    log.info(f"Tải và giải nén streaming: {asset_name} -> {extract_dir}")
+    staging = _staging_dir(
+        extract_dir, asset_name, _owns_extract_dir(extract_dir, replace_paths)
+    )
+    try:
+        with download_utils.VerifyingStream(
+            url,
+            headers=headers,
+            expected_size=expected_size,
+            expected_digest=expected_digest,
+            desc=asset_name,
+        ) as stream:
+            staged_paths = archive_utils.extract_tar_stream(
+                stream, compression, staging
+            )
+            stream.verify()
+        extracted_paths = _install_staged(
+            staging, staged_paths, extract_dir, replace_paths
+        )
+    finally:
+        _remove_paths([staging])
+
+    if stream.digest:
+        log.info(f"✅ Đã xác minh {stream.digest[0]} cho {asset_name}.")
+    log.info(f"Giải nén streaming hoàn tất: {asset_name}")
+    return extracted_paths
+
+
+def _extract_to_staging(
     archive_path: Path,
     original_asset_name: str,
     extract_dir: Path,
+    staging: Path,
     force_extract: bool,
-    auto_extract: bool,
-):
+) -> Optional[List[Path]]:
     file_name_on_disk = archive_path.name
-    should_delete_archive = True
-
-    log.info(f"Đang xử lý file: {file_name_on_disk}")
 
     if force_extract:
         log.info(f"Ép buộc giải nén (zip): {file_name_on_disk} -> {extract_dir}")
         try:
             with zipfile.ZipFile(archive_path, "r") as zip_ref:
-                zip_ref.extractall(extract_dir)
+                return archive_utils.safe_extract_zip(zip_ref, staging)
         except zipfile.BadZipFile:
             log.error(
                 f"Lỗi: Đã ép buộc giải nén nhưng '{file_name_on_disk}' (tên gốc: {original_asset_name}) không phải file zip hợp lệ."
             )
-            should_delete_archive = False
         except Exception as e:
             log.error(f"Lỗi khi ép buộc giải nén zip: {e}")
-            should_delete_archive = False
+        return None
 
-    elif auto_extract:
-        if original_asset_name.endswith(".zip"):
-            log.info(f"Tự động giải nén (zip): {file_name_on_disk} -> {extract_dir}")
-            with zipfile.ZipFile(archive_path, "r") as zip_ref:
-                zip_ref.extractall(extract_dir)
+    if original_asset_name.endswith(".zip"):
+        log.info(f"Tự động giải nén (zip): {file_name_on_disk} -> {extract_dir}")
+        with zipfile.ZipFile(archive_path, "r") as zip_ref:
+            return archive_utils.safe_extract_zip(zip_ref, staging)
 
-        elif original_asset_name.endswith((".tar.gz", ".tgz")):
-            log.info(f"Tự động giải nén (tar.gz): {file_name_on_disk} -> {extract_dir}")
-            with tarfile.open(archive_path, "r:gz") as tar:
-                tar.extractall(path=extract_dir)
+    if original_asset_name.endswith((".tar.gz", ".tgz")):
+        log.info(f"Tự động giải nén (tar.gz): {file_name_on_disk} -> {extract_dir}")
+        return archive_utils.safe_extract_tar(archive_path, "r:gz", staging)
 
-        elif original_asset_name.endswith(".tar.bz2"):
-            log.info(
-                f"Tự động giải nén (tar.bz2): {file_name_on_disk} -> {extract_dir}"
-            )
-            with tarfile.open(archive_path, "r:bz2") as tar:
-                tar.extractall(path=extract_dir)
+    if original_asset_name.endswith(".tar.bz2"):
+        log.info(f"Tự động giải nén (tar.bz2): {file_name_on_disk} -> {extract_dir}")
+        return archive_utils.safe_extract_tar(archive_path, "r:bz2", staging)
 
-        else:
-            log.info(
-                f"Giữ nguyên file (auto-extract, không khớp loại): {file_name_on_disk}"
-            )
-            should_delete_archive = False
+    log.info(f"Giữ nguyên file (auto-extract, không khớp loại): {file_name_on_disk}")
+    return None
+
+
+def decompress_archive(
+    archive_path: Path,
+    original_asset_name: str,
+    extract_dir: Path,
+    force_extract: bool,
+    auto_extract: bool,
+    replace_paths: Collection[Path] = (),
+) -> List[Path]:
+    log.info(f"Đang xử lý file: {archive_path.name}")
+    if not (force_extract or auto_extract):
+        log.info(f"Giữ nguyên file (không giải nén): {archive_path.name}")
+        return [archive_path]
 
-    else:
-        log.info(f"Giữ nguyên file (không giải nén): {file_name_on_disk}")
-        should_delete_archive = False
+    staging = _staging_dir(
+        extract_dir, original_asset_name, _owns_extract_dir(extract_dir, replace_paths)
+    )
+    try:
+        staged_paths = _extract_to_staging(
+            archive_path,
+            original_asset_name,
+            extract_dir,
+            staging,
+            force_extract,
+        )
+        if staged_paths is None:
+            return [archive_path]
+        extracted_paths = _install_staged(
+            staging, staged_paths, extract_dir, replace_paths
+        )
+    finally:
+        _remove_paths([staging])
 
-    if should_delete_archive:
-        os.remove(archive_path)
-        log.info(f"Giải nén hoàn tất và đã xóa file nén: {file_name_on_disk}")
+    os.remove(archive_path)
+    log.info(f"Giải nén hoàn tất và đã xóa file nén: {archive_path.name}")
+    return extracted_paths
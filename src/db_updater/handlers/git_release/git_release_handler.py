@@ -1,8 +1,10 @@
 # Path: src/db_updater/handlers/git_release/git_release_handler.py
 import logging
-import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from src.db_updater.handlers import archive_utils
 from src.db_updater.handlers.base_handler import BaseHandler
 
 from . import git_release_api, git_release_file, git_release_state
@@ -11,12 +13,29 @@ log = logging.getLogger(__name__)
 
 __all__ = ["GitReleaseHandler"]
 
+MAX_DOWNLOAD_WORKERS = 4
+NON_REPO_KEYS = {"post_tasks", "cache_ttl"}
+
+
+@dataclass
+class ReleasePlan:
+    item_name: str
+    dest_path: Path
+    tag: str
+    assets_state: dict[str, dict] = field(default_factory=dict)
+    jobs: list[tuple[dict, dict]] = field(default_factory=list)
+    stale_states: list[dict] = field(default_factory=list)
+    failed_assets: list[str] = field(default_factory=list)
+
 
 class GitReleaseHandler(BaseHandler):
 
     def __init__(self, handler_config: dict, destination_dir: Path):
         super().__init__(handler_config, destination_dir)
         self.headers = git_release_api.get_github_headers()
+        self.release_cache = git_release_api.ReleaseMetadataCache(
+            ttl=int(handler_config.get("cache_ttl", git_release_api.DEFAULT_CACHE_TTL))
+        )
 
     def _determine_paths(
         self,
@@ -45,98 +64,209 @@ class GitReleaseHandler(BaseHandler):
 
         return archive_path, final_extract_dir
 
-    def execute(self):
-        log.info("Bắt đầu cập nhật dữ liệu từ GitHub Releases.")
-        repo_configs = {
-            k: v for k, v in self.handler_config.items() if k != "post_tasks"
-        }
-
+    def _fetch_release_infos(self, repo_configs: dict) -> dict[str, dict | None]:
+        lookups = {}
         for item_name, item_config in repo_configs.items():
-            log.info(f"--- Bắt đầu xử lý module release: '{item_name}' ---")
-            dest_path = self.destination_dir / item_name
-            dest_path.mkdir(parents=True, exist_ok=True)
-
             repo_info = git_release_api.parse_repo_url(item_config["link"])
-            if not repo_info:
-                continue
-            owner, repo = repo_info
+            if repo_info:
+                lookups[item_name] = (*repo_info, str(item_config["version"]))
+
+        results = git_release_api.get_release_infos(
+            list(lookups.values()), self.headers, cache=self.release_cache
+        )
+        return dict(zip(lookups, results))
+
+    def _plan_item(
+        self, item_name: str, item_config: dict, release_info: dict | None
+    ) -> ReleasePlan | None:
+        log.info(f"--- Bắt đầu xử lý module release: '{item_name}' ---")
+        if not release_info:
+            return None
+        dest_path = self.destination_dir / item_name
+        dest_path.mkdir(parents=True, exist_ok=True)
 
-            release_info = git_release_api.get_release_info(
-                owner, repo, item_config["version"], self.headers
+        release_tag = release_info["tag_name"]
+        remote_assets_map = {
+            asset["name"]: asset for asset in release_info.get("assets", [])
+        }
+
+        normalized_assets = git_release_state.normalize_asset_config(
+            item_config["assets"]
+        )
+        local_state = git_release_state.get_local_state(dest_path)
+
+        to_download, to_remove = git_release_state.plan_asset_sync(
+            local_state, release_tag, remote_assets_map, normalized_assets, dest_path
+        )
+        if not to_download and not to_remove:
+            log.info(
+                f"✅ Phiên bản '{release_tag}' và các assets đã được cập nhật đầy đủ."
             )
-            if not release_info:
-                continue
+            return None
 
-            release_tag = release_info["tag_name"]
-            remote_assets_map = {
-                asset["name"]: asset for asset in release_info.get("assets", [])
-            }
+        local_assets = local_state.get("assets", {})
+        stale_states = []
+        for asset_name in to_remove:
+            log.info(f"Asset '{asset_name}' không còn trong cấu hình. Sẽ gỡ bỏ.")
+            stale_states.append(local_assets.pop(asset_name))
+
+        replaced = sum(asset["name"] in local_assets for asset in to_download)
+        log.info(
+            f"Đồng bộ '{item_name}': tải {len(to_download)} asset, "
+            f"gỡ {len(to_remove)} asset, giữ nguyên {len(local_assets) - replaced} asset."
+        )
+        plan = ReleasePlan(
+            item_name=item_name,
+            dest_path=dest_path,
+            tag=release_tag,
+            assets_state=local_assets,
+            stale_states=stale_states,
+        )
+        for asset_config in to_download:
+            plan.jobs.append((asset_config, remote_assets_map[asset_config["name"]]))
+        return plan
 
-            normalized_assets = git_release_state.normalize_asset_config(
-                item_config["assets"]
+    def _can_stream(self, asset_config: dict) -> bool:
+        if not asset_config.get("stream"):
+            return False
+        if asset_config["extract"] != "auto":
+            return False
+        if archive_utils.get_tar_compression(asset_config["name"]) is None:
+            log.info(
+                f"Asset '{asset_config['name']}' không phải tar, "
+                "không thể giải nén streaming. Dùng tải về thông thường."
             )
-            requested_assets_set = {asset["name"] for asset in normalized_assets}
-            local_state = git_release_state.get_local_state(dest_path)
-
-            if not git_release_state.check_if_sync_required(
-                local_state,
-                release_tag,
-                requested_assets_set,
-                item_config["version"],
-            ):
-                log.info(
-                    f"✅ Phiên bản '{release_tag}' và các assets đã được cập nhật đầy đủ."
-                )
-                continue
+            return False
+        return True
 
-            log.info("Thực hiện đồng bộ hóa: Dọn dẹp và tải lại.")
-            shutil.rmtree(dest_path)
-            dest_path.mkdir()
+    def _process_asset(
+        self,
+        dest_path: Path,
+        tag: str,
+        asset_config: dict,
+        asset_info: dict,
+        owned_targets: set[str],
+    ) -> dict:
+        asset_name = asset_config["name"]
+        replace_paths = {dest_path / target for target in owned_targets}
+        archive_path, final_extract_dir = self._determine_paths(
+            dest_path,
+            asset_name,
+            asset_config["extract"],
+            asset_config["extract_to_folder"],
+        )
 
-            downloaded_assets_this_run = []
-            for asset_config in normalized_assets:
-                asset_name = asset_config["name"]
-                target_asset_info = remote_assets_map.get(asset_name)
+        if self._can_stream(asset_config):
+            output_paths = git_release_file.stream_extract_asset(
+                asset_info["browser_download_url"],
+                asset_name,
+                final_extract_dir,
+                self.headers,
+                expected_size=asset_info.get("size"),
+                expected_digest=asset_info.get("digest"),
+                replace_paths=replace_paths,
+            )
+            targets = [p.relative_to(dest_path).parts[0] for p in output_paths]
+            return git_release_state.build_asset_state(
+                tag, asset_config, asset_info, targets
+            )
 
-                if not target_asset_info:
-                    log.warning(
-                        f"Không tìm thấy asset '{asset_name}' trong release '{release_tag}'."
-                    )
-                    continue
+        git_release_file.download_file(
+            asset_info["browser_download_url"],
+            archive_path,
+            self.headers,
+            expected_size=asset_info.get("size"),
+            expected_digest=asset_info.get("digest"),
+            source_id=f"{tag}/{asset_info.get('id')}/{asset_info.get('updated_at')}",
+        )
 
-                try:
+        if asset_config["extract"] and asset_config["extract_to_folder"]:
+            final_extract_dir.mkdir(parents=True, exist_ok=True)
 
-                    archive_path, final_extract_dir = self._determine_paths(
-                        dest_path,
-                        asset_name,
-                        asset_config["extract"],
-                        asset_config["extract_to_folder"],
-                    )
+        output_paths = git_release_file.decompress_archive(
+            archive_path,
+            asset_name,
+            final_extract_dir,
+            force_extract=(asset_config["extract"] is True),
+            auto_extract=(asset_config["extract"] == "auto"),
+            replace_paths=replace_paths,
+        )
+        targets = [p.relative_to(dest_path).parts[0] for p in output_paths]
+        return git_release_state.build_asset_state(
+            tag, asset_config, asset_info, targets
+        )
 
-                    git_release_file.download_file(
-                        target_asset_info["browser_download_url"],
-                        archive_path,
-                        self.headers,
-                    )
+    def _remove_stale_targets(self, plan: ReleasePlan):
+        keep = git_release_state.claimed_targets(plan.assets_state)
+        for asset_state in plan.stale_states:
+            git_release_state.remove_asset_targets(plan.dest_path, asset_state, keep)
 
-                    if asset_config["extract"] and asset_config["extract_to_folder"]:
-                        final_extract_dir.mkdir(parents=True, exist_ok=True)
+    def execute(self):
+        log.info("Bắt đầu cập nhật dữ liệu từ GitHub Releases.")
+        repo_configs = {
+            k: v for k, v in self.handler_config.items() if k not in NON_REPO_KEYS
+        }
+        release_infos = self._fetch_release_infos(repo_configs)
 
-                    git_release_file.decompress_archive(
-                        archive_path,
-                        asset_name,
-                        final_extract_dir,
-                        force_extract=(asset_config["extract"] is True),
-                        auto_extract=(asset_config["extract"] == "auto"),
-                    )
-                    downloaded_assets_this_run.append(asset_name)
+        plans = [
+            plan
+            for item_name, item_config in repo_configs.items()
+            if (
+                plan := self._plan_item(
+                    item_name, item_config, release_infos.get(item_name)
+                )
+            )
+        ]
+        if not plans:
+            return
+
+        total_jobs = sum(len(plan.jobs) for plan in plans)
+        if total_jobs:
+            log.info(
+                f"Bắt đầu tải {total_jobs} asset với {MAX_DOWNLOAD_WORKERS} luồng song song..."
+            )
+        with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    self._process_asset,
+                    plan.dest_path,
+                    plan.tag,
+                    asset_config,
+                    asset_info,
+                    git_release_state.exclusive_targets(
+                        plan.assets_state, asset_config["name"]
+                    ),
+                ): (plan, asset_config["name"])
+                for plan in plans
+                for asset_config, asset_info in plan.jobs
+            }
+            for future in as_completed(futures):
+                plan, asset_name = futures[future]
+                try:
+                    new_state = future.result()
                 except Exception as e:
-                    log.error(f"Lỗi khi xử lý asset '{asset_name}': {e}")
-
-            if downloaded_assets_this_run:
-                new_state = {
-                    "tag": release_tag,
-                    "assets": sorted(list(set(downloaded_assets_this_run))),
-                }
-                git_release_state.save_local_state(dest_path, new_state)
-                log.info(f"🎉 Đồng bộ hóa thành công '{item_name}'.")
+                    plan.failed_assets.append(asset_name)
+                    log.error(
+                        f"Lỗi khi xử lý asset '{asset_name}' "
+                        f"(giữ nguyên dữ liệu cũ nếu có): {e}"
+                    )
+                    continue
+                previous_state = plan.assets_state.get(asset_name)
+                if previous_state:
+                    plan.stale_states.append(previous_state)
+                plan.assets_state[asset_name] = new_state
+
+        for plan in plans:
+            self._remove_stale_targets(plan)
+            new_state = {
+                "tag": plan.tag,
+                "assets": dict(sorted(plan.assets_state.items())),
+            }
+            git_release_state.save_local_state(plan.dest_path, new_state)
+            if plan.failed_assets:
+                log.warning(
+                    f"⚠️  '{plan.item_name}' còn {len(plan.failed_assets)} asset lỗi: "
+                    f"{', '.join(sorted(plan.failed_assets))}"
+                )
+            else:
+                log.info(f"🎉 Đồng bộ hóa thành công '{plan.item_name}'.")
@@ -1,23 +1,36 @@
 # Path: src/db_updater/handlers/git_release/git_release_state.py
 import json
 import logging
+import shutil
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Collection, Dict, List, Set, Tuple
 
 log = logging.getLogger(__name__)
 
 __all__ = [
     "get_local_state",
     "save_local_state",
-    "check_if_sync_required",
     "normalize_asset_config",
+    "plan_asset_sync",
+    "remove_asset_targets",
+    "claimed_targets",
+    "exclusive_targets",
+    "build_asset_state",
 ]
 
 VERSION_FILE_NAME = "version.json"
 
 
+def _migrate_legacy_assets(state: Dict[str, Any]) -> Dict[str, Any]:
+    log.info(
+        f"File {VERSION_FILE_NAME} dùng định dạng cũ (danh sách assets). "
+        "Các asset sẽ được đồng bộ lại một lần để ghi trạng thái chi tiết."
+    )
+    return {name: {"tag": state.get("tag"), "targets": []} for name in state["assets"]}
+
+
 def get_local_state(path: Path) -> Dict[str, Any]:
-    default_state = {"tag": None, "assets": []}
+    default_state: Dict[str, Any] = {"tag": None, "assets": {}}
     version_file = path / VERSION_FILE_NAME
     if not version_file.exists():
         return default_state
@@ -30,6 +43,8 @@ def get_local_state(path: Path) -> Dict[str, Any]:
                     f"File {VERSION_FILE_NAME} không hợp lệ. Coi như trạng thái rỗng."
                 )
                 return default_state
+            if isinstance(state["assets"], list):
+                state["assets"] = _migrate_legacy_assets(state)
             return state
     except (json.JSONDecodeError, TypeError):
         log.warning(f"Lỗi đọc file {VERSION_FILE_NAME}. Coi như trạng thái rỗng.")
@@ -53,6 +68,7 @@ def normalize_asset_config(
                     "name": asset_item,
                     "extract": "auto",
                     "extract_to_folder": False,
+                    "stream": False,
                 }
             )
         elif isinstance(asset_item, dict) and "name" in asset_item:
@@ -61,30 +77,125 @@ def normalize_asset_config(
                     "name": asset_item["name"],
                     "extract": asset_item.get("extract", "auto"),
                     "extract_to_folder": asset_item.get("extract_to_folder", False),
+                    "stream": asset_item.get("stream", False),
                 }
             )
     return normalized
 
 
-def check_if_sync_required(
-    local_state: Dict[str, Any],
-    remote_tag: str,
-    requested_assets_set: Set[str],
-    requested_version: str,
+def build_asset_state(
+    release_tag: str,
+    asset_config: Dict[str, Any],
+    remote_asset: Dict[str, Any],
+    targets: List[str],
+) -> Dict[str, Any]:
+    return {
+        "tag": release_tag,
+        "size": remote_asset.get("size"),
+        "digest": remote_asset.get("digest"),
+        "extract": asset_config["extract"],
+        "extract_to_folder": asset_config["extract_to_folder"],
+        "targets": sorted(set(targets)),
+    }
+
+
+def _is_asset_current(
+    local_asset: Dict[str, Any] | None,
+    release_tag: str,
+    asset_config: Dict[str, Any],
+    remote_asset: Dict[str, Any],
+    dest_path: Path,
 ) -> bool:
-    local_assets_set = set(local_state.get("assets", []))
+    if not local_asset:
+        return False
 
-    is_version_mismatch = (
-        requested_version == "latest" and remote_tag != local_state.get("tag")
-    ) or (requested_version != "latest" and requested_version != local_state.get("tag"))
+    expected = build_asset_state(
+        release_tag, asset_config, remote_asset, local_asset.get("targets", [])
+    )
+    for key in ("tag", "size", "digest", "extract", "extract_to_folder"):
+        if local_asset.get(key) != expected[key]:
+            log.info(
+                f"Asset '{asset_config['name']}' thay đổi '{key}' "
+                f"(local: {local_asset.get(key)}, remote: {expected[key]})."
+            )
+            return False
 
-    if is_version_mismatch:
+    targets = local_asset.get("targets", [])
+    missing = [t for t in targets if not (dest_path / t).exists()]
+    if not targets or missing:
         log.info(
-            f"Phiên bản không khớp (local: {local_state.get('tag')}, remote: {remote_tag}). Cần đồng bộ lại."
+            f"Asset '{asset_config['name']}' thiếu dữ liệu đã giải nén: {missing or targets}."
         )
-        return True
-    elif requested_assets_set != local_assets_set:
-        log.info("Danh sách assets trong config đã thay đổi. Cần đồng bộ lại.")
-        return True
+        return False
+    return True
+
+
+def plan_asset_sync(
+    local_state: Dict[str, Any],
+    release_tag: str,
+    remote_assets_map: Dict[str, Dict[str, Any]],
+    normalized_assets: List[Dict[str, Any]],
+    dest_path: Path,
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    local_assets = local_state.get("assets", {})
+    requested_names = {asset["name"] for asset in normalized_assets}
+
+    to_download = []
+    for asset_config in normalized_assets:
+        asset_name = asset_config["name"]
+        remote_asset = remote_assets_map.get(asset_name)
+        if not remote_asset:
+            log.warning(
+                f"Không tìm thấy asset '{asset_name}' trong release '{release_tag}'."
+            )
+            continue
+        if _is_asset_current(
+            local_assets.get(asset_name),
+            release_tag,
+            asset_config,
+            remote_asset,
+            dest_path,
+        ):
+            log.debug(f"Asset '{asset_name}' đã cập nhật, bỏ qua.")
+            continue
+        to_download.append(asset_config)
+
+    to_remove = sorted(name for name in local_assets if name not in requested_names)
+    return to_download, to_remove
+
+
+def claimed_targets(assets_state: Dict[str, Dict[str, Any]]) -> Set[str]:
+    return {
+        target for state in assets_state.values() for target in state.get("targets", [])
+    }
+
+
+def exclusive_targets(
+    assets_state: Dict[str, Dict[str, Any]], asset_name: str
+) -> Set[str]:
+    own = assets_state.get(asset_name, {}).get("targets", [])
+    others = claimed_targets(
+        {name: state for name, state in assets_state.items() if name != asset_name}
+    )
+    return set(own) - others
+
 
-    return False
+def remove_asset_targets(
+    dest_path: Path,
+    asset_state: Dict[str, Any] | None,
+    keep: Collection[str] = (),
+):
+    if not asset_state:
+        return
+    for target in asset_state.get("targets", []):
+        target_path = dest_path / target
+        if target_path.name == VERSION_FILE_NAME or not target_path.exists():
+            continue
+        if target in keep:
+            log.debug(f"Giữ lại {target_path}: vẫn thuộc một asset khác.")
+            continue
+        if target_path.is_dir():
+            shutil.rmtree(target_path)
+        else:
+            target_path.unlink()
+        log.info(f"Đã xóa dữ liệu cũ của asset: {target_path}")
@@ -0,0 +1,16 @@
+# Path: src/db_updater/post_tasks/bilara/__init__.py
+from .bilara_scanner import (
+    DEFAULT_GROUP,
+    BilaraFile,
+    compile_groups,
+    load_files_manifest,
+    scan_bilara_tree,
+)
+
+__all__ = [
+    "DEFAULT_GROUP",
+    "BilaraFile",
+    "compile_groups",
+    "load_files_manifest",
+    "scan_bilara_tree",
+]
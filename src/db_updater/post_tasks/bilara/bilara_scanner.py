@@ -0,0 +1,158 @@
+# Path: src/db_updater/post_tasks/bilara/bilara_scanner.py
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from src.shared import (
+    JSONDecodeError,
+    SourceBackend,
+    SourceFileInfo,
+    artifact_exists,
+    read_json,
+)
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "DEFAULT_GROUP",
+    "BilaraFile",
+    "compile_groups",
+    "load_files_manifest",
+    "scan_bilara_tree",
+]
+
+DEFAULT_GROUP = "sutta"
+
+
+@dataclass
+class BilaraFile:
+    folder: str
+    group: str
+    file_key: str
+    relative_path: str
+    size: int
+    mtime_ns: Optional[int]
+    sha: str
+
+
+def compile_groups(
+    groups_config: List[Dict[str, List[str]]],
+) -> List[Tuple[str, FrozenSet[str]]]:
+    compiled = []
+    for group in groups_config:
+        for group_name, keywords in group.items():
+            compiled.append((group_name, frozenset(keywords)))
+    return compiled
+
+
+def load_files_manifest(manifest_path: Optional[Path]) -> Dict[str, Dict[str, Any]]:
+    if not manifest_path or not artifact_exists(manifest_path):
+        return {}
+    try:
+        data = read_json(manifest_path)
+        return data if isinstance(data, dict) else {}
+    except (JSONDecodeError, OSError) as e:
+        log.warning(f"Không thể đọc manifest file cũ {manifest_path}: {e}")
+        return {}
+
+
+def _classify(
+    relative_parts: Tuple[str, ...], groups: List[Tuple[str, FrozenSet[str]]]
+) -> str:
+    for group_name, keywords in groups:
+        if not keywords.isdisjoint(relative_parts):
+            return group_name
+    return DEFAULT_GROUP
+
+
+def _resolve_sha(
+    info: SourceFileInfo,
+    relative_path: str,
+    previous: Dict[str, Dict[str, Any]],
+    source: SourceBackend,
+) -> str:
+    if info.blob_sha:
+        return info.blob_sha
+    old = previous.get(relative_path)
+    if (
+        old
+        and old.get("sha")
+        and old.get("size") == info.size
+        and info.mtime_ns is not None
+        and old.get("mtime_ns") == info.mtime_ns
+    ):
+        return old["sha"]
+    return source.blob_sha(info.path)
+
+
+def _scan_folder(
+    folder: str,
+    scan_dir: Path,
+    relative_base: Path,
+    groups: List[Tuple[str, FrozenSet[str]]],
+    previous: Dict[str, Dict[str, Any]],
+    source: SourceBackend,
+) -> List[BilaraFile]:
+    if not source.is_dir(scan_dir):
+        log.warning(f"Thư mục không tồn tại, bỏ qua: {scan_dir}")
+        return []
+
+    log.debug(f"Đang quét trong {scan_dir}...")
+    base_prefix = os.path.join(str(relative_base), "")
+    files = []
+    for info in source.scan_files(scan_dir, ".json"):
+        path_str = str(info.path)
+        if path_str.startswith(base_prefix):
+            relative_path = path_str[len(base_prefix) :]
+        else:
+            relative_path = str(info.path.relative_to(relative_base))
+        relative_parts = tuple(relative_path.split(os.sep))
+        files.append(
+            BilaraFile(
+                folder=folder,
+                group=_classify(relative_parts, groups),
+                file_key=os.path.splitext(relative_parts[-1])[0],
+                relative_path=relative_path,
+                size=info.size,
+                mtime_ns=info.mtime_ns,
+                sha=_resolve_sha(info, relative_path, previous, source),
+            )
+        )
+    return files
+
+
+def scan_bilara_tree(
+    base_path: Path,
+    folders: List[str],
+    groups_config: List[Dict[str, List[str]]],
+    source: SourceBackend,
+    relative_base: Path,
+    previous: Optional[Dict[str, Dict[str, Any]]] = None,
+    workers: Optional[int] = None,
+) -> List[BilaraFile]:
+    groups = compile_groups(groups_config)
+    previous = previous or {}
+    max_workers = max(1, min(workers or len(folders), len(folders) or 1))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda folder: _scan_folder(
+                folder, base_path / folder, relative_base, groups, previous, source
+            ),
+            folders,
+        )
+        files = [
+            bilara_file for folder_files in results for bilara_file in folder_files
+        ]
+
+    reused = sum(
+        1 for f in files if previous.get(f.relative_path, {}).get("sha") == f.sha
+    )
+    log.info(
+        f"Đã quét {len(files)} file JSON trong {len(folders)} thư mục "
+        f"({reused} hash không đổi so với lần trước)."
+    )
+    return files
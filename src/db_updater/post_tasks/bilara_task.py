@@ -1,32 +1,52 @@
 # Path: src/db_updater/post_tasks/bilara_task.py
-import json
 import logging
+import sqlite3
 from pathlib import Path
-from typing import Any, Dict
-
-from natsort import natsorted
+from typing import Any, Dict, List
 
 from src.config import constants
+from src.shared import (
+    ManifestEntry,
+    ManifestStore,
+    SourceBackend,
+    atomic_artifact,
+    natsorted,
+    open_source,
+    write_json,
+)
+
+from .bilara import (
+    DEFAULT_GROUP,
+    BilaraFile,
+    compile_groups,
+    load_files_manifest,
+    scan_bilara_tree,
+)
 
 log = logging.getLogger(__name__)
 
 
 def run(task_config: Dict):
-    process_bilara_data(task_config, constants.PROJECT_ROOT)
-
+    with open_source(task_config.get("source")) as source:
+        process_bilara_data(task_config, constants.PROJECT_ROOT, source)
 
-def _write_json_output(output_path: Path, data: Dict[str, Any], data_name: str):
-    cleaned_data = {folder: files for folder, files in data.items() if files}
 
-    if cleaned_data:
+def _sort_group_map(data: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+    sorted_data = {}
+    for folder, files in data.items():
+        if not files:
+            continue
+        sorted_keys = natsorted(files.keys())
+        sorted_data[folder] = {key: files[key] for key in sorted_keys}
+    return sorted_data
 
-        sorted_data = {}
-        for folder, files in cleaned_data.items():
 
-            sorted_keys = natsorted(files.keys())
+def _write_json_output(
+    output_path: Path, data: Dict[str, Any], data_name: str, compact: bool = False
+):
+    sorted_data = _sort_group_map(data)
 
-            sorted_files = {key: files[key] for key in sorted_keys}
-            sorted_data[folder] = sorted_files
+    if sorted_data:
 
         total_files = sum(len(files) for files in sorted_data.values())
         log.info(
@@ -34,9 +54,7 @@ def _write_json_output(output_path: Path, data: Dict[str, Any], data_name: str):
         )
         output_path.parent.mkdir(parents=True, exist_ok=True)
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-
-                json.dump(sorted_data, f, ensure_ascii=False, indent=2)
+            write_json(output_path, sorted_data, compact)
             log.info(f"✅ Đã tạo file tổng hợp Bilara ({data_name}) thành công.")
         except IOError as e:
             log.error(f"Không thể ghi file JSON ({data_name}): {e}")
@@ -44,12 +62,71 @@ def _write_json_output(output_path: Path, data: Dict[str, Any], data_name: str):
         log.warning(f"Không tìm thấy file JSON nào cho nhóm '{data_name}'.")
 
 
-def process_bilara_data(config: Dict, project_root: Path):
+def _write_manifest_store(
+    store_path: Path,
+    output_maps: Dict[str, Dict[str, Dict[str, str]]],
+    files: List[BilaraFile],
+):
+    stats = {f.relative_path: f for f in files}
+    entries = []
+    for group_name, data_map in output_maps.items():
+        for folder, file_map in _sort_group_map(data_map).items():
+            for file_key, relative_path in file_map.items():
+                bilara_file = stats[relative_path]
+                entries.append(
+                    ManifestEntry(
+                        manifest=group_name,
+                        folder=folder,
+                        file_key=file_key,
+                        relative_path=relative_path,
+                        size=bilara_file.size,
+                        mtime_ns=bilara_file.mtime_ns,
+                        sha=bilara_file.sha,
+                    )
+                )
+    try:
+        with atomic_artifact(store_path) as temp_path:
+            with ManifestStore(temp_path) as store:
+                store.replace_all(entries)
+        log.info(f"✅ Đã tạo manifest store Bilara: {store_path}")
+    except sqlite3.Error as e:
+        log.error(f"Không thể ghi manifest store Bilara: {e}")
+
+
+def _load_previous_stats(
+    store_path: Path | None, files_manifest_path: Path | None
+) -> Dict[str, Dict[str, Any]]:
+    if store_path and store_path.exists():
+        try:
+            with ManifestStore(store_path, read_only=True) as store:
+                return store.file_stats()
+        except sqlite3.Error as e:
+            log.warning(f"Không thể đọc manifest store cũ {store_path}: {e}")
+    return load_files_manifest(files_manifest_path)
+
+
+def _write_files_manifest(
+    output_path: Path, files: List[BilaraFile], compact: bool = False
+):
+    manifest = {
+        f.relative_path: {"size": f.size, "mtime_ns": f.mtime_ns, "sha": f.sha}
+        for f in sorted(files, key=lambda f: f.relative_path)
+    }
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        write_json(output_path, manifest, compact)
+        log.info(f"✅ Đã ghi manifest {len(manifest)} file Bilara vào: {output_path}")
+    except IOError as e:
+        log.error(f"Không thể ghi manifest file Bilara: {e}")
+
+
+def process_bilara_data(config: Dict, project_root: Path, source: SourceBackend):
     try:
         base_path = project_root / config["path"]
         folders_to_scan = config["folders"]
         output_config = config["output"]
         groups_config = config.get("groups", [])
+        compact = bool(config.get("compact", False))
 
     except KeyError as e:
         log.error(f"Thiếu key bắt buộc trong cấu hình 'bilara': {e}")
@@ -57,46 +134,41 @@ def process_bilara_data(config: Dict, project_root: Path):
 
     log.info(f"Bắt đầu quét dữ liệu Bilara từ: {base_path}")
 
-    output_maps = {}
-
-    output_maps["sutta"] = {folder: {} for folder in folders_to_scan}
-
-    for group in groups_config:
-        group_name = list(group.keys())[0]
-        output_maps[group_name] = {folder: {} for folder in folders_to_scan}
-
-    relative_base = base_path.parent.parent
-
-    for folder in folders_to_scan:
-        scan_dir = base_path / folder
-        if not scan_dir.is_dir():
-            log.warning(f"Thư mục không tồn tại, bỏ qua: {scan_dir}")
-            continue
-
-        log.debug(f"Đang quét trong {scan_dir}...")
-        for json_file in scan_dir.glob("**/*.json"):
-            file_key = json_file.stem
-            relative_path = json_file.relative_to(relative_base)
-            path_parts = set(relative_path.parts)
-
-            matched = False
-
-            for group in groups_config:
-                group_name = list(group.keys())[0]
-                keywords = set(list(group.values())[0])
-
-                if not path_parts.isdisjoint(keywords):
-
-                    output_maps[group_name][folder][file_key] = str(relative_path)
-                    matched = True
-
-                    break
-
-            if not matched:
-                output_maps["sutta"][folder][file_key] = str(relative_path)
+    group_names = [DEFAULT_GROUP] + [name for name, _ in compile_groups(groups_config)]
+    output_maps = {
+        group_name: {folder: {} for folder in folders_to_scan}
+        for group_name in group_names
+    }
+
+    files_manifest_path = (
+        project_root / output_config["files"] if "files" in output_config else None
+    )
+    store_path = (
+        project_root / output_config["store"] if "store" in output_config else None
+    )
+    files = scan_bilara_tree(
+        base_path,
+        folders_to_scan,
+        groups_config,
+        source,
+        relative_base=base_path.parent.parent,
+        previous=_load_previous_stats(store_path, files_manifest_path),
+        workers=config.get("workers"),
+    )
+
+    for bilara_file in files:
+        output_maps[bilara_file.group][bilara_file.folder][
+            bilara_file.file_key
+        ] = bilara_file.relative_path
 
     for group_name, data_map in output_maps.items():
 
         if group_name in output_config:
             output_file = project_root / output_config[group_name]
-            _write_json_output(output_file, data_map, group_name.capitalize())
+            _write_json_output(output_file, data_map, group_name.capitalize(), compact)
+
+    if store_path:
+        _write_manifest_store(store_path, output_maps, files)
+
+    if files_manifest_path:
+        _write_files_manifest(files_manifest_path, files, compact)
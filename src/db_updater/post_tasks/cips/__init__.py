@@ -1,11 +1,18 @@
 # Path: src/db_updater/post_tasks/cips/__init__.py
-from .cips_processor import process_tsv
-from .cips_sorter import sort_sutta_index, sort_topic_index
-from .cips_utils import write_json_file
+from .cips_autocomplete import TopicAutocomplete, topic_trigrams
+from .cips_compiler import CipsIndex, compile_cips, write_cips_store
+from .cips_related import build_related_topics, related_topics_to_dict
+from .cips_utils import write_csv_file, write_csv_tables, write_json_file
 
 __all__ = [
-    "process_tsv",
-    "sort_sutta_index",
-    "sort_topic_index",
+    "CipsIndex",
+    "TopicAutocomplete",
+    "build_related_topics",
+    "compile_cips",
+    "related_topics_to_dict",
+    "topic_trigrams",
+    "write_cips_store",
+    "write_csv_file",
+    "write_csv_tables",
     "write_json_file",
 ]
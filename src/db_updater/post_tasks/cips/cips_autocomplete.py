@@ -0,0 +1,166 @@
+# Path: src/db_updater/post_tasks/cips/cips_autocomplete.py
+import bisect
+import heapq
+import logging
+import sqlite3
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+from src.shared import fold_diacritics, read_json
+
+__all__ = [
+    "DEFAULT_FUZZY_THRESHOLD",
+    "TopicAutocomplete",
+    "topic_trigrams",
+]
+
+log = logging.getLogger(__name__)
+
+DEFAULT_LIMIT = 10
+DEFAULT_FUZZY_THRESHOLD = 0.3
+PREFIX_SENTINEL = "\U0010ffff"
+
+
+def topic_trigrams(folded: str) -> Set[str]:
+    trigrams: Set[str] = set()
+    for word in folded.split():
+        padded = f"  {word} "
+        trigrams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+def _word_suffixes(folded: str) -> Iterator[Tuple[int, str]]:
+    start = 0
+    for position, word in enumerate(folded.split(" ")):
+        yield position, folded[start:]
+        start += len(word) + 1
+
+
+class TopicAutocomplete:
+
+    def __init__(
+        self,
+        names: List[str],
+        prefixes: List[Tuple[str, int, int]],
+        postings: Dict[str, List[int]],
+    ):
+        self.names = names
+        self.prefixes = prefixes
+        self.prefix_keys = [key for key, _, _ in prefixes]
+        self.postings = postings
+        self.trigram_counts = Counter(
+            topic_id for ids in postings.values() for topic_id in ids
+        )
+
+    @classmethod
+    def from_names(cls, names: Iterable[str]) -> "TopicAutocomplete":
+        names = list(names)
+        prefixes: List[Tuple[str, int, int]] = []
+        postings: Dict[str, List[int]] = {}
+        for topic_id, name in enumerate(names, 1):
+            folded = fold_diacritics(name)
+            if not folded:
+                continue
+            for position, suffix in _word_suffixes(folded):
+                prefixes.append((suffix, position, topic_id))
+            for trigram in sorted(topic_trigrams(folded)):
+                postings.setdefault(trigram, []).append(topic_id)
+        prefixes.sort()
+        return cls(names, prefixes, postings)
+
+    @classmethod
+    def from_store(cls, db_path: Path) -> "TopicAutocomplete":
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            names = [
+                name
+                for (name,) in conn.execute(
+                    'SELECT name FROM "Cips_Topics" ORDER BY topic_id'
+                )
+            ]
+            prefixes = conn.execute(
+                'SELECT prefix_key, position, topic_id FROM "Cips_Topic_Prefixes" '
+                "ORDER BY prefix_key, position, topic_id"
+            ).fetchall()
+            postings: Dict[str, List[int]] = {}
+            for trigram, topic_id in conn.execute(
+                'SELECT trigram, topic_id FROM "Cips_Topic_Trigrams" '
+                "ORDER BY trigram, topic_id"
+            ):
+                postings.setdefault(trigram, []).append(topic_id)
+        finally:
+            conn.close()
+        return cls(names, prefixes, postings)
+
+    @classmethod
+    def from_json(cls, path: Path) -> "TopicAutocomplete":
+        data = read_json(path)
+        return cls(
+            data["names"],
+            [tuple(entry) for entry in data["prefixes"]],
+            data["trigrams"],
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "names": self.names,
+            "prefixes": [list(entry) for entry in self.prefixes],
+            "trigrams": self.postings,
+        }
+
+    def iter_prefix_rows(self) -> Iterator[Tuple[str, int, int]]:
+        return iter(self.prefixes)
+
+    def iter_trigram_rows(self) -> Iterator[Tuple[str, int]]:
+        for trigram, ids in self.postings.items():
+            for topic_id in ids:
+                yield trigram, topic_id
+
+    def prefix_ids(self, query: str, limit: int = DEFAULT_LIMIT) -> List[int]:
+        folded = fold_diacritics(query)
+        if not folded:
+            return []
+        start = bisect.bisect_left(self.prefix_keys, folded)
+        end = bisect.bisect_left(self.prefix_keys, folded + PREFIX_SENTINEL, start)
+        best: Dict[int, Tuple[int, int]] = {}
+        for _, position, topic_id in self.prefixes[start:end]:
+            rank = (position, topic_id)
+            if topic_id not in best or rank < best[topic_id]:
+                best[topic_id] = rank
+        return [topic_id for _, topic_id in heapq.nsmallest(limit, best.values())]
+
+    def fuzzy_ids(
+        self,
+        query: str,
+        limit: int = DEFAULT_LIMIT,
+        threshold: float = DEFAULT_FUZZY_THRESHOLD,
+    ) -> List[int]:
+        query_trigrams = topic_trigrams(fold_diacritics(query))
+        if not query_trigrams:
+            return []
+        shared: Counter = Counter()
+        for trigram in query_trigrams:
+            shared.update(self.postings.get(trigram, ()))
+
+        query_count = len(query_trigrams)
+        trigram_counts = self.trigram_counts
+        scored = [
+            (-score, topic_id)
+            for topic_id, count in shared.items()
+            if (score := count / (query_count + trigram_counts[topic_id] - count))
+            >= threshold
+        ]
+        return [topic_id for _, topic_id in heapq.nsmallest(limit, scored)]
+
+    def complete(self, query: str, limit: int = DEFAULT_LIMIT) -> List[str]:
+        topic_ids = self.prefix_ids(query, limit)
+        if len(topic_ids) < limit:
+            seen = set(topic_ids)
+            for topic_id in self.fuzzy_ids(query, limit + len(topic_ids)):
+                if topic_id not in seen:
+                    topic_ids.append(topic_id)
+                    seen.add(topic_id)
+                if len(topic_ids) >= limit:
+                    break
+        return [self.names[topic_id - 1] for topic_id in topic_ids]
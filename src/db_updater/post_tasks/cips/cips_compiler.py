@@ -0,0 +1,274 @@
+# Path: src/db_updater/post_tasks/cips/cips_compiler.py
+import csv
+import logging
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.shared import atomic_artifact, encode_json, natural_key, read_cips_schema
+
+from .cips_autocomplete import TopicAutocomplete
+from .cips_parser import parse_row
+
+__all__ = [
+    "CipsIndex",
+    "compile_cips",
+    "write_cips_store",
+]
+
+log = logging.getLogger(__name__)
+
+SegmentMap = Dict[int, List[int]]
+
+
+class CipsIndex:
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self._ranks: List[int] = []
+        self.topics: Dict[int, Tuple[List[int], Dict[int, SegmentMap]]] = {}
+        self.suttas: Dict[int, Dict[int, SegmentMap]] = {}
+
+    def intern(self, value: str) -> int:
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = len(self.strings)
+            self._string_ids[value] = string_id
+            self.strings.append(sys.intern(value))
+        return string_id
+
+    def add_row(self, row: List[str]):
+        parsed = parse_row(row)
+        if parsed.row_type in ("empty", "invalid"):
+            return
+
+        topic_id = self.intern(parsed.main_topic)
+        also_see, contexts = self.topics.setdefault(topic_id, ([], {}))
+
+        if parsed.row_type == "xref":
+            also_see.append(self.intern(parsed.xref_topic))
+        elif parsed.row_type in ("sutta", "custom"):
+            if not (parsed.context and parsed.sutta_uid):
+                return
+            context_id = self.intern(parsed.context)
+            sutta_id = self.intern(parsed.sutta_uid)
+            topic_segments = contexts.setdefault(context_id, {}).setdefault(
+                sutta_id, []
+            )
+            sutta_segments = (
+                self.suttas.setdefault(sutta_id, {})
+                .setdefault(topic_id, {})
+                .setdefault(context_id, [])
+            )
+            if parsed.segment:
+                segment_id = self.intern(parsed.segment)
+                topic_segments.append(segment_id)
+                sutta_segments.append(segment_id)
+
+    def finalize(self) -> "CipsIndex":
+        order = sorted(
+            range(len(self.strings)), key=lambda i: natural_key(self.strings[i])
+        )
+        ranks = [0] * len(self.strings)
+        rank, previous = -1, None
+        for string_id in order:
+            key = natural_key(self.strings[string_id])
+            if key != previous:
+                rank, previous = rank + 1, key
+            ranks[string_id] = rank
+        self._ranks = ranks
+        return self
+
+    def _sorted(self, ids) -> List[int]:
+        return sorted(ids, key=self._ranks.__getitem__)
+
+    def _names(self, ids) -> List[str]:
+        return [self.strings[i] for i in ids]
+
+    def sorted_topics(self) -> List[int]:
+        return self._sorted(self.topics)
+
+    def sorted_suttas(self) -> List[int]:
+        return self._sorted(self.suttas)
+
+    def topic_index(self) -> Dict[str, Any]:
+        index = {}
+        for topic_id in self.sorted_topics():
+            also_see, contexts = self.topics[topic_id]
+            index[self.strings[topic_id]] = {
+                "also_see": self._names(self._sorted(dict.fromkeys(also_see))),
+                "contexts": {
+                    self.strings[context_id]: {
+                        self.strings[sutta_id]: self._names(
+                            self._sorted(dict.fromkeys(contexts[context_id][sutta_id]))
+                        )
+                        for sutta_id in self._sorted(contexts[context_id])
+                    }
+                    for context_id in self._sorted(contexts)
+                },
+            }
+        return index
+
+    def _topic_order(self, topics: Dict[int, SegmentMap]) -> List[int]:
+        ranks = self._ranks
+
+        def sort_key(topic_id: int):
+            segments = [s for seg_list in topics[topic_id].values() for s in seg_list]
+            if not segments:
+                return (1, ranks[topic_id], -1)
+            return (0, min(ranks[s] for s in segments), ranks[topic_id])
+
+        return sorted(topics, key=sort_key)
+
+    def iter_sutta_entries(self) -> Iterator[Tuple[int, int, int, List[int]]]:
+        for sutta_id in self.sorted_suttas():
+            topics = self.suttas[sutta_id]
+            for topic_id in self._topic_order(topics):
+                for context_id in self._sorted(topics[topic_id]):
+                    yield sutta_id, topic_id, context_id, self._sorted(
+                        topics[topic_id][context_id]
+                    )
+
+    def sutta_index(self) -> Dict[str, Any]:
+        index: Dict[str, Any] = {}
+        for sutta_id, topic_id, context_id, segments in self.iter_sutta_entries():
+            index.setdefault(self.strings[sutta_id], {}).setdefault(
+                self.strings[topic_id], {}
+            )[self.strings[context_id]] = self._names(segments)
+        return index
+
+    def airtable_tables(self) -> Dict[str, List[Dict[str, Any]]]:
+        strings = self.strings
+        unique_segments = set()
+        for _, contexts in self.topics.values():
+            for sutta_map in contexts.values():
+                for sutta_id, segments in sutta_map.items():
+                    if segments:
+                        unique_segments.update(
+                            (strings[sutta_id], strings[s]) for s in segments
+                        )
+                    else:
+                        unique_segments.add((strings[sutta_id], ""))
+
+        pairs = [
+            (strings[sutta_id], strings[topic_id])
+            for sutta_id, topics in self.suttas.items()
+            for topic_id in topics
+        ]
+
+        return {
+            "topics": [{"topic_name": strings[i]} for i in self.sorted_topics()],
+            "suttas": [{"sutta_uid": strings[i]} for i in self.sorted_suttas()],
+            "segments": [
+                {"ID": f"Seg-{i}", "sutta_uid": sutta_uid, "segment_id": segment_id}
+                for i, (sutta_uid, segment_id) in enumerate(sorted(unique_segments), 1)
+            ],
+            "links": [
+                {"ID": i, "sutta_uid": sutta_uid, "topic_name": topic_name}
+                for i, (sutta_uid, topic_name) in enumerate(sorted(pairs), 1)
+            ],
+            "reverse_links": [
+                {"topic_name": topic_name, "sutta_uid": sutta_uid}
+                for topic_name, sutta_uid in sorted(
+                    (topic_name, sutta_uid) for sutta_uid, topic_name in pairs
+                )
+            ],
+        }
+
+    def autocomplete(self) -> TopicAutocomplete:
+        return TopicAutocomplete.from_names(self._names(self.sorted_topics()))
+
+    def iter_topic_rows(self) -> Iterator[Tuple[int, str, str]]:
+        for position, topic_id in enumerate(self.sorted_topics(), 1):
+            also_see = self._names(
+                self._sorted(dict.fromkeys(self.topics[topic_id][0]))
+            )
+            yield (
+                position,
+                self.strings[topic_id],
+                (
+                    encode_json(also_see, compact=True).decode("utf-8")
+                    if also_see
+                    else None
+                ),
+            )
+
+    def iter_link_rows(self) -> Iterator[Tuple[str, int, str, str, int]]:
+        topic_positions = {
+            topic_id: position
+            for position, topic_id in enumerate(self.sorted_topics(), 1)
+        }
+        position = 0
+        for sutta_id, topic_id, context_id, segments in self.iter_sutta_entries():
+            for segment_id in segments or [None]:
+                yield (
+                    self.strings[sutta_id],
+                    topic_positions[topic_id],
+                    self.strings[context_id],
+                    self.strings[segment_id] if segment_id is not None else "",
+                    position,
+                )
+                position += 1
+
+
+def compile_cips(tsv_path: Path) -> CipsIndex:
+    index = CipsIndex()
+    with open(tsv_path, mode="r", encoding="utf-8") as tsvfile:
+        for row in csv.reader(tsvfile, delimiter="\t"):
+            index.add_row(row)
+    index.finalize()
+    log.info(
+        f"Đã biên dịch CIPS: {len(index.topics)} chủ đề, {len(index.suttas)} sutta, "
+        f"{len(index.strings)} chuỗi duy nhất."
+    )
+    return index
+
+
+def write_cips_store(
+    index: CipsIndex,
+    output_path: Path,
+    related: Optional[List[Tuple[int, int, int, int, float]]] = None,
+) -> Tuple[int, int]:
+    with atomic_artifact(output_path) as temp_path:
+        conn = sqlite3.connect(temp_path)
+        try:
+            conn.executescript(read_cips_schema())
+            topic_rows = list(index.iter_topic_rows())
+            conn.executemany(
+                'INSERT INTO "Cips_Topics" (topic_id, name, also_see) VALUES (?, ?, ?)',
+                topic_rows,
+            )
+            cursor = conn.executemany(
+                'INSERT OR IGNORE INTO "Cips_Links" '
+                "(sutta_uid, topic_id, context, segment, position) VALUES (?, ?, ?, ?, ?)",
+                index.iter_link_rows(),
+            )
+            link_count = cursor.rowcount
+            autocomplete = index.autocomplete()
+            conn.executemany(
+                'INSERT INTO "Cips_Topic_Prefixes" (prefix_key, position, topic_id) '
+                "VALUES (?, ?, ?)",
+                autocomplete.iter_prefix_rows(),
+            )
+            conn.executemany(
+                'INSERT INTO "Cips_Topic_Trigrams" (trigram, topic_id) VALUES (?, ?)',
+                autocomplete.iter_trigram_rows(),
+            )
+            if related:
+                conn.executemany(
+                    'INSERT INTO "Cips_Related_Topics" '
+                    "(topic_id, rank, related_topic_id, cooccurrence, pmi) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    related,
+                )
+            conn.commit()
+        finally:
+            conn.close()
+
+    log.info(
+        f"✅ Đã ghi {len(topic_rows)} chủ đề và {link_count} liên kết CIPS vào: "
+        f"{output_path}"
+    )
+    return len(topic_rows), link_count
@@ -0,0 +1,101 @@
+# Path: src/db_updater/post_tasks/cips/cips_related.py
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:
+    np = None
+    sparse = None
+
+from .cips_compiler import CipsIndex
+
+__all__ = [
+    "DEFAULT_MIN_COUNT",
+    "DEFAULT_TOP_K",
+    "build_related_topics",
+    "related_topics_to_dict",
+]
+
+log = logging.getLogger(__name__)
+
+DEFAULT_TOP_K = 10
+DEFAULT_MIN_COUNT = 2
+
+RelatedRow = Tuple[int, int, int, int, float]
+
+
+def build_related_topics(
+    index: CipsIndex,
+    top_k: int = DEFAULT_TOP_K,
+    min_count: int = DEFAULT_MIN_COUNT,
+) -> Optional[List[RelatedRow]]:
+    if np is None or sparse is None:
+        log.warning(
+            "⚠️  Cần numpy và scipy để tính chủ đề liên quan "
+            "(pip install -r requirements.extra.txt). Bỏ qua."
+        )
+        return None
+
+    topic_positions = {
+        topic_id: position for position, topic_id in enumerate(index.sorted_topics())
+    }
+    rows: List[int] = []
+    cols: List[int] = []
+    for column, topics in enumerate(index.suttas.values()):
+        rows.extend(topic_positions[topic_id] for topic_id in topics)
+        cols.extend([column] * len(topics))
+
+    if not rows:
+        return []
+
+    incidence = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float64), (rows, cols)),
+        shape=(len(topic_positions), len(index.suttas)),
+    )
+    sutta_counts = np.asarray(incidence.sum(axis=1)).ravel()
+    cooccurrence = (incidence @ incidence.T).tocoo()
+
+    source, target, counts = cooccurrence.row, cooccurrence.col, cooccurrence.data
+    mask = (source != target) & (counts >= min_count)
+    source, target, counts = source[mask], target[mask], counts[mask]
+
+    pmi = np.log(
+        counts * len(index.suttas) / (sutta_counts[source] * sutta_counts[target])
+    )
+    order = np.lexsort((target, -counts, -pmi, source))
+    source, target, counts, pmi = (
+        source[order],
+        target[order],
+        counts[order],
+        pmi[order],
+    )
+    ranks = np.arange(len(source)) - np.searchsorted(source, source, side="left")
+    keep = ranks < top_k
+
+    related = [
+        (int(s) + 1, int(r) + 1, int(t) + 1, int(c), round(float(p), 6))
+        for s, r, t, c, p in zip(
+            source[keep], ranks[keep], target[keep], counts[keep], pmi[keep]
+        )
+    ]
+    log.info(
+        f"Đã tính {len(related)} cặp chủ đề liên quan "
+        f"(top {top_k}, đồng xuất hiện tối thiểu {min_count}) "
+        f"từ ma trận {incidence.shape[0]}×{incidence.shape[1]} "
+        f"({incidence.nnz} phần tử khác 0)."
+    )
+    return related
+
+
+def related_topics_to_dict(
+    index: CipsIndex, related: List[RelatedRow]
+) -> Dict[str, List[Dict[str, Any]]]:
+    names = [index.strings[topic_id] for topic_id in index.sorted_topics()]
+    data: Dict[str, List[Dict[str, Any]]] = {}
+    for topic_id, _, related_id, count, pmi in related:
+        data.setdefault(names[topic_id - 1], []).append(
+            {"topic": names[related_id - 1], "count": count, "pmi": pmi}
+        )
+    return data
@@ -1,15 +1,19 @@
 # Path: src/db_updater/post_tasks/cips/cips_utils.py
-import json
+import csv
 import logging
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, List
 
-__all__ = ["write_json_file"]
+from src.shared import atomic_artifact, write_json
+
+__all__ = ["write_csv_file", "write_csv_tables", "write_json_file"]
 
 log = logging.getLogger(__name__)
 
 
-def write_json_file(data: Dict, output_file: Path, file_type: str):
+def write_json_file(
+    data: Dict, output_file: Path, file_type: str, compact: bool = False
+):
     if not data:
         log.warning(f"Không có dữ liệu để ghi cho file {file_type}.")
         return
@@ -17,8 +21,32 @@ def write_json_file(data: Dict, output_file: Path, file_type: str):
     log.info(f"Đang ghi {len(data)} mục vào file {file_type}: {output_file}")
     output_file.parent.mkdir(parents=True, exist_ok=True)
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        write_json(output_file, data, compact)
         log.info(f"✅ Đã tạo file {file_type} thành công.")
     except IOError as e:
         log.error(f"Không thể ghi file {file_type}: {e}")
+
+
+def write_csv_file(data: List[Dict[str, Any]], output_file: Path, file_type: str):
+    if not data:
+        log.warning(f"Không có dữ liệu để ghi cho file CSV {file_type}.")
+        return
+    log.info(f"Đang ghi {len(data)} dòng vào file {file_type}: {output_file}")
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with atomic_artifact(output_file) as temp_path:
+            with open(temp_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=data[0].keys())
+                writer.writeheader()
+                writer.writerows(data)
+        log.info(f"✅ Đã tạo file CSV {file_type} thành công.")
+    except (IOError, IndexError) as e:
+        log.error(f"Không thể ghi file CSV {file_type}: {e}")
+
+
+def write_csv_tables(
+    tables: Dict[str, List[Dict[str, Any]]], output_paths: Dict[str, Path]
+):
+    for name, rows in tables.items():
+        if output_paths.get(name):
+            write_csv_file(rows, output_paths[name], name)
@@ -5,9 +5,11 @@ from typing import Any, Dict
 from src.config import constants
 
 from .cips import (
-    process_tsv,
-    sort_sutta_index,
-    sort_topic_index,
+    build_related_topics,
+    compile_cips,
+    related_topics_to_dict,
+    write_cips_store,
+    write_csv_tables,
     write_json_file,
 )
 
@@ -55,20 +57,60 @@ def run(task_config: Dict[str, Any]):
         log.error(f"Lỗi cấu hình 'cips-json': thiếu key {e}")
         return
 
-    log.info(f"Bắt đầu xử lý file TSV để tạo 2 chỉ mục từ: {tsv_path}")
+    log.info(f"Bắt đầu biên dịch file TSV CIPS (một lượt) từ: {tsv_path}")
 
-    topic_index, sutta_index = process_tsv(tsv_path)
+    try:
+        index = compile_cips(tsv_path)
+    except Exception as e:
+        log.error(f"Lỗi khi xử lý file TSV: {e}", exc_info=True)
+        return
 
-    if not topic_index and not sutta_index:
+    if not index.topics and not index.suttas:
         log.warning("Không có dữ liệu nào được xử lý từ file TSV.")
         return
 
-    log.info("Đang sắp xếp dữ liệu chỉ mục...")
-
-    sorted_topic_index = sort_topic_index(topic_index)
-    sorted_sutta_index = sort_sutta_index(sutta_index)
-
-    write_json_file(sorted_topic_index, topic_output_file, "topic-index")
-    write_json_file(sorted_sutta_index, sutta_output_file, "sutta-index")
+    write_json_file(index.topic_index(), topic_output_file, "topic-index")
+    write_json_file(index.sutta_index(), sutta_output_file, "sutta-index")
+
+    related = None
+    related_config = task_config.get("related")
+    if isinstance(related_config, dict):
+        related = build_related_topics(
+            index,
+            top_k=related_config.get("top_k", 10),
+            min_count=related_config.get("min_count", 2),
+        )
+
+    related_path_str = output_config.get("related")
+    if related and isinstance(related_path_str, str):
+        write_json_file(
+            related_topics_to_dict(index, related),
+            project_root / related_path_str,
+            "related-topics",
+        )
+
+    store_path_str = output_config.get("store")
+    if isinstance(store_path_str, str):
+        write_cips_store(index, project_root / store_path_str, related)
+
+    autocomplete_path_str = output_config.get("autocomplete")
+    if isinstance(autocomplete_path_str, str):
+        write_json_file(
+            index.autocomplete().to_dict(),
+            project_root / autocomplete_path_str,
+            "autocomplete",
+            compact=True,
+        )
+
+    airtable_config = output_config.get("airtable")
+    if airtable_config:
+        write_csv_tables(
+            index.airtable_tables(),
+            {
+                key: project_root / value
+                for item in airtable_config
+                for key, value in item.items()
+            },
+        )
 
     log.info("Hoàn tất tác vụ CIPS.")
@@ -0,0 +1,93 @@
+# Path: src/db_updater/post_tasks/dpd_lemma_task.py
+import logging
+import re
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from src.config import constants
+from src.shared import JSONDecodeError, decode_json, normalize_pali, write_json
+
+__all__ = ["run"]
+
+log = logging.getLogger(__name__)
+
+LEMMA_NUMBER_RE = re.compile(r"\s+\d+(\.\d+)*$")
+
+
+def _clean_lemma(lemma: str) -> str:
+    return LEMMA_NUMBER_RE.sub("", lemma).strip()
+
+
+def _load_lemmas(conn: sqlite3.Connection) -> Dict[int, str]:
+    rows = conn.execute("SELECT id, lemma_1 FROM dpd_headwords")
+    return {int(headword_id): lemma for headword_id, lemma in rows if lemma}
+
+
+def _load_forms(
+    conn: sqlite3.Connection, lemmas: Dict[int, str]
+) -> Tuple[Dict[str, List[int]], int]:
+    forms: Dict[str, set] = {}
+    skipped = 0
+    rows = conn.execute(
+        "SELECT lookup_key, headwords FROM lookup "
+        "WHERE headwords IS NOT NULL AND headwords != ''"
+    )
+    for lookup_key, headwords_json in rows:
+        try:
+            headword_ids = decode_json(headwords_json)
+        except JSONDecodeError:
+            skipped += 1
+            continue
+        valid_ids = {int(i) for i in headword_ids if int(i) in lemmas}
+        if not valid_ids:
+            continue
+        forms.setdefault(normalize_pali(lookup_key), set()).update(valid_ids)
+    return {form: sorted(ids) for form, ids in sorted(forms.items())}, skipped
+
+
+def build_form_lemma_index(db_path: Path) -> Dict:
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        lemmas = _load_lemmas(conn)
+        forms, skipped = _load_forms(conn, lemmas)
+    finally:
+        conn.close()
+
+    if skipped:
+        log.warning(f"Bỏ qua {skipped} dòng lookup có headwords không hợp lệ.")
+
+    used_ids = {i for ids in forms.values() for i in ids}
+    return {
+        "lemmas": {
+            str(headword_id): [lemmas[headword_id], _clean_lemma(lemmas[headword_id])]
+            for headword_id in sorted(used_ids)
+        },
+        "forms": forms,
+    }
+
+
+def run(task_config: dict):
+    try:
+        project_root = constants.PROJECT_ROOT
+        db_path = project_root / task_config["path"]
+        output_path = project_root / task_config["output"]
+
+        if not db_path.exists():
+            log.error(f"Không tìm thấy database DPD: {db_path}")
+            return
+
+        log.info(f"Bắt đầu xây dựng bảng tra dạng từ → lemma từ: {db_path}")
+        index = build_form_lemma_index(db_path)
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        write_json(output_path, index, compact=True)
+        log.info(
+            f"✅ Đã lưu {len(index['forms'])} dạng từ và "
+            f"{len(index['lemmas'])} lemma vào: {output_path}"
+        )
+
+    except sqlite3.Error as e:
+        log.error(f"Lỗi khi đọc database DPD: {e}")
+    except Exception as e:
+        log.exception(f"Đã xảy ra lỗi không mong muốn khi xử lý DPD lemma: {e}")
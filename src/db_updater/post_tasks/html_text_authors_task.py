@@ -1,5 +1,4 @@
 # Path: src/db_updater/post_tasks/html_text_authors_task.py
-import json
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
@@ -8,16 +7,24 @@ from typing import Any, Dict, List, Optional, Tuple
 from bs4 import BeautifulSoup
 
 from src.config import constants
+from src.shared import (
+    SourceBackend,
+    TranslationIdResolver,
+    artifact_exists,
+    open_source,
+    write_json,
+)
 
 log = logging.getLogger(__name__)
 
+MANIFEST_ROOT = ("suttacentral-data", "html_text")
+
 
 def _process_file(
-    html_file: Path, base_path: Path
+    html_file: Path, base_path: Path, source: SourceBackend
 ) -> Tuple[Optional[tuple], Optional[str]]:
     try:
-        with open(html_file, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = source.read_text(html_file)
 
         soup = BeautifulSoup(content, "html.parser")
         meta_tag = soup.find("meta", attrs={"name": "author"})
@@ -49,10 +56,13 @@ def _process_file(
 
 
 def run(task_config: Dict):
-    process_html_text_authors_data(task_config, constants.PROJECT_ROOT)
+    with open_source(task_config.get("source")) as source:
+        process_html_text_authors_data(task_config, constants.PROJECT_ROOT, source)
 
 
-def process_html_text_authors_data(config: Dict, project_root: Path):
+def process_html_text_authors_data(
+    config: Dict, project_root: Path, source: SourceBackend
+):
     try:
         base_path = project_root / config["path"]
         output_file = project_root / config["output"]
@@ -61,11 +71,11 @@ def process_html_text_authors_data(config: Dict, project_root: Path):
         log.error(f"Thiếu key bắt buộc trong cấu hình 'html_text': {e}")
         return
 
-    if not base_path.is_dir():
+    if not source.is_dir(base_path):
         log.error(f"Thư mục nguồn cho 'html_text' không tồn tại: {base_path}")
         return
 
-    ignore_paths = [base_path.joinpath(p).resolve() for p in ignore_list]
+    ignore_paths = [base_path.joinpath(p) for p in ignore_list]
     log.info(f"Các thư mục sẽ bị bỏ qua: {ignore_paths}")
 
     log.info(f"Bắt đầu quét file HTML từ: {base_path} (tuần tự)")
@@ -73,11 +83,10 @@ def process_html_text_authors_data(config: Dict, project_root: Path):
     total_files_scanned = 0
     ignored_files_count = 0
 
-    for html_file in base_path.glob("**/*.html"):
+    for html_file in source.iter_files(base_path, ".html"):
         total_files_scanned += 1
         is_ignored = any(
-            html_file.resolve().is_relative_to(ignored_dir)
-            for ignored_dir in ignore_paths
+            html_file.is_relative_to(ignored_dir) for ignored_dir in ignore_paths
         )
         if is_ignored:
             ignored_files_count += 1
@@ -99,7 +108,7 @@ def process_html_text_authors_data(config: Dict, project_root: Path):
     with ThreadPoolExecutor() as executor:
 
         futures = {
-            executor.submit(_process_file, html_file, base_path): html_file
+            executor.submit(_process_file, html_file, base_path, source): html_file
             for html_file in files_to_process
         }
 
@@ -127,13 +136,40 @@ def process_html_text_authors_data(config: Dict, project_root: Path):
         )
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        final_output = {"suttacentral-data": {"html_text": author_map}}
+        final_output = {MANIFEST_ROOT[0]: {MANIFEST_ROOT[1]: author_map}}
 
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(final_output, f, ensure_ascii=False, indent=2)
+            write_json(output_file, final_output, bool(config.get("compact", False)))
             log.info(f"✅ Đã tạo file tổng hợp tại: {output_file}")
         except IOError as e:
             log.error(f"Không thể ghi file JSON: {e}")
     else:
         log.warning("Không trích xuất được thông tin tác giả từ bất kỳ file HTML nào.")
+        return
+
+    if config.get("suttaplex") and config.get("unmatched_report"):
+        report_unmatched_files(
+            processed_results,
+            project_root / config["suttaplex"],
+            project_root / config["unmatched_report"],
+        )
+
+
+def report_unmatched_files(
+    processed_results: List[Tuple[tuple, str]],
+    suttaplex_path: Path,
+    report_path: Path,
+):
+    if not artifact_exists(suttaplex_path):
+        log.warning(
+            f"Không tìm thấy suttaplex để đối chiếu translation_uid: {suttaplex_path}"
+        )
+        return
+
+    resolver = TranslationIdResolver.from_suttaplex_file(suttaplex_path)
+    matched = 0
+    for path_parts, author in processed_results:
+        if resolver.resolve_file("/".join(MANIFEST_ROOT + path_parts), author):
+            matched += 1
+    resolver.log_summary(matched)
+    resolver.write_report(report_path)
@@ -1,5 +1,11 @@
 # Path: src/db_updater/post_tasks/parallels/__init__.py
-from .parallels_processor import build_initial_map
+from .parallels_clusters import UnionFind, build_clusters
+from .parallels_groups import ParallelGroup, ParallelGroups
+from .parallels_intervals import (
+    build_interval_index,
+    find_covering,
+    parse_segment_range,
+)
 from .parallels_transformer import (
     create_book_structure,
     flatten_segment_map,
@@ -8,9 +14,15 @@ from .parallels_transformer import (
 from .parallels_utils import sort_data_naturally
 
 __all__ = [
-    "build_initial_map",
+    "ParallelGroup",
+    "ParallelGroups",
+    "UnionFind",
+    "build_clusters",
+    "build_interval_index",
     "create_book_structure",
+    "find_covering",
     "flatten_segment_map",
     "invert_to_segment_structure",
+    "parse_segment_range",
     "sort_data_naturally",
 ]
@@ -0,0 +1,95 @@
+# Path: src/db_updater/post_tasks/parallels/parallels_clusters.py
+from typing import Callable, Dict, Iterable, List
+
+from src.shared import natural_key
+
+from . import parallels_utils
+from .parallels_groups import ParallelGroups
+
+__all__ = ["UnionFind", "build_clusters"]
+
+
+class UnionFind:
+
+    def __init__(self):
+        self.parent: Dict[str, str] = {}
+        self.size: Dict[str, int] = {}
+
+    def add(self, item: str):
+        if item not in self.parent:
+            self.parent[item] = item
+            self.size[item] = 1
+
+    def find(self, item: str) -> str:
+        self.add(item)
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: str, b: str):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+
+    def union_all(self, items: Iterable[str]):
+        first = None
+        for item in items:
+            if first is None:
+                first = item
+                self.add(item)
+            else:
+                self.union(first, item)
+
+    def components(self) -> List[List[str]]:
+        members: Dict[str, List[str]] = {}
+        for item in self.parent:
+            members.setdefault(self.find(item), []).append(item)
+        clusters = [sorted(group, key=natural_key) for group in members.values()]
+        clusters.sort(key=lambda group: natural_key(group[0]))
+        return clusters
+
+
+def _to_output(union_find: UnionFind) -> dict:
+    clusters = union_find.components()
+    ids = {
+        member: cluster_id
+        for cluster_id, members in enumerate(clusters)
+        for member in members
+    }
+    return {
+        "ids": {key: ids[key] for key in sorted(ids, key=natural_key)},
+        "clusters": clusters,
+    }
+
+
+def _build_level(
+    groups: ParallelGroups, relation: str, to_node: Callable[[str], str]
+) -> dict:
+    union_find = UnionFind()
+    for group in groups.groups:
+        if not group.members:
+            continue
+        if relation == "parallels" and group.relation == "parallels":
+            union_find.union_all(to_node(member) for member in group.members)
+        elif relation == "resembles" and group.resembling_relation == "resembles":
+            for target in group.resembling:
+                union_find.union_all(
+                    [to_node(target)] + [to_node(member) for member in group.members]
+                )
+    return _to_output(union_find)
+
+
+def build_clusters(groups: ParallelGroups) -> dict:
+    return {
+        relation: {
+            "sutta": _build_level(groups, relation, parallels_utils.parse_sutta_id),
+            "segment": _build_level(groups, relation, lambda full_id: full_id),
+        }
+        for relation in ("parallels", "resembles")
+    }
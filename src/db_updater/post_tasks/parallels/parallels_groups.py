@@ -0,0 +1,124 @@
+# Path: src/db_updater/post_tasks/parallels/parallels_groups.py
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple
+
+from . import parallels_utils
+
+__all__ = ["ParallelGroup", "ParallelGroups"]
+
+GROUP_RELATIONS = ("parallels", "mentions", "retells")
+
+
+@dataclass(frozen=True)
+class ParallelGroup:
+    relation: str
+    members: Tuple[str, ...]
+    resembling: Tuple[str, ...]
+
+    @property
+    def resembling_relation(self) -> str:
+        return "resembles" if self.relation == "parallels" else self.relation
+
+    def to_dict(self) -> dict:
+        data: dict = {"relation": self.relation, "members": list(self.members)}
+        if self.resembling:
+            data["resembling"] = list(self.resembling)
+        return data
+
+
+class ParallelGroups:
+
+    def __init__(self, groups: List[ParallelGroup]):
+        self.groups = groups
+        self._member_index: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self._resembling_index: Dict[str, List[int]] = defaultdict(list)
+        self._base_index: Dict[str, List[str]] = defaultdict(list)
+
+        for group_id, group in enumerate(groups):
+            for position, member in enumerate(group.members):
+                self._index_id(member)
+                self._member_index[member].append((group_id, position))
+            if group.members:
+                for cleaned in group.resembling:
+                    self._index_id(cleaned)
+                    self._resembling_index[cleaned].append(group_id)
+
+    def _index_id(self, full_id: str):
+        if full_id not in self._member_index and full_id not in self._resembling_index:
+            self._base_index[parallels_utils.parse_sutta_id(full_id)].append(full_id)
+
+    @classmethod
+    def from_data(cls, data: list) -> "ParallelGroups":
+        groups = []
+        for entry in data:
+            relation = list(entry.keys())[0]
+            if relation not in GROUP_RELATIONS:
+                continue
+            id_list = entry[relation]
+            groups.append(
+                ParallelGroup(
+                    relation=relation,
+                    members=tuple(i for i in id_list if not i.startswith("~")),
+                    resembling=tuple(
+                        i.lstrip("~") for i in id_list if i.startswith("~")
+                    ),
+                )
+            )
+        return cls(groups)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ParallelGroups":
+        return cls(
+            [
+                ParallelGroup(
+                    relation=group["relation"],
+                    members=tuple(group["members"]),
+                    resembling=tuple(group.get("resembling", [])),
+                )
+                for group in data.get("groups", [])
+            ]
+        )
+
+    def to_dict(self) -> dict:
+        return {"groups": [group.to_dict() for group in self.groups]}
+
+    def base_ids(self) -> List[str]:
+        return list(self._base_index)
+
+    def all_ids(self) -> Iterator[str]:
+        for full_ids in self._base_index.values():
+            yield from full_ids
+
+    def full_ids(self, base_id: str) -> List[str]:
+        return self._base_index.get(base_id, [])
+
+    def relations_for(self, full_id: str) -> Dict[str, List[str]]:
+        relations: Dict[str, List[str]] = defaultdict(list)
+
+        for group_id, position in self._member_index.get(full_id, []):
+            group = self.groups[group_id]
+            relations[group.relation].extend(
+                member for i, member in enumerate(group.members) if i != position
+            )
+            relations[group.resembling_relation].extend(group.resembling)
+
+        for group_id in self._resembling_index.get(full_id, []):
+            group = self.groups[group_id]
+            relations[group.resembling_relation].extend(group.members)
+
+        return {relation: targets for relation, targets in relations.items() if targets}
+
+    def iter_relations(self) -> Iterator[Tuple[str, str, Dict[str, List[str]]]]:
+        for base_id, full_ids in self._base_index.items():
+            for full_id in full_ids:
+                relations = self.relations_for(full_id)
+                if relations:
+                    yield base_id, full_id, relations
+
+    def to_sutta_map(self) -> defaultdict:
+        sutta_map = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+        for base_id, full_id, relations in self.iter_relations():
+            for relation, targets in relations.items():
+                sutta_map[base_id][relation][full_id].extend(targets)
+        return sutta_map
@@ -0,0 +1,159 @@
+# Path: src/db_updater/post_tasks/parallels/parallels_intervals.py
+import logging
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.shared import natural_key
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "SEGMENT_KEY_BASE",
+    "SEGMENT_KEY_DEPTH",
+    "build_interval_index",
+    "find_covering",
+    "parse_segment_range",
+    "segment_key",
+]
+
+SEGMENT_KEY_BASE = 10000
+SEGMENT_KEY_DEPTH = 4
+MAX_SEGMENT_KEY = SEGMENT_KEY_BASE**SEGMENT_KEY_DEPTH - 1
+
+_LEVEL_RE = re.compile(r"\d+|[^\W\d_]+")
+_RANGE_SEPARATOR_RE = re.compile(r"\s*[-–]\s*")
+LINEAR_SCAN_LEVEL = 3
+
+
+def _segment_levels(segment: str) -> List[int]:
+    levels = []
+    for token in _LEVEL_RE.findall(segment):
+        if token.isdigit():
+            levels.append(min(int(token), SEGMENT_KEY_BASE - 1))
+        elif len(token) == 1 and "a" <= token.lower() <= "z":
+            levels.append(ord(token.lower()) - ord("a") + 1)
+        else:
+            raise ValueError(f"Không thể mã hóa segment '{segment}' ('{token}').")
+    return levels
+
+
+def segment_key(levels: List[int], fill_max: bool = False) -> int:
+    fill = SEGMENT_KEY_BASE - 1 if fill_max else 0
+    padded = (levels + [fill] * SEGMENT_KEY_DEPTH)[:SEGMENT_KEY_DEPTH]
+    key = 0
+    for level in padded:
+        key = key * SEGMENT_KEY_BASE + level
+    return key
+
+
+def parse_segment_range(full_id: str) -> Tuple[str, int, int]:
+    uid, _, segment = full_id.lstrip("~").partition("#")
+    if not segment:
+        return uid, 0, MAX_SEGMENT_KEY
+
+    start_text, *rest = _RANGE_SEPARATOR_RE.split(segment, 1)
+    end_text = rest[0] if rest else ""
+    start_levels = _segment_levels(start_text)
+    if not start_levels:
+        return uid, 0, MAX_SEGMENT_KEY
+
+    end_levels = _segment_levels(end_text) if end_text else list(start_levels)
+    if len(end_levels) < len(start_levels):
+        end_levels = start_levels[: len(start_levels) - len(end_levels)] + end_levels
+
+    start, end = segment_key(start_levels), segment_key(end_levels, fill_max=True)
+    if end < start:
+        start, end = end, start
+    return uid, start, end
+
+
+def _root_level(size: int) -> int:
+    return size.bit_length() - 1
+
+
+def _subtree_max_ends(ends: List[int]) -> List[int]:
+    size = len(ends)
+    if not size:
+        return []
+
+    capacity = (2 << _root_level(size)) - 1
+    max_end = ends + [-1] * (capacity - size)
+    for level in range(1, _root_level(size) + 1):
+        half = 1 << (level - 1)
+        for i in range((half << 1) - 1, capacity, half << 2):
+            max_end[i] = max(max_end[i], max_end[i - half], max_end[i + half])
+    return max_end[:size]
+
+
+def build_interval_index(full_ids: Iterable[str]) -> Dict[str, Dict[str, list]]:
+    intervals: Dict[str, List[Tuple[int, int, str]]] = {}
+    rejected = []
+    for full_id in set(full_ids):
+        try:
+            uid, start, end = parse_segment_range(full_id)
+        except ValueError:
+            rejected.append(full_id)
+            continue
+        intervals.setdefault(uid, []).append((start, end, full_id))
+    if rejected:
+        log.warning(
+            f"Bỏ qua {len(rejected)} id có segment không mã hóa được: "
+            f"{', '.join(sorted(rejected)[:5])}"
+        )
+
+    index = {}
+    for uid in sorted(intervals, key=natural_key):
+        entries = sorted(intervals[uid])
+        ends = [end for _, end, _ in entries]
+        index[uid] = {
+            "starts": [start for start, _, _ in entries],
+            "ends": ends,
+            "max_end": _subtree_max_ends(ends),
+            "refs": [full_id for _, _, full_id in entries],
+        }
+    return index
+
+
+def find_covering(
+    index: Dict[str, Dict[str, list]], uid: str, segment: Optional[str] = None
+) -> List[str]:
+    entry = index.get(uid)
+    if not entry:
+        return []
+
+    if segment:
+        _, query_start, query_end = parse_segment_range(f"{uid}#{segment}")
+    else:
+        query_start, query_end = 0, MAX_SEGMENT_KEY
+
+    starts, ends, max_end, refs = (
+        entry["starts"],
+        entry["ends"],
+        entry["max_end"],
+        entry["refs"],
+    )
+    size = len(starts)
+    matches = []
+    root = _root_level(size)
+    stack = [((1 << root) - 1, root, False)]
+    while stack:
+        node, level, left_done = stack.pop()
+        if level <= LINEAR_SCAN_LEVEL:
+            first = node >> level << level
+            for i in range(first, min(first + (1 << (level + 1)) - 1, size)):
+                if starts[i] > query_end:
+                    break
+                if ends[i] >= query_start:
+                    matches.append(refs[i])
+        elif not left_done:
+            stack.append((node, level, True))
+            left = node - (1 << (level - 1))
+            if left >= size or max_end[left] >= query_start:
+                stack.append((left, level - 1, False))
+        elif node < size and starts[node] <= query_end:
+            if ends[node] >= query_start:
+                matches.append(refs[node])
+            right = node + (1 << (level - 1))
+            if right >= size or max_end[right] >= query_start:
+                stack.append((right, level - 1, False))
+    return matches
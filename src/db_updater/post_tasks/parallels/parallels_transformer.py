@@ -1,6 +1,8 @@
 # Path: src/db_updater/post_tasks/parallels/parallels_transformer.py
 from collections import defaultdict
 
+from src.shared import merge_sorted
+
 from . import parallels_utils
 
 __all__ = [
@@ -21,8 +23,11 @@ def invert_to_segment_structure(category_map: dict) -> defaultdict:
 
 def flatten_segment_map(segment_data: dict) -> dict:
     flat_map = {}
-    for base_id, segments in segment_data.items():
-        flat_map.update(segments)
+    for full_id, relations in merge_sorted(
+        *(segments.items() for segments in segment_data.values()),
+        key=lambda item: item[0],
+    ):
+        flat_map[full_id] = relations
     return flat_map
 
 
@@ -1,12 +1,14 @@
 # Path: src/db_updater/post_tasks/parallels_task.py
-import json
 import logging
 from pathlib import Path
 
 from src.config import constants
+from src.shared import decode_json, open_source, write_json
 
 from .parallels import (
-    build_initial_map,
+    ParallelGroups,
+    build_clusters,
+    build_interval_index,
     create_book_structure,
     flatten_segment_map,
     invert_to_segment_structure,
@@ -24,11 +26,21 @@ def run(task_config: dict):
         input_path = project_root / task_config["path"]
         output_config = task_config.get("output", {})
         replacements = task_config.get("replacements", [])
+        compact = bool(task_config.get("compact", False))
 
         paths = {
             key: project_root / path
             for key, path in output_config.items()
-            if key in ["category", "segment", "flat_segment", "book"]
+            if key
+            in [
+                "category",
+                "segment",
+                "flat_segment",
+                "book",
+                "groups",
+                "clusters",
+                "intervals",
+            ]
         }
 
         if not any(paths.values()):
@@ -36,26 +48,48 @@ def run(task_config: dict):
             return
 
         log.info(f"Bắt đầu xử lý file parallels: {input_path}")
-        if not input_path.exists():
-            log.error(f"Không tìm thấy file input: {input_path}")
-            return
-
-        with open(input_path, "r", encoding="utf-8") as f:
-            raw_content = f.read()
+        with open_source(task_config.get("source")) as source:
+            if not source.exists(input_path):
+                log.error(f"Không tìm thấy file input: {input_path}")
+                return
+            raw_content = source.read_text(input_path)
 
         if replacements:
             log.info(f"Thực hiện {len(replacements)} thay thế văn bản từ config...")
             for find, replace in replacements:
                 raw_content = raw_content.replace(find, replace)
 
-        data = json.loads(raw_content)
+        data = decode_json(raw_content)
+
+        groups = ParallelGroups.from_data(data)
+        log.info(
+            f"Đã đọc {len(groups.groups)} nhóm quan hệ "
+            f"({len(groups.base_ids())} sutta được tham chiếu)."
+        )
+
+        if "groups" in paths:
+            _write_json(groups.to_dict(), paths["groups"], "Groups", compact)
+
+        if "clusters" in paths:
+            clusters = build_clusters(groups)
+            log.info(
+                f"Đã tính {len(clusters['parallels']['sutta']['clusters'])} cụm "
+                f"parallels cấp sutta và "
+                f"{len(clusters['parallels']['segment']['clusters'])} cụm cấp segment."
+            )
+            _write_json(clusters, paths["clusters"], "Clusters", compact)
+
+        if "intervals" in paths:
+            interval_index = build_interval_index(groups.all_ids())
+            log.info(f"Đã tạo chỉ mục khoảng segment cho {len(interval_index)} sutta.")
+            _write_json(interval_index, paths["intervals"], "Intervals", compact)
 
-        sutta_map = build_initial_map(data)
+        sutta_map = groups.to_sutta_map()
 
         if "category" in paths:
 
             category_data = sort_data_naturally(sutta_map)
-            _write_json(category_data, paths["category"], "Category")
+            _write_json(category_data, paths["category"], "Category", compact)
 
         if any(key in paths for key in ["segment", "flat_segment", "book"]):
 
@@ -63,26 +97,25 @@ def run(task_config: dict):
             segment_data = sort_data_naturally(segment_map)
 
             if "segment" in paths:
-                _write_json(segment_data, paths["segment"], "Segment")
+                _write_json(segment_data, paths["segment"], "Segment", compact)
 
             if "flat_segment" in paths:
 
                 flat_map = flatten_segment_map(segment_data)
                 flat_data = sort_data_naturally(flat_map)
-                _write_json(flat_data, paths["flat_segment"], "Flat Segment")
+                _write_json(flat_data, paths["flat_segment"], "Flat Segment", compact)
 
             if "book" in paths:
 
                 book_map = create_book_structure(segment_data)
                 book_data = sort_data_naturally(book_map)
-                _write_json(book_data, paths["book"], "Book")
+                _write_json(book_data, paths["book"], "Book", compact)
 
     except Exception as e:
         log.exception(f"Đã xảy ra lỗi không mong muốn khi xử lý parallels: {e}")
 
 
-def _write_json(data: dict, path: Path, file_type: str):
+def _write_json(data: dict, path: Path, file_type: str, compact: bool = False):
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    write_json(path, data, compact)
     log.info(f"✅ Đã lưu file {file_type} vào: {path}")
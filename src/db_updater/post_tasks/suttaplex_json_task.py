@@ -1,13 +1,15 @@
 # Path: src/db_updater/post_tasks/suttaplex_json_task.py
-import json
 import logging
 from pathlib import Path
-from typing import Dict, Set
+from typing import Any, Dict, Iterator, List, Set, Tuple
 
 from src.config import constants
+from src.shared import JSONDecodeError, read_json, write_json_object_stream
 
 log = logging.getLogger(__name__)
 
+SourcePosition = Tuple[int, int]
+
 
 def run(task_config: Dict):
 
@@ -22,45 +24,107 @@ def run(task_config: Dict):
     process_suttaplex_json(task_config, project_root, input_dir)
 
 
-def _process_group(
-    group_name: str, base_dir: Path, target_dict: Dict, existing_keys: Set[str] = None
-):
-    group_dir = base_dir / group_name
-    if not group_dir.is_dir():
-        log.warning(f"Thư mục nhóm '{group_name}' không tồn tại, bỏ qua.")
-        return
-
-    log.debug(f"Đang quét nhóm: {group_name}")
-    for file_path in group_dir.glob("*.json"):
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if not isinstance(data, list):
-                    log.warning(
-                        f"File {file_path.name} không chứa một danh sách, bỏ qua."
-                    )
-                    continue
-
-                for item in data:
-                    if not isinstance(item, dict) or "uid" not in item:
-                        log.warning(f"Mục trong {file_path.name} thiếu 'uid', bỏ qua.")
-                        continue
-
-                    uid = item["uid"]
+def _list_group_files(group_names: List[str], base_dir: Path) -> List[Path]:
+    files: List[Path] = []
+    for group_name in group_names:
+        group_dir = base_dir / group_name
+        if not group_dir.is_dir():
+            log.warning(f"Thư mục nhóm '{group_name}' không tồn tại, bỏ qua.")
+            continue
+        log.debug(f"Đang quét nhóm: {group_name}")
+        files.extend(group_dir.glob("*.json"))
+    return files
 
-                    if uid is None or uid == "null":
-                        log.debug(f"Phát hiện mục có uid không hợp lệ ({uid}), bỏ qua.")
-                        continue
 
-                    if existing_keys and uid in existing_keys:
-                        continue
+def _iter_items(
+    file_path: Path, warn: bool = True
+) -> Iterator[Tuple[int, str, Dict[str, Any]]]:
+    try:
+        data = read_json(file_path)
+    except (JSONDecodeError, IOError) as e:
+        if warn:
+            log.warning(f"Lỗi khi đọc file {file_path.name}, bỏ qua. Lỗi: {e}")
+        return
 
-                    value = item.copy()
-                    del value["uid"]
-                    target_dict[uid] = value
+    if not isinstance(data, list):
+        if warn:
+            log.warning(f"File {file_path.name} không chứa một danh sách, bỏ qua.")
+        return
 
-        except (json.JSONDecodeError, IOError) as e:
-            log.warning(f"Lỗi khi đọc file {file_path.name}, bỏ qua. Lỗi: {e}")
+    for item_index, item in enumerate(data):
+        if not isinstance(item, dict) or "uid" not in item:
+            if warn:
+                log.warning(f"Mục trong {file_path.name} thiếu 'uid', bỏ qua.")
+            continue
+
+        uid = item["uid"]
+
+        if uid is None or uid == "null":
+            if warn:
+                log.debug(f"Phát hiện mục có uid không hợp lệ ({uid}), bỏ qua.")
+            continue
+
+        yield item_index, uid, item
+
+
+def _index_group_files(
+    files: List[Path],
+    file_offset: int,
+    winners: Dict[str, SourcePosition],
+    order: List[Tuple[SourcePosition, str]],
+    existing_keys: Set[str],
+) -> int:
+    count = 0
+    for file_index, file_path in enumerate(files, file_offset):
+        for item_index, uid, _ in _iter_items(file_path):
+            if uid in existing_keys:
+                continue
+            position = (file_index, item_index)
+            if uid not in winners:
+                order.append((position, uid))
+                count += 1
+            winners[uid] = position
+    return count
+
+
+def _value(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in item.items() if key != "uid"}
+
+
+def _load_displaced_values(
+    files: List[Path],
+    winners: Dict[str, SourcePosition],
+    first_positions: Dict[SourcePosition, str],
+) -> Dict[str, Dict[str, Any]]:
+    displaced: Dict[int, Set[int]] = {}
+    for uid, position in winners.items():
+        if first_positions.get(position) != uid:
+            displaced.setdefault(position[0], set()).add(position[1])
+
+    values: Dict[str, Dict[str, Any]] = {}
+    for file_index in sorted(displaced):
+        for item_index, uid, item in _iter_items(files[file_index], warn=False):
+            if item_index in displaced[file_index]:
+                values[uid] = _value(item)
+    return values
+
+
+def _iter_merged_entries(
+    files: List[Path],
+    winners: Dict[str, SourcePosition],
+    order: List[Tuple[SourcePosition, str]],
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    first_positions = dict(order)
+    displaced_values = _load_displaced_values(files, winners, first_positions)
+
+    for file_index, file_path in enumerate(files):
+        for item_index, uid, item in _iter_items(file_path, warn=False):
+            if first_positions.get((file_index, item_index)) != uid:
+                continue
+            if uid in displaced_values:
+                yield uid, displaced_values.pop(uid)
+            else:
+                yield uid, _value(item)
 
 
 def process_suttaplex_json(config: Dict, project_root: Path, input_dir: Path):
@@ -68,39 +132,47 @@ def process_suttaplex_json(config: Dict, project_root: Path, input_dir: Path):
         output_file = project_root / config["output"]
         priority_groups = config.get("priority", [])
         super_tree_groups = config.get("super-tree", [])
+        compact = bool(config.get("compact", False))
     except KeyError as e:
         log.error(f"Thiếu key bắt buộc trong cấu hình 'suttaplex-json': {e}")
         return
 
     log.info("Bắt đầu xử lý suttaplex JSON với quy tắc priority và super-tree...")
 
-    priority_data = {}
-    log.info(f"Giai đoạn 1: Đang xử lý các nhóm ưu tiên: {priority_groups}")
-    for group in priority_groups:
-        _process_group(group, input_dir, priority_data)
-    log.info(f"-> Tìm thấy {len(priority_data)} mục ưu tiên.")
-
-    super_tree_only_data = {}
-    priority_keys = set(priority_data.keys())
-    log.info(f"Giai đoạn 2: Đang xử lý các nhóm super-tree: {super_tree_groups}")
-    for group in super_tree_groups:
-        _process_group(
-            group, input_dir, super_tree_only_data, existing_keys=priority_keys
-        )
-    log.info(
-        f"-> Tìm thấy {len(super_tree_only_data)} mục mới không trùng lặp từ super-tree."
+    priority_files = _list_group_files(priority_groups, input_dir)
+    super_tree_files = _list_group_files(super_tree_groups, input_dir)
+    files = super_tree_files + priority_files
+
+    priority_winners: Dict[str, SourcePosition] = {}
+    priority_order: List[Tuple[SourcePosition, str]] = []
+    log.info(f"Giai đoạn 1: Đang lập chỉ mục các nhóm ưu tiên: {priority_groups}")
+    priority_count = _index_group_files(
+        priority_files, len(super_tree_files), priority_winners, priority_order, set()
     )
+    log.info(f"-> Tìm thấy {priority_count} mục ưu tiên.")
+
+    winners: Dict[str, SourcePosition] = {}
+    order: List[Tuple[SourcePosition, str]] = []
+    log.info(f"Giai đoạn 2: Đang lập chỉ mục các nhóm super-tree: {super_tree_groups}")
+    super_tree_count = _index_group_files(
+        super_tree_files, 0, winners, order, set(priority_winners)
+    )
+    log.info(f"-> Tìm thấy {super_tree_count} mục mới không trùng lặp từ super-tree.")
+
+    winners.update(priority_winners)
+    order.extend(priority_order)
+    del priority_winners, priority_order
 
-    final_data = {**super_tree_only_data, **priority_data}
-
-    if final_data:
-        log.info(f"Tổng hợp được {len(final_data)} mục. Ghi ra file: {output_file}")
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(final_data, f, ensure_ascii=False, indent=2)
-            log.info("✅ Hoàn tất xử lý và tạo file suttaplex.json.")
-        except IOError as e:
-            log.error(f"Không thể ghi file output: {e}")
-    else:
+    if not order:
         log.warning("Không có dữ liệu suttaplex nào được xử lý.")
+        return
+
+    log.info(f"Tổng hợp được {len(order)} mục. Ghi ra file: {output_file}")
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        write_json_object_stream(
+            output_file, _iter_merged_entries(files, winners, order), compact
+        )
+        log.info("✅ Hoàn tất xử lý và tạo file suttaplex.json.")
+    except IOError as e:
+        log.error(f"Không thể ghi file output: {e}")
@@ -0,0 +1,103 @@
+# Path: src/shared/__init__.py
+from .artifact_writer import (
+    ARTIFACT_COMPRESSION_ENV,
+    DIGEST_SUFFIX,
+    artifact_compression,
+    artifact_digest,
+    artifact_exists,
+    atomic_artifact,
+    commit_artifact,
+    open_artifact,
+    open_artifact_output,
+    read_artifact_bytes,
+    read_artifact_digest,
+    resolve_artifact,
+    write_artifact,
+)
+from .cips_schema import CIPS_SCHEMA_PATH, CIPS_TABLES, read_cips_schema
+from .json_codec import (
+    JSON_BACKEND,
+    JSONDecodeError,
+    decode_json,
+    encode_json,
+    load_json,
+    read_json,
+    write_json,
+    write_json_object_stream,
+)
+from .manifest_store import (
+    ManifestEntry,
+    ManifestStore,
+    load_manifest,
+    manifest_exists,
+    parse_manifest_spec,
+)
+from .natural_sort import (
+    clear_natural_key_cache,
+    is_naturally_sorted,
+    merge_sorted,
+    natsorted,
+    natural_key,
+    natural_key_cache_info,
+)
+from .pali_text import fold_diacritics, normalize_pali, tokenize_pali
+from .source_backend import (
+    FileSystemSource,
+    GitBlobSource,
+    SourceBackend,
+    SourceFileInfo,
+    git_blob_sha,
+    git_index_shas,
+    open_source,
+)
+from .translation_resolver import TranslationIdResolver, UnmatchedFile
+
+__all__ = [
+    "ARTIFACT_COMPRESSION_ENV",
+    "CIPS_SCHEMA_PATH",
+    "CIPS_TABLES",
+    "DIGEST_SUFFIX",
+    "FileSystemSource",
+    "GitBlobSource",
+    "JSONDecodeError",
+    "JSON_BACKEND",
+    "ManifestEntry",
+    "ManifestStore",
+    "SourceBackend",
+    "SourceFileInfo",
+    "TranslationIdResolver",
+    "UnmatchedFile",
+    "artifact_compression",
+    "artifact_digest",
+    "artifact_exists",
+    "atomic_artifact",
+    "clear_natural_key_cache",
+    "commit_artifact",
+    "decode_json",
+    "encode_json",
+    "fold_diacritics",
+    "git_blob_sha",
+    "git_index_shas",
+    "is_naturally_sorted",
+    "load_json",
+    "load_manifest",
+    "manifest_exists",
+    "merge_sorted",
+    "natsorted",
+    "natural_key",
+    "natural_key_cache_info",
+    "normalize_pali",
+    "open_artifact",
+    "open_artifact_output",
+    "open_source",
+    "parse_manifest_spec",
+    "read_artifact_bytes",
+    "read_artifact_digest",
+    "read_cips_schema",
+    "read_json",
+    "resolve_artifact",
+    "tokenize_pali",
+    "write_artifact",
+    "write_json",
+    "write_json_object_stream",
+]
@@ -0,0 +1,230 @@
+# Path: src/shared/artifact_writer.py
+import gzip
+import hashlib
+import logging
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "ARTIFACT_COMPRESSION_ENV",
+    "DIGEST_SUFFIX",
+    "artifact_compression",
+    "artifact_digest",
+    "artifact_exists",
+    "atomic_artifact",
+    "commit_artifact",
+    "open_artifact",
+    "open_artifact_output",
+    "read_artifact_bytes",
+    "read_artifact_digest",
+    "resolve_artifact",
+    "write_artifact",
+]
+
+DIGEST_SUFFIX = ".sha256"
+HASH_CHUNK_SIZE = 1 << 20
+ARTIFACT_MODE = 0o644
+
+ARTIFACT_COMPRESSION_ENV = "PREBUILD_COMPRESSION"
+COMPRESSION_SUFFIXES = {"zstd": ".zst", "gzip": ".gz"}
+DEFAULT_COMPRESSION_LEVELS = {"zstd": 10, "gzip": 6}
+
+
+def digest_path(path: Path) -> Path:
+    return path.with_name(path.name + DIGEST_SUFFIX)
+
+
+def _variant(path: Path, suffix: str) -> Path:
+    return path.with_name(path.name + suffix) if suffix else path
+
+
+def _variants(path: Path) -> Iterator[Path]:
+    yield path
+    for suffix in COMPRESSION_SUFFIXES.values():
+        yield _variant(path, suffix)
+
+
+def artifact_compression() -> Optional[Tuple[str, int]]:
+    setting = os.environ.get(ARTIFACT_COMPRESSION_ENV, "").strip().lower()
+    if not setting or setting == "none":
+        return None
+    codec, _, level = setting.partition(":")
+    if codec == "zst":
+        codec = "zstd"
+    if codec not in COMPRESSION_SUFFIXES:
+        log.warning(
+            f"⚠️  Kiểu nén '{setting}' ({ARTIFACT_COMPRESSION_ENV}) không hợp lệ, "
+            "ghi file không nén."
+        )
+        return None
+    if codec == "zstd" and zstandard is None:
+        log.warning("⚠️  Cần gói zstandard để nén zstd, dùng gzip thay thế.")
+        codec, level = "gzip", ""
+    return codec, int(level) if level.isdigit() else DEFAULT_COMPRESSION_LEVELS[codec]
+
+
+def resolve_artifact(path: Path) -> Optional[Path]:
+    found = [
+        (variant.stat().st_mtime_ns, variant)
+        for variant in _variants(path)
+        if variant.is_file()
+    ]
+    return max(found)[1] if found else None
+
+
+def artifact_exists(path: Path) -> bool:
+    return resolve_artifact(path) is not None
+
+
+def _hash_file(path: Path, sync: bool = False) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+        if sync:
+            os.fsync(f.fileno())
+    return digest.hexdigest()
+
+
+def read_artifact_digest(path: Path) -> Optional[str]:
+    sidecar = digest_path(path)
+    try:
+        artifact_mtime = path.stat().st_mtime_ns
+        if sidecar.stat().st_mtime_ns < artifact_mtime:
+            return None
+        content = sidecar.read_text(encoding="utf-8").split()
+    except OSError:
+        return None
+    return content[0] if content else None
+
+
+def artifact_digest(path: Path) -> str:
+    return read_artifact_digest(path) or _hash_file(path)
+
+
+def _temp_path(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    return Path(name)
+
+
+def _write_digest(path: Path, digest: str):
+    temp_path = _temp_path(digest_path(path))
+    try:
+        temp_path.write_text(f"{digest}  {path.name}\n", encoding="utf-8")
+        os.chmod(temp_path, ARTIFACT_MODE)
+        os.replace(temp_path, digest_path(path))
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def commit_artifact(temp_path: Path, path: Path) -> bool:
+    try:
+        digest = _hash_file(temp_path, sync=True)
+        previous = None
+        if path.exists():
+            previous = read_artifact_digest(path)
+            if previous is None:
+                previous = _hash_file(path)
+                if previous == digest:
+                    _write_digest(path, digest)
+
+        if previous == digest:
+            temp_path.unlink()
+            log.info(f"Không có thay đổi, giữ nguyên: {path}")
+            return False
+
+        os.chmod(temp_path, ARTIFACT_MODE)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    _write_digest(path, digest)
+    return True
+
+
+@contextmanager
+def atomic_artifact(path: Path) -> Iterator[Path]:
+    temp_path = _temp_path(path)
+    try:
+        yield temp_path
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    commit_artifact(temp_path, path)
+
+
+def _remove_stale_variants(path: Path, target: Path):
+    for variant in _variants(path):
+        if variant != target and variant.exists():
+            variant.unlink()
+            digest_path(variant).unlink(missing_ok=True)
+            log.info(f"Đã xóa artifact cũ khác định dạng nén: {variant}")
+
+
+@contextmanager
+def open_artifact_output(path: Path) -> Iterator[IO[bytes]]:
+    compression = artifact_compression()
+    codec, level = compression or ("", 0)
+    target = _variant(path, COMPRESSION_SUFFIXES.get(codec, ""))
+
+    with atomic_artifact(target) as temp_path:
+        with open(temp_path, "wb") as raw:
+            if codec == "zstd":
+                compressor = zstandard.ZstdCompressor(level=level)
+                with compressor.stream_writer(raw, closefd=False) as f:
+                    yield f
+            elif codec == "gzip":
+                with gzip.GzipFile(
+                    filename="", mode="wb", fileobj=raw, compresslevel=level, mtime=0
+                ) as f:
+                    yield f
+            else:
+                yield raw
+
+    _remove_stale_variants(path, target)
+
+
+def write_artifact(path: Path, data: bytes):
+    with open_artifact_output(path) as f:
+        f.write(data)
+
+
+@contextmanager
+def open_artifact(path: Path) -> Iterator[IO[bytes]]:
+    source = resolve_artifact(path)
+    if source is None:
+        raise FileNotFoundError(f"Không tìm thấy artifact: {path}")
+
+    with open(source, "rb") as raw:
+        if source.name.endswith(COMPRESSION_SUFFIXES["zstd"]):
+            if zstandard is None:
+                raise RuntimeError(f"Cần gói zstandard để đọc file nén: {source}")
+            with zstandard.ZstdDecompressor().stream_reader(raw) as f:
+                yield f
+        elif source.name.endswith(COMPRESSION_SUFFIXES["gzip"]):
+            with gzip.GzipFile(fileobj=raw, mode="rb") as f:
+                yield f
+        else:
+            yield raw
+
+
+def read_artifact_bytes(path: Path) -> bytearray:
+    data = bytearray()
+    with open_artifact(path) as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            data += chunk
+    return data
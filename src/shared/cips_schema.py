@@ -0,0 +1,18 @@
+# Path: src/shared/cips_schema.py
+from pathlib import Path
+
+__all__ = ["CIPS_SCHEMA_PATH", "CIPS_TABLES", "read_cips_schema"]
+
+CIPS_SCHEMA_PATH = Path(__file__).with_name("cips_schema.sql")
+
+CIPS_TABLES = (
+    "Cips_Topics",
+    "Cips_Links",
+    "Cips_Topic_Prefixes",
+    "Cips_Topic_Trigrams",
+    "Cips_Related_Topics",
+)
+
+
+def read_cips_schema() -> str:
+    return CIPS_SCHEMA_PATH.read_text(encoding="utf-8")
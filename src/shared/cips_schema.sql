@@ -0,0 +1,52 @@
+-- Path: src/shared/cips_schema.sql
+
+-- 7. Bảng chỉ mục chủ đề CIPS (sao chép từ cips.sqlite do post-task cips-json tạo)
+CREATE TABLE IF NOT EXISTS "Cips_Topics" (
+    "topic_id" INTEGER PRIMARY KEY,
+    "name" TEXT NOT NULL UNIQUE,
+    "also_see" TEXT
+);
+
+CREATE TABLE IF NOT EXISTS "Cips_Links" (
+    "sutta_uid" TEXT NOT NULL,
+    "topic_id" INTEGER NOT NULL,
+    "context" TEXT NOT NULL,
+    "segment" TEXT NOT NULL DEFAULT '',
+    "position" INTEGER NOT NULL,
+    PRIMARY KEY ("sutta_uid", "topic_id", "context", "segment"),
+    FOREIGN KEY ("topic_id") REFERENCES "Cips_Topics" ("topic_id")
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_cips_links_topic
+ON Cips_Links (topic_id, context, sutta_uid);
+
+CREATE INDEX IF NOT EXISTS idx_cips_links_position
+ON Cips_Links (position);
+
+-- 8. Chỉ mục autocomplete chủ đề CIPS (tiền tố theo từ đã bỏ dấu + trigram)
+CREATE TABLE IF NOT EXISTS "Cips_Topic_Prefixes" (
+    "prefix_key" TEXT NOT NULL,
+    "position" INTEGER NOT NULL,
+    "topic_id" INTEGER NOT NULL,
+    PRIMARY KEY ("prefix_key", "position", "topic_id"),
+    FOREIGN KEY ("topic_id") REFERENCES "Cips_Topics" ("topic_id")
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS "Cips_Topic_Trigrams" (
+    "trigram" TEXT NOT NULL,
+    "topic_id" INTEGER NOT NULL,
+    PRIMARY KEY ("trigram", "topic_id"),
+    FOREIGN KEY ("topic_id") REFERENCES "Cips_Topics" ("topic_id")
+) WITHOUT ROWID;
+
+-- 9. Chủ đề CIPS liên quan (top-k theo PMI đồng xuất hiện trên cùng sutta)
+CREATE TABLE IF NOT EXISTS "Cips_Related_Topics" (
+    "topic_id" INTEGER NOT NULL,
+    "rank" INTEGER NOT NULL,
+    "related_topic_id" INTEGER NOT NULL,
+    "cooccurrence" INTEGER NOT NULL,
+    "pmi" REAL NOT NULL,
+    PRIMARY KEY ("topic_id", "rank"),
+    FOREIGN KEY ("topic_id") REFERENCES "Cips_Topics" ("topic_id"),
+    FOREIGN KEY ("related_topic_id") REFERENCES "Cips_Topics" ("topic_id")
+) WITHOUT ROWID;
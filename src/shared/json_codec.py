@@ -0,0 +1,208 @@
+# Path: src/shared/json_codec.py
+import io
+import itertools
+import json
+import logging
+import os
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, List, Tuple, Union
+
+from .artifact_writer import open_artifact_output, read_artifact_bytes, write_artifact
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+__all__ = [
+    "JSONDecodeError",
+    "JSON_BACKEND",
+    "JSON_CODEC_ENV",
+    "available_json_backends",
+    "decode_json",
+    "encode_json",
+    "load_json",
+    "read_json",
+    "write_json",
+    "write_json_object_stream",
+]
+
+log = logging.getLogger(__name__)
+
+JSON_CODEC_ENV = "JSON_CODEC"
+JSON_BACKENDS = ("orjson", "msgspec", "stdlib")
+
+JSONDecodeError = json.JSONDecodeError
+
+JsonEntry = Tuple[str, Any]
+
+REPR_FLOAT_MIN = 1e-4
+REPR_FLOAT_MAX = 1e16
+
+
+def _available(name: str) -> bool:
+    return {"orjson": orjson, "msgspec": msgspec}.get(name, json) is not None
+
+
+def available_json_backends() -> List[str]:
+    return [name for name in JSON_BACKENDS if _available(name)]
+
+
+def _select_backend() -> str:
+    requested = os.environ.get(JSON_CODEC_ENV, "").strip().lower()
+    if requested:
+        if requested in JSON_BACKENDS and _available(requested):
+            return requested
+        log.warning(
+            f"⚠️  Codec JSON '{requested}' ({JSON_CODEC_ENV}) không khả dụng, "
+            "dùng codec mặc định."
+        )
+    return available_json_backends()[0]
+
+
+JSON_BACKEND = _select_backend()
+
+_ENCODE_ERRORS: Tuple[type, ...] = (TypeError, OverflowError)
+_DECODE_ERRORS: Tuple[type, ...] = ()
+
+if orjson is not None:
+    _ORJSON_COMPACT = orjson.OPT_NON_STR_KEYS
+    _ORJSON_INDENT = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+    _DECODE_ERRORS += (orjson.JSONDecodeError,)
+if msgspec is not None:
+    _ENCODE_ERRORS += (msgspec.EncodeError,)
+    _DECODE_ERRORS += (msgspec.DecodeError,)
+
+
+def _stdlib_encode(obj: Any, compact: bool) -> bytes:
+    if compact:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    else:
+        text = json.dumps(obj, ensure_ascii=False, indent=2)
+    return text.encode("utf-8")
+
+
+def _has_stdlib_only_floats(obj: Any) -> bool:
+    stack = [obj]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        value = pop()
+        value_type = type(value)
+        if value_type is dict:
+            extend(value.values())
+        elif value_type is list or value_type is tuple:
+            extend(value)
+        elif value_type is float and not (
+            value == 0 or REPR_FLOAT_MIN <= abs(value) < REPR_FLOAT_MAX
+        ):
+            return True
+    return False
+
+
+def encode_json(obj: Any, compact: bool = False) -> bytes:
+    if JSON_BACKEND == "stdlib" or _has_stdlib_only_floats(obj):
+        return _stdlib_encode(obj, compact)
+    try:
+        if JSON_BACKEND == "orjson":
+            return orjson.dumps(
+                obj, option=_ORJSON_COMPACT if compact else _ORJSON_INDENT
+            )
+        if JSON_BACKEND == "msgspec":
+            data = msgspec.json.encode(obj)
+            return data if compact else msgspec.json.format(data, indent=2)
+    except _ENCODE_ERRORS:
+        pass
+    return _stdlib_encode(obj, compact)
+
+
+def decode_json(data: Union[bytes, str]) -> Any:
+    try:
+        if JSON_BACKEND == "orjson":
+            return orjson.loads(data)
+        if JSON_BACKEND == "msgspec":
+            return msgspec.json.decode(data)
+    except _DECODE_ERRORS:
+        pass
+    return json.loads(data)
+
+
+def load_json(fp: IO) -> Any:
+    return decode_json(fp.read())
+
+
+def read_json(path: Path) -> Any:
+    return decode_json(read_artifact_bytes(path))
+
+
+def write_json(path: Path, obj: Any, compact: bool = False):
+    write_artifact(path, encode_json(obj, compact))
+
+
+class _StreamedObject(dict):
+
+    def __init__(self, entries: Iterator[JsonEntry]):
+        super().__init__()
+        self._entries = entries
+
+    def __len__(self) -> int:
+        return 1
+
+    def items(self):
+        return self._entries
+
+
+def _stdlib_object_stream(f: IO[bytes], entries: Iterator[JsonEntry], compact: bool):
+    if compact:
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    else:
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+    text = io.TextIOWrapper(f, encoding="utf-8")
+    for chunk in encoder.iterencode(_StreamedObject(entries)):
+        text.write(chunk)
+    text.detach()
+
+
+def _write_object_stream(
+    f: IO[bytes], entries: Iterator[JsonEntry], compact: bool
+) -> int:
+    first = next(entries, None)
+    if first is None:
+        f.write(b"{}")
+        return 0
+
+    count = 0
+
+    def counted() -> Iterator[JsonEntry]:
+        nonlocal count
+        for entry in itertools.chain((first,), entries):
+            count += 1
+            yield entry
+
+    if JSON_BACKEND == "stdlib":
+        _stdlib_object_stream(f, counted(), compact)
+        return count
+
+    separator, indent = (b":", b"") if compact else (b": ", b"\n  ")
+    f.write(b"{")
+    for key, value in counted():
+        if count > 1:
+            f.write(b",")
+        f.write(indent)
+        f.write(encode_json(key, compact=True))
+        f.write(separator)
+        encoded = encode_json(value, compact)
+        f.write(encoded if compact else encoded.replace(b"\n", indent))
+    f.write(b"}" if compact else b"\n}")
+    return count
+
+
+def write_json_object_stream(
+    path: Path, entries: Iterable[JsonEntry], compact: bool = False
+) -> int:
+    with open_artifact_output(path) as f:
+        return _write_object_stream(f, iter(entries), compact)
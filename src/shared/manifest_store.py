@@ -0,0 +1,220 @@
+# Path: src/shared/manifest_store.py
+import logging
+import posixpath
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .artifact_writer import artifact_exists
+from .json_codec import read_json
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "ManifestEntry",
+    "ManifestStore",
+    "load_manifest",
+    "manifest_exists",
+    "parse_manifest_spec",
+]
+
+STORE_SUFFIXES = (".sqlite", ".db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS prefixes (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS entries (
+    manifest TEXT NOT NULL,
+    folder TEXT NOT NULL,
+    file_key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    prefix_id INTEGER NOT NULL REFERENCES prefixes (id),
+    file_name TEXT NOT NULL,
+    size INTEGER,
+    mtime_ns INTEGER,
+    sha TEXT,
+    PRIMARY KEY (manifest, folder, file_key)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_entries_order
+ON entries (manifest, position);
+
+CREATE INDEX IF NOT EXISTS idx_entries_file_key
+ON entries (file_key, manifest);
+"""
+
+
+@dataclass
+class ManifestEntry:
+    manifest: str
+    folder: str
+    file_key: str
+    relative_path: str
+    size: Optional[int] = None
+    mtime_ns: Optional[int] = None
+    sha: Optional[str] = None
+
+
+class ManifestStore:
+
+    def __init__(self, path: Path, read_only: bool = False):
+        self.path = path
+        self.read_only = read_only
+        self.conn: Optional[sqlite3.Connection] = None
+
+    def __enter__(self) -> "ManifestStore":
+        if self.read_only:
+            self.conn = sqlite3.connect(
+                f"{self.path.resolve().as_uri()}?mode=ro", uri=True
+            )
+            return self
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript(SCHEMA)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.conn is not None:
+            if exc_type is None and not self.read_only:
+                self.conn.commit()
+            self.conn.close()
+            self.conn = None
+
+    def _query(self, sql: str, params: Tuple = ()) -> sqlite3.Cursor:
+        assert self.conn is not None, "ManifestStore chưa được mở."
+        return self.conn.execute(sql, params)
+
+    def replace_all(self, entries: Iterable[ManifestEntry]) -> int:
+        assert self.conn is not None, "ManifestStore chưa được mở."
+        prefix_ids: Dict[str, int] = {}
+        rows = []
+        positions: Dict[str, int] = {}
+
+        for entry in entries:
+            prefix, file_name = posixpath.split(Path(entry.relative_path).as_posix())
+            prefix_id = prefix_ids.setdefault(prefix, len(prefix_ids) + 1)
+            position = positions.get(entry.manifest, 0)
+            positions[entry.manifest] = position + 1
+            rows.append(
+                (
+                    entry.manifest,
+                    entry.folder,
+                    entry.file_key,
+                    position,
+                    prefix_id,
+                    file_name,
+                    entry.size,
+                    entry.mtime_ns,
+                    entry.sha,
+                )
+            )
+
+        self.conn.execute("DELETE FROM entries")
+        self.conn.execute("DELETE FROM prefixes")
+        self.conn.executemany(
+            "INSERT INTO prefixes (id, path) VALUES (?, ?)",
+            [(prefix_id, prefix) for prefix, prefix_id in prefix_ids.items()],
+        )
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+        )
+        log.info(
+            f"Đã ghi {len(rows)} mục manifest ({len(prefix_ids)} tiền tố đường dẫn) "
+            f"vào: {self.path}"
+        )
+        return len(rows)
+
+    def manifests(self) -> List[str]:
+        return [row[0] for row in self._query("SELECT DISTINCT manifest FROM entries")]
+
+    def iter_entries(
+        self, manifest: str, folders: Optional[List[str]] = None
+    ) -> Iterator[Tuple[str, str, str]]:
+        sql = (
+            "SELECT e.folder, e.file_key, p.path, e.file_name FROM entries e "
+            "JOIN prefixes p ON p.id = e.prefix_id WHERE e.manifest = ?"
+        )
+        params: Tuple = (manifest,)
+        if folders:
+            sql += f" AND e.folder IN ({', '.join('?' for _ in folders)})"
+            params += tuple(folders)
+        sql += " ORDER BY e.position"
+        for folder, file_key, prefix, file_name in self._query(sql, params):
+            yield folder, file_key, posixpath.join(prefix, file_name)
+
+    def group_map(
+        self, manifest: str, folders: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, str]]:
+        data: Dict[str, Dict[str, str]] = {}
+        for folder, file_key, relative_path in self.iter_entries(manifest, folders):
+            data.setdefault(folder, {})[file_key] = relative_path
+        return data
+
+    def find_paths(
+        self, file_key: str, manifest: Optional[str] = None
+    ) -> List[Tuple[str, str, str]]:
+        sql = (
+            "SELECT e.manifest, e.folder, p.path, e.file_name FROM entries e "
+            "JOIN prefixes p ON p.id = e.prefix_id WHERE e.file_key = ?"
+        )
+        params: Tuple = (file_key,)
+        if manifest:
+            sql += " AND e.manifest = ?"
+            params += (manifest,)
+        return [
+            (manifest_name, folder, posixpath.join(prefix, file_name))
+            for manifest_name, folder, prefix, file_name in self._query(sql, params)
+        ]
+
+    def file_stats(self) -> Dict[str, Dict[str, Any]]:
+        rows = self._query(
+            "SELECT p.path, e.file_name, e.size, e.mtime_ns, e.sha FROM entries e "
+            "JOIN prefixes p ON p.id = e.prefix_id"
+        )
+        return {
+            posixpath.join(prefix, file_name): {
+                "size": size,
+                "mtime_ns": mtime_ns,
+                "sha": sha,
+            }
+            for prefix, file_name, size, mtime_ns, sha in rows
+        }
+
+
+def parse_manifest_spec(spec: Path) -> Tuple[Path, Optional[str]]:
+    name = spec.name
+    if "#" in name:
+        file_name, manifest = name.split("#", 1)
+        return spec.with_name(file_name), manifest or None
+    return spec, None
+
+
+def manifest_exists(spec: Path) -> bool:
+    path, _ = parse_manifest_spec(spec)
+    if path.suffix in STORE_SUFFIXES:
+        return path.exists()
+    return artifact_exists(path)
+
+
+def load_manifest(
+    spec: Path, folders: Optional[List[str]] = None
+) -> Dict[str, Dict[str, str]]:
+    path, manifest = parse_manifest_spec(spec)
+    if path.suffix in STORE_SUFFIXES:
+        if not manifest:
+            raise ValueError(
+                f"Thiếu tên manifest (dạng '{path.name}#<nhóm>') cho store: {path}"
+            )
+        if not path.exists():
+            raise FileNotFoundError(f"Không tìm thấy manifest store: {path}")
+        with ManifestStore(path, read_only=True) as store:
+            return store.group_map(manifest, folders)
+
+    data = read_json(path)
+    if folders:
+        return {folder: data[folder] for folder in folders if folder in data}
+    return data
@@ -0,0 +1,81 @@
+# Path: src/shared/natural_sort.py
+import heapq
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+__all__ = [
+    "NATURAL_KEY_CACHE_SIZE",
+    "clear_natural_key_cache",
+    "is_naturally_sorted",
+    "merge_sorted",
+    "natsorted",
+    "natural_key",
+    "natural_key_cache_info",
+]
+
+NATURAL_KEY_CACHE_SIZE = 1 << 18
+
+_NUMBER_RE = re.compile(r"(\d+)")
+
+
+@lru_cache(maxsize=NATURAL_KEY_CACHE_SIZE)
+def _string_key(text: str) -> Tuple:
+    parts = _NUMBER_RE.split(unicodedata.normalize("NFD", text))
+    if not parts[-1]:
+        parts.pop()
+    return tuple(int(part) if index % 2 else part for index, part in enumerate(parts))
+
+
+def natural_key(value: Any) -> Tuple:
+    if isinstance(value, str):
+        return _string_key(value)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return ("", value)
+    if isinstance(value, (tuple, list)):
+        return tuple(natural_key(item) for item in value)
+    raise TypeError(
+        f"Không thể tạo khóa sắp xếp tự nhiên cho kiểu {type(value).__name__}"
+    )
+
+
+def _compose(key: Optional[Callable[[Any], Any]]) -> Callable[[Any], Tuple]:
+    if key is None:
+        return natural_key
+    return lambda item: natural_key(key(item))
+
+
+def natsorted(
+    items: Iterable[Any],
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+) -> List[Any]:
+    return sorted(items, key=_compose(key), reverse=reverse)
+
+
+def is_naturally_sorted(
+    items: Iterable[Any], key: Optional[Callable[[Any], Any]] = None
+) -> bool:
+    sort_key = _compose(key)
+    previous = None
+    for index, item in enumerate(items):
+        current = sort_key(item)
+        if index and current < previous:
+            return False
+        previous = current
+    return True
+
+
+def merge_sorted(
+    *iterables: Iterable[Any], key: Optional[Callable[[Any], Any]] = None
+) -> Iterator[Any]:
+    return heapq.merge(*iterables, key=_compose(key))
+
+
+def natural_key_cache_info():
+    return _string_key.cache_info()
+
+
+def clear_natural_key_cache():
+    _string_key.cache_clear()
@@ -0,0 +1,31 @@
+# Path: src/shared/pali_text.py
+import re
+import unicodedata
+from typing import List, Tuple
+
+__all__ = [
+    "fold_diacritics",
+    "normalize_pali",
+    "tokenize_pali",
+]
+
+PALI_WORD_RE = re.compile(r"[a-zāīūṅñṭḍṇḷṃ]+")
+NIGGAHITA_VARIANTS = str.maketrans({"ṁ": "ṃ", "ŋ": "ṃ"})
+NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def normalize_pali(text: str) -> str:
+    return unicodedata.normalize("NFC", text).lower().translate(NIGGAHITA_VARIANTS)
+
+
+def tokenize_pali(text: str) -> List[Tuple[int, str]]:
+    return [
+        (position, match.group())
+        for position, match in enumerate(PALI_WORD_RE.finditer(normalize_pali(text)))
+    ]
+
+
+def fold_diacritics(text: str) -> str:
+    decomposed = unicodedata.normalize("NFD", text.translate(NIGGAHITA_VARIANTS))
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return NON_WORD_RE.sub(" ", stripped.casefold()).strip()
@@ -0,0 +1,339 @@
+# Path: src/shared/source_backend.py
+import bisect
+import hashlib
+import logging
+import os
+import subprocess
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .json_codec import decode_json
+
+from src.config.constants import PROJECT_ROOT
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "SourceFileInfo",
+    "SourceBackend",
+    "FileSystemSource",
+    "GitBlobSource",
+    "git_blob_sha",
+    "git_index_shas",
+    "open_source",
+]
+
+
+@dataclass
+class SourceFileInfo:
+    path: Path
+    size: int
+    mtime_ns: Optional[int] = None
+    blob_sha: Optional[str] = None
+
+
+def git_blob_sha(content: bytes) -> str:
+    header = f"blob {len(content)}\0".encode("ascii")
+    return hashlib.sha1(header + content).hexdigest()
+
+
+class SourceBackend(ABC):
+
+    @abstractmethod
+    def iter_files(self, directory: Path, suffix: str) -> Iterator[Path]:
+        pass
+
+    @abstractmethod
+    def read_bytes(self, path: Path) -> bytes:
+        pass
+
+    @abstractmethod
+    def exists(self, path: Path) -> bool:
+        pass
+
+    @abstractmethod
+    def is_dir(self, path: Path) -> bool:
+        pass
+
+    @abstractmethod
+    def scan_files(self, directory: Path, suffix: str) -> Iterator[SourceFileInfo]:
+        pass
+
+    def blob_sha(self, path: Path) -> str:
+        return git_blob_sha(self.read_bytes(path))
+
+    def read_text(self, path: Path) -> str:
+        return self.read_bytes(path).decode("utf-8")
+
+    def read_json(self, path: Path) -> Any:
+        return decode_json(self.read_bytes(path))
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _git_lines(directory: Path, args: List[str]) -> List[str]:
+    result = subprocess.run(
+        ["git", "-C", str(directory)] + args, capture_output=True, check=True
+    )
+    return [line.decode("utf-8") for line in result.stdout.split(b"\0") if line]
+
+
+def git_index_shas(directory: Path) -> Dict[str, str]:
+    try:
+        staged = _git_lines(directory, ["ls-files", "-s", "-z", "--", "."])
+        modified = set(
+            _git_lines(directory, ["diff-files", "--name-only", "--relative", "-z"])
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+
+    shas = {}
+    for record in staged:
+        meta, _, rel_path = record.partition("\t")
+        _, object_sha, stage = meta.split()
+        if stage == "0" and rel_path not in modified:
+            shas[os.path.join(str(directory), rel_path)] = object_sha
+    return shas
+
+
+class FileSystemSource(SourceBackend):
+
+    def __init__(self, use_git_index: bool = True):
+        self.use_git_index = use_git_index
+
+    def iter_files(self, directory: Path, suffix: str) -> Iterator[Path]:
+        return directory.glob(f"**/*{suffix}")
+
+    def scan_files(self, directory: Path, suffix: str) -> Iterator[SourceFileInfo]:
+        index_shas = git_index_shas(directory) if self.use_git_index else {}
+        pending = [str(directory)]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith(suffix) and entry.is_file():
+                            stat = entry.stat()
+                            yield SourceFileInfo(
+                                Path(entry.path),
+                                stat.st_size,
+                                stat.st_mtime_ns,
+                                index_shas.get(entry.path),
+                            )
+            except OSError as e:
+                log.warning(f"Không thể đọc thư mục {current}: {e}")
+
+    def read_bytes(self, path: Path) -> bytes:
+        return path.read_bytes()
+
+    def exists(self, path: Path) -> bool:
+        return path.exists()
+
+    def is_dir(self, path: Path) -> bool:
+        return path.is_dir()
+
+
+class GitBlobSource(SourceBackend):
+
+    def __init__(self, repo_path: Path, rev: str = "HEAD", git_dir: Path | None = None):
+        self.repo_path = repo_path
+        self.rev = rev
+        self._git_args = (
+            ["git", f"--git-dir={git_dir}"]
+            if git_dir
+            else ["git", "-C", str(repo_path)]
+        )
+        if git_dir is None:
+            self._check_toplevel()
+        self.sha = self._resolve_rev(rev)
+        self._tree_paths: Optional[List[str]] = None
+        self._tree_dirs: Optional[Set[str]] = None
+        self._tree_details: Optional[Dict[str, Tuple[str, int]]] = None
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._tree_lock = threading.Lock()
+        log.info(f"Nguồn dữ liệu git: {repo_path} @ {self.sha[:10]} (rev: {rev})")
+
+    def _run_git(self, args: List[str]) -> bytes:
+        result = subprocess.run(self._git_args + args, capture_output=True)
+        if result.returncode != 0:
+            message = result.stderr.decode("utf-8", errors="replace").strip()
+            raise RuntimeError(f"Lệnh git {' '.join(args)} thất bại: {message}")
+        return result.stdout
+
+    def _check_toplevel(self):
+        toplevel = Path(
+            self._run_git(["rev-parse", "--show-toplevel"]).decode().strip()
+        )
+        if toplevel.resolve() != self.repo_path.resolve():
+            raise RuntimeError(
+                f"{self.repo_path} không phải thư mục gốc của một repo git "
+                f"(git trả về {toplevel}). Submodule có thể chưa được khởi tạo."
+            )
+
+    def _resolve_rev(self, rev: str) -> str:
+        return (
+            self._run_git(["rev-parse", "--verify", f"{rev}^{{commit}}"])
+            .decode()
+            .strip()
+        )
+
+    def _relative(self, path: Path) -> str:
+        try:
+            relative = path.relative_to(self.repo_path)
+        except ValueError:
+            raise FileNotFoundError(f"Đường dẫn nằm ngoài repo nguồn: {path}")
+        return PurePosixPath(*relative.parts).as_posix() if relative.parts else ""
+
+    def _load_tree(self) -> List[str]:
+        if self._tree_paths is not None:
+            return self._tree_paths
+        with self._tree_lock:
+            if self._tree_paths is None:
+                output = self._run_git(
+                    ["ls-tree", "-r", "-z", "--full-tree", "--name-only", self.sha]
+                )
+                paths = sorted(p.decode("utf-8") for p in output.split(b"\0") if p)
+                dirs: Set[str] = {""}
+                for p in paths:
+                    parent = PurePosixPath(p).parent
+                    while str(parent) != "." and str(parent) not in dirs:
+                        dirs.add(str(parent))
+                        parent = parent.parent
+                self._tree_dirs = dirs
+                self._tree_paths = paths
+                log.debug(f"Đã liệt kê {len(paths)} blob tại {self.sha[:10]}.")
+        return self._tree_paths
+
+    def iter_files(self, directory: Path, suffix: str) -> Iterator[Path]:
+        paths = self._load_tree()
+        prefix = self._relative(directory)
+        prefix = f"{prefix}/" if prefix else ""
+        start = bisect.bisect_left(paths, prefix)
+        for rel_path in paths[start:]:
+            if not rel_path.startswith(prefix):
+                break
+            if rel_path.endswith(suffix):
+                yield self.repo_path / rel_path
+
+    def _load_tree_details(self) -> Dict[str, Tuple[str, int]]:
+        if self._tree_details is not None:
+            return self._tree_details
+        with self._tree_lock:
+            if self._tree_details is None:
+                output = self._run_git(
+                    ["ls-tree", "-r", "-z", "-l", "--full-tree", self.sha]
+                )
+                details: Dict[str, Tuple[str, int]] = {}
+                for record in output.split(b"\0"):
+                    if not record:
+                        continue
+                    meta, _, rel_path = record.partition(b"\t")
+                    _, object_type, object_sha, size = meta.split()
+                    if object_type == b"blob":
+                        details[rel_path.decode("utf-8")] = (
+                            object_sha.decode("ascii"),
+                            int(size),
+                        )
+                self._tree_details = details
+        return self._tree_details
+
+    def scan_files(self, directory: Path, suffix: str) -> Iterator[SourceFileInfo]:
+        details = self._load_tree_details()
+        for path in self.iter_files(directory, suffix):
+            entry = details.get(self._relative(path))
+            if entry is None:
+                continue
+            object_sha, size = entry
+            yield SourceFileInfo(path, size, blob_sha=object_sha)
+
+    def blob_sha(self, path: Path) -> str:
+        entry = self._load_tree_details().get(self._relative(path))
+        if entry is None:
+            raise FileNotFoundError(f"Không tìm thấy blob '{path}' @ {self.sha[:10]}")
+        return entry[0]
+
+    def exists(self, path: Path) -> bool:
+        try:
+            rel_path = self._relative(path)
+        except FileNotFoundError:
+            return False
+        paths = self._load_tree()
+        index = bisect.bisect_left(paths, rel_path)
+        return (index < len(paths) and paths[index] == rel_path) or self.is_dir(path)
+
+    def is_dir(self, path: Path) -> bool:
+        try:
+            rel_path = self._relative(path)
+        except FileNotFoundError:
+            return False
+        self._load_tree()
+        return self._tree_dirs is not None and rel_path in self._tree_dirs
+
+    def _ensure_process(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                self._git_args + ["cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        return self._process
+
+    def read_bytes(self, path: Path) -> bytes:
+        rel_path = self._relative(path)
+        with self._lock:
+            process = self._ensure_process()
+            assert process.stdin is not None and process.stdout is not None
+            process.stdin.write(f"{self.sha}:{rel_path}\n".encode("utf-8"))
+            process.stdin.flush()
+
+            header = process.stdout.readline().decode("utf-8").rstrip("\n")
+            parts = header.split(" ")
+            if header.endswith((" missing", " ambiguous")) or len(parts) != 3:
+                raise FileNotFoundError(
+                    f"Không tìm thấy blob '{rel_path}' @ {self.sha[:10]}"
+                )
+            _, object_type, size_str = parts
+            content = process.stdout.read(int(size_str) + 1)[:-1]
+
+        if object_type != "blob":
+            raise IsADirectoryError(
+                f"'{rel_path}' không phải là file (loại: {object_type})."
+            )
+        return content
+
+    def close(self):
+        if self._process is not None:
+            if self._process.stdin:
+                self._process.stdin.close()
+            self._process.wait()
+            self._process = None
+
+
+def open_source(source_config: Optional[Dict[str, Any]]) -> SourceBackend:
+    if not source_config or source_config.get("backend", "filesystem") == "filesystem":
+        return FileSystemSource()
+
+    backend = source_config.get("backend")
+    if backend != "git":
+        raise ValueError(f"Backend nguồn không được hỗ trợ: {backend}")
+
+    repo_path = PROJECT_ROOT / source_config["repo"]
+    git_dir = source_config.get("git_dir")
+    return GitBlobSource(
+        repo_path,
+        rev=str(source_config.get("rev", "HEAD")),
+        git_dir=PROJECT_ROOT / git_dir if git_dir else None,
+    )
@@ -0,0 +1,165 @@
+# Path: src/shared/translation_resolver.py
+import logging
+from collections import Counter, defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .json_codec import read_json, write_json
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "TranslationIdResolver",
+    "UnmatchedFile",
+]
+
+SPECIAL_FILE_IDS = {"sf36": "sf36_root"}
+TAISHO_AUTHOR = "taisho"
+TAISHO_ROOT_SUFFIX = "_root-lzh-sct"
+LANG_PART_INDEX = 2
+
+
+@dataclass
+class UnmatchedFile:
+    path: str
+    author: str
+    reason: str
+
+
+class TranslationIdResolver:
+
+    def __init__(
+        self,
+        translations: Iterable[Dict[str, Any]],
+        authors_map: Dict[str, Dict[str, Any]],
+    ):
+        self.known_ids: set = set()
+        self.index: Dict[Tuple[str, str, str], str] = {}
+        self.unmatched: List[UnmatchedFile] = []
+
+        for translation in translations:
+            translation_uid = translation.get("translation_uid")
+            if not translation_uid:
+                continue
+            self.known_ids.add(translation_uid)
+            id_parts = translation_uid.split("_", 2)
+            if len(id_parts) == 3:
+                self.index.setdefault(tuple(id_parts), translation_uid)
+
+        self.authors_map = authors_map
+        self.author_name_to_uids: Dict[str, List[str]] = defaultdict(list)
+        self.author_short_to_uids: Dict[str, List[str]] = defaultdict(list)
+        for uid, data in authors_map.items():
+            if data.get("author_name"):
+                self.author_name_to_uids[data["author_name"]].append(uid)
+            if data.get("author_short"):
+                self.author_short_to_uids[data["author_short"].lower()].append(uid)
+
+    @classmethod
+    def from_suttaplex(cls, suttaplex: Dict[str, Any]) -> "TranslationIdResolver":
+        translations = []
+        authors_map: Dict[str, Dict[str, Any]] = {}
+        for uid, card in suttaplex.items():
+            if not isinstance(card, dict):
+                continue
+            for trans in card.get("translations", []):
+                author_uid = trans.get("author_uid")
+                if author_uid and author_uid not in authors_map:
+                    authors_map[author_uid] = {
+                        "author_uid": author_uid,
+                        "author_name": trans.get("author"),
+                        "author_short": trans.get("author_short"),
+                    }
+                translations.append(
+                    {
+                        "translation_uid": trans.get("id"),
+                        "sc_uid": uid,
+                        "author_uid": author_uid,
+                        "lang": trans.get("lang"),
+                    }
+                )
+        return cls(translations, authors_map)
+
+    @classmethod
+    def from_suttaplex_file(cls, path: Path) -> "TranslationIdResolver":
+        return cls.from_suttaplex(read_json(path))
+
+    def author_candidates(
+        self, author_name: str, parent_dir: Optional[str] = None
+    ) -> List[str]:
+        candidates = self.author_name_to_uids.get(author_name)
+        if not candidates:
+            candidates = self.author_short_to_uids.get(author_name.lower())
+        if not candidates and parent_dir in self.authors_map:
+            candidates = [parent_dir]
+        return list(candidates or [])
+
+    def resolve(
+        self, lang: str, sutta_uid: str, author_candidates: Sequence[str]
+    ) -> Optional[str]:
+        for author_uid in author_candidates:
+            translation_uid = self.index.get((lang, sutta_uid, author_uid))
+            if translation_uid:
+                return translation_uid
+            if author_uid == TAISHO_AUTHOR:
+                special_id = f"{sutta_uid}{TAISHO_ROOT_SUFFIX}"
+                if special_id in self.known_ids:
+                    return special_id
+        return None
+
+    def _miss(self, path: str, author: str, reason: str) -> None:
+        self.unmatched.append(UnmatchedFile(path, author, reason))
+
+    def resolve_file(self, relative_path: str, author_name: str) -> Optional[str]:
+        path_parts = PurePosixPath(relative_path).parts
+        sutta_uid = PurePosixPath(relative_path).stem
+
+        special_id = SPECIAL_FILE_IDS.get(sutta_uid)
+        if special_id:
+            if special_id in self.known_ids:
+                return special_id
+            self._miss(relative_path, author_name, "special_id_missing")
+            return None
+
+        if len(path_parts) <= LANG_PART_INDEX:
+            self._miss(relative_path, author_name, "path_too_short")
+            return None
+        lang = path_parts[LANG_PART_INDEX]
+
+        candidates = self.author_candidates(author_name, path_parts[-2])
+        if not candidates:
+            self._miss(relative_path, author_name, "unknown_author")
+            return None
+
+        translation_uid = self.resolve(lang, sutta_uid, candidates)
+        if translation_uid is None:
+            self._miss(relative_path, author_name, "no_translation")
+        return translation_uid
+
+    def summarize(self) -> Dict[str, int]:
+        return dict(Counter(item.reason for item in self.unmatched))
+
+    def log_summary(self, matched: int) -> None:
+        summary = self.summarize()
+        if summary:
+            details = ", ".join(
+                f"{reason}: {count}" for reason, count in summary.items()
+            )
+            log.warning(
+                f"⚠️  {len(self.unmatched)} file HTML không khớp translation_uid "
+                f"({details}). Đã khớp {matched} file."
+            )
+        else:
+            log.info(f"✅ Đã khớp translation_uid cho toàn bộ {matched} file HTML.")
+
+    def write_report(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_json(
+            path,
+            {
+                "summary": self.summarize(),
+                "unmatched": [asdict(item) for item in self.unmatched],
+            },
+        )
+        log.info(f"Đã ghi báo cáo file HTML không khớp vào: {path}")
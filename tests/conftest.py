@@ -0,0 +1,101 @@
+# Path: tests/conftest.py
+import sys
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+@dataclass
+class StubResource:
+    body: bytes
+    etag: Optional[str] = None
+    support_range: bool = True
+
+
+class StubServer:
+
+    def __init__(self):
+        self.resources: Dict[str, StubResource] = {}
+        self.requests: List[Tuple[str, Dict[str, str]]] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def url(self, path: str) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+    def add(self, path: str, body: bytes, **kwargs) -> StubResource:
+        self.resources[path] = StubResource(body, **kwargs)
+        return self.resources[path]
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                stub.requests.append((self.path, dict(self.headers.items())))
+                resource = stub.resources.get(self.path)
+                if resource is None:
+                    self.send_error(404)
+                    return
+
+                body = resource.body
+                start = self._range_start(resource)
+                if start is not None and start >= len(body):
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{len(body)}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                if start is None:
+                    self.send_response(200)
+                    payload = body
+                else:
+                    self.send_response(206)
+                    self.send_header(
+                        "Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}"
+                    )
+                    payload = body[start:]
+                if resource.etag:
+                    self.send_header("ETag", resource.etag)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _range_start(self, resource: StubResource) -> Optional[int]:
+                range_header = self.headers.get("Range")
+                if not range_header or not resource.support_range:
+                    return None
+                if_range = self.headers.get("If-Range")
+                if if_range is not None and if_range != resource.etag:
+                    return None
+                return int(range_header.removeprefix("bytes=").split("-")[0])
+
+        return Handler
+
+
+@pytest.fixture
+def http_stub():
+    server = StubServer()
+    server.start()
+    yield server
+    server.stop()
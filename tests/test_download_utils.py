@@ -0,0 +1,161 @@
+# Path: tests/test_download_utils.py
+import hashlib
+import json
+
+import pytest
+
+from src.db_updater.handlers import download_utils
+
+BODY = bytes(range(256)) * 1024
+DIGEST = f"sha256:{hashlib.sha256(BODY).hexdigest()}"
+ETAG = '"release-v2"'
+
+
+def write_part(dest, content: bytes, source="v2", etag=ETAG):
+    download_utils.get_part_path(dest).write_bytes(content)
+    if source is not None:
+        download_utils.get_part_meta_path(dest).write_text(
+            json.dumps({"source": source, "etag": etag, "last_modified": None})
+        )
+
+
+def test_fresh_download_verifies_and_cleans_up(http_stub, tmp_path):
+    http_stub.add("/asset.zip", BODY, etag=ETAG)
+    dest = tmp_path / "asset.zip"
+
+    download_utils.download_resumable(
+        http_stub.url("/asset.zip"),
+        dest,
+        expected_size=len(BODY),
+        expected_digest=DIGEST,
+        source_id="v2",
+    )
+
+    assert dest.read_bytes() == BODY
+    assert not download_utils.get_part_path(dest).exists()
+    assert not download_utils.get_part_meta_path(dest).exists()
+
+
+def test_resume_sends_range_and_if_range(http_stub, tmp_path):
+    http_stub.add("/asset.zip", BODY, etag=ETAG)
+    dest = tmp_path / "asset.zip"
+    write_part(dest, BODY[:1000])
+
+    download_utils.download_resumable(
+        http_stub.url("/asset.zip"), dest, expected_digest=DIGEST, source_id="v2"
+    )
+
+    assert dest.read_bytes() == BODY
+    _, headers = http_stub.requests[-1]
+    assert headers["Range"] == "bytes=1000-"
+    assert headers["If-Range"] == ETAG
+
+
+def test_server_without_range_support_restarts(http_stub, tmp_path):
+    http_stub.add("/asset.zip", BODY, etag=ETAG, support_range=False)
+    dest = tmp_path / "asset.zip"
+    write_part(dest, b"x" * 1000)
+
+    download_utils.download_resumable(
+        http_stub.url("/asset.zip"),
+        dest,
+        expected_size=len(BODY),
+        expected_digest=DIGEST,
+        source_id="v2",
+    )
+
+    assert dest.read_bytes() == BODY
+
+
+def test_changed_etag_restarts_instead_of_splicing(http_stub, tmp_path):
+    http_stub.add("/asset.zip", BODY, etag=ETAG)
+    dest = tmp_path / "asset.zip"
+    write_part(dest, b"x" * 1000, etag='"release-v1"')
+
+    download_utils.download_resumable(
+        http_stub.url("/asset.zip"), dest, expected_size=len(BODY), source_id="v2"
+    )
+
+    assert dest.read_bytes() == BODY
+
+
+@pytest.mark.parametrize("source", ["v1", None])
+def test_part_from_other_source_is_discarded(http_stub, tmp_path, source):
+    http_stub.add("/asset.zip", BODY, etag=ETAG)
+    dest = tmp_path / "asset.zip"
+    write_part(dest, b"x" * 1000, source=source)
+
+    download_utils.download_resumable(
+        http_stub.url("/asset.zip"), dest, expected_size=len(BODY), source_id="v2"
+    )
+
+    assert dest.read_bytes() == BODY
+    _, headers = http_stub.requests[-1]
+    assert "Range" not in headers
+
+
+def test_complete_part_with_unknown_size_accepts_416(http_stub, tmp_path):
+    http_stub.add("/asset.zip", BODY, etag=ETAG)
+    dest = tmp_path / "asset.zip"
+    write_part(dest, BODY)
+
+    download_utils.download_resumable(
+        http_stub.url("/asset.zip"), dest, expected_digest=DIGEST, source_id="v2"
+    )
+
+    assert dest.read_bytes() == BODY
+    assert len(http_stub.requests) == 1
+
+
+def test_oversized_part_after_416_restarts(http_stub, tmp_path):
+    http_stub.add("/asset.zip", BODY[:2000], etag=ETAG)
+    dest = tmp_path / "asset.zip"
+    write_part(dest, BODY[:3000])
+
+    download_utils.download_resumable(http_stub.url("/asset.zip"), dest, source_id="v2")
+
+    assert dest.read_bytes() == BODY[:2000]
+
+
+def test_size_mismatch_raises_and_removes_part(http_stub, tmp_path):
+    http_stub.add("/asset.zip", BODY, etag=ETAG)
+    dest = tmp_path / "asset.zip"
+
+    with pytest.raises(download_utils.DownloadVerificationError):
+        download_utils.download_resumable(
+            http_stub.url("/asset.zip"), dest, expected_size=len(BODY) + 1
+        )
+
+    assert not dest.exists()
+    assert not download_utils.get_part_path(dest).exists()
+    assert not download_utils.get_part_meta_path(dest).exists()
+
+
+def test_digest_mismatch_raises_and_removes_part(http_stub, tmp_path):
+    http_stub.add("/asset.zip", BODY, etag=ETAG)
+    dest = tmp_path / "asset.zip"
+
+    with pytest.raises(download_utils.DownloadVerificationError):
+        download_utils.download_resumable(
+            http_stub.url("/asset.zip"),
+            dest,
+            expected_digest=f"sha256:{'0' * 64}",
+        )
+
+    assert not dest.exists()
+    assert not download_utils.get_part_path(dest).exists()
+
+
+@pytest.mark.parametrize("size", [-1, None])
+def test_verifying_stream_unbounded_read_returns_whole_body(
+    http_stub, monkeypatch, size
+):
+    monkeypatch.setattr(download_utils, "MAX_CHUNK_SIZE", 1000)
+    http_stub.add("/asset.tar", BODY)
+
+    with download_utils.VerifyingStream(
+        http_stub.url("/asset.tar"), expected_size=len(BODY), expected_digest=DIGEST
+    ) as stream:
+        assert stream.read(size) == BODY
+        assert stream.read(size) == b""
+        stream.verify()
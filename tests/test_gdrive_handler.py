@@ -0,0 +1,109 @@
+# Path: tests/test_gdrive_handler.py
+import hashlib
+import io
+import zipfile
+
+import pytest
+
+from src.db_updater.handlers import archive_utils, download_utils
+from src.db_updater.handlers.gdrive_handler import GDriveHandler
+
+FILE_ID = "1AbC-dEf"
+MEDIA_PATH = f"/drive/v3/files/{FILE_ID}?alt=media"
+MEMBERS = {
+    "dpd/dpd.db": b"sqlite" * 4096,
+    "dpd/readme.txt": b"Digital Pali Dictionary",
+    "dpd/nested/forms.tsv": b"dhammo\tdhamma\n" * 100,
+}
+
+
+def make_zip(members) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("dpd/", b"")
+        for name, content in members.items():
+            zf.writestr(name, content)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def drive(http_stub, tmp_path, monkeypatch):
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    return GDriveHandler(
+        {"download_url": http_stub.url("/drive/v3/files/{file_id}?alt=media")},
+        tmp_path,
+    )
+
+
+def file_info(body: bytes, **overrides):
+    info = {
+        "id": FILE_ID,
+        "size": str(len(body)),
+        "md5Checksum": hashlib.md5(body).hexdigest(),
+    }
+    info.update(overrides)
+    return info
+
+
+def test_download_uses_alt_media_and_verifies_md5(drive, http_stub, tmp_path):
+    body = make_zip(MEMBERS)
+    http_stub.add(MEDIA_PATH, body, etag='"drive-1"')
+    zip_path = tmp_path / "dpd.zip"
+
+    drive._download_zip(file_info(body), zip_path)
+
+    assert zip_path.read_bytes() == body
+    path, headers = http_stub.requests[-1]
+    assert path == MEDIA_PATH
+    assert headers["X-Goog-Api-Key"] == "test-key"
+
+
+def test_download_rejects_md5_mismatch(drive, http_stub, tmp_path):
+    body = make_zip(MEMBERS)
+    http_stub.add(MEDIA_PATH, body)
+    zip_path = tmp_path / "dpd.zip"
+
+    with pytest.raises(download_utils.DownloadVerificationError):
+        drive._download_zip(file_info(body, md5Checksum="0" * 32), zip_path)
+
+    assert not zip_path.exists()
+    assert not download_utils.get_part_path(zip_path).exists()
+
+
+def test_download_rejects_size_mismatch(drive, http_stub, tmp_path):
+    body = make_zip(MEMBERS)
+    http_stub.add(MEDIA_PATH, body)
+    zip_path = tmp_path / "dpd.zip"
+
+    with pytest.raises(download_utils.DownloadVerificationError):
+        drive._download_zip(
+            file_info(body, size=str(len(body) + 10), md5Checksum=None), zip_path
+        )
+
+    assert not zip_path.exists()
+
+
+def test_incremental_extract_skips_unchanged_members(tmp_path):
+    zip_path = tmp_path / "dpd.zip"
+    extract_dir = tmp_path / "out"
+    zip_path.write_bytes(make_zip(MEMBERS))
+
+    assert archive_utils.extract_zip_incremental(zip_path, extract_dir) == (3, 0)
+    assert archive_utils.extract_zip_incremental(zip_path, extract_dir) == (0, 3)
+    for name, content in MEMBERS.items():
+        assert (extract_dir / name).read_bytes() == content
+
+
+def test_incremental_extract_rewrites_on_crc_or_size_change(tmp_path):
+    zip_path = tmp_path / "dpd.zip"
+    extract_dir = tmp_path / "out"
+    zip_path.write_bytes(make_zip(MEMBERS))
+    archive_utils.extract_zip_incremental(zip_path, extract_dir)
+
+    same_size = extract_dir / "dpd/readme.txt"
+    same_size.write_bytes(b"X" * len(MEMBERS["dpd/readme.txt"]))
+    (extract_dir / "dpd/nested/forms.tsv").write_bytes(b"truncated")
+
+    assert archive_utils.extract_zip_incremental(zip_path, extract_dir) == (2, 1)
+    for name, content in MEMBERS.items():
+        assert (extract_dir / name).read_bytes() == content
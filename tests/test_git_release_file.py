@@ -0,0 +1,53 @@
+# Path: tests/test_git_release_file.py
+import io
+import zipfile
+
+from src.db_updater.handlers.git_release import git_release_file
+
+
+def write_zip(path, members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for name, content in members.items():
+            zf.writestr(name, content)
+    path.write_bytes(buffer.getvalue())
+
+
+def install(dest_path, extract_dir, members, replace_paths=()):
+    archive_path = dest_path / "dpd-kindle.zip"
+    write_zip(archive_path, members)
+    extract_dir.mkdir(parents=True, exist_ok=True)
+    return git_release_file.decompress_archive(
+        archive_path,
+        archive_path.name,
+        extract_dir,
+        force_extract=False,
+        auto_extract=True,
+        replace_paths=replace_paths,
+    )
+
+
+def test_owned_extract_folder_is_swapped_whole(tmp_path):
+    extract_dir = tmp_path / "dpd-kindle"
+    install(tmp_path, extract_dir, {"dpd.mobi": b"v1", "dpd.epub": b"v1"})
+
+    output = install(
+        tmp_path, extract_dir, {"dpd.mobi": b"v2"}, replace_paths={extract_dir}
+    )
+
+    assert output == [extract_dir / "dpd.mobi"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["dpd-kindle"]
+    assert sorted(p.name for p in extract_dir.iterdir()) == ["dpd.mobi"]
+    assert (extract_dir / "dpd.mobi").read_bytes() == b"v2"
+
+
+def test_shared_extract_folder_is_merged(tmp_path):
+    (tmp_path / "other.txt").write_bytes(b"other asset")
+    install(tmp_path, tmp_path, {"dpd/dpd.mobi": b"v1", "dpd/dpd.epub": b"v1"})
+
+    install(
+        tmp_path, tmp_path, {"dpd/dpd.mobi": b"v2"}, replace_paths={tmp_path / "dpd"}
+    )
+
+    assert (tmp_path / "other.txt").read_bytes() == b"other asset"
+    assert sorted(p.name for p in (tmp_path / "dpd").iterdir()) == ["dpd.mobi"]
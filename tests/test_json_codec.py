@@ -0,0 +1,38 @@
+# Path: tests/test_json_codec.py
+import json
+import math
+
+import pytest
+
+from src.shared import JSONDecodeError, json_codec
+
+
+@pytest.fixture(params=json_codec.available_json_backends())
+def backend(request, monkeypatch):
+    monkeypatch.setattr(json_codec, "JSON_BACKEND", request.param)
+    return request.param
+
+
+@pytest.mark.parametrize("compact", [True, False])
+def test_stdlib_only_floats_round_trip(backend, compact):
+    data = {"pmi": [float("nan"), float("inf"), 1.2e-05, 1e16, 0.5]}
+
+    encoded = json_codec.encode_json(data, compact)
+    decoded = json_codec.decode_json(encoded)
+
+    assert encoded == json_codec._stdlib_encode(data, compact)
+    assert math.isnan(decoded["pmi"][0])
+    assert decoded["pmi"][1:] == data["pmi"][1:]
+
+
+def test_malformed_input_still_raises(backend):
+    with pytest.raises(JSONDecodeError):
+        json_codec.decode_json(b'{"a": ')
+
+
+def test_indented_output_matches_stdlib(backend):
+    data = {"mn1": {"title": "Mūlapariyāya", "pmi": 2.5, "ids": [1, 2]}}
+
+    assert json_codec.encode_json(data) == json.dumps(
+        data, ensure_ascii=False, indent=2
+    ).encode("utf-8")
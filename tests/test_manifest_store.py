@@ -0,0 +1,42 @@
+# Path: tests/test_manifest_store.py
+import sqlite3
+
+import pytest
+
+from src.shared import ManifestEntry, ManifestStore, load_manifest
+
+ENTRIES = [
+    ManifestEntry("root", "root", "mn1", "root/pli/ms/sutta/mn/mn1_root-pli-ms.json"),
+    ManifestEntry("root", "root", "mn2", "root/pli/ms/sutta/mn/mn2_root-pli-ms.json"),
+]
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    path = tmp_path / "bilara_manifest.sqlite"
+    with ManifestStore(path) as store:
+        store.replace_all(ENTRIES)
+    return path
+
+
+def test_read_only_open_leaves_store_untouched(store_path):
+    before = (store_path.read_bytes(), store_path.stat().st_mtime_ns)
+
+    assert load_manifest(store_path.with_name(f"{store_path.name}#root")) == {
+        "root": {e.file_key: e.relative_path for e in ENTRIES}
+    }
+    with ManifestStore(store_path, read_only=True) as store:
+        with pytest.raises(sqlite3.OperationalError):
+            store.replace_all(ENTRIES)
+
+    assert (store_path.read_bytes(), store_path.stat().st_mtime_ns) == before
+
+
+def test_read_only_open_does_not_create_missing_store(tmp_path):
+    path = tmp_path / "missing" / "store.sqlite"
+
+    with pytest.raises(sqlite3.OperationalError):
+        with ManifestStore(path, read_only=True):
+            pass
+
+    assert not path.parent.exists()
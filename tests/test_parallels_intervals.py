@@ -0,0 +1,68 @@
+# Path: tests/test_parallels_intervals.py
+import random
+
+import pytest
+
+from src.db_updater.post_tasks.parallels import (
+    build_interval_index,
+    find_covering,
+    parse_segment_range,
+)
+
+
+def brute_force(full_ids, uid, segment):
+    _, query_start, query_end = parse_segment_range(f"{uid}#{segment}")
+    hits = []
+    for full_id in full_ids:
+        ref_uid, start, end = parse_segment_range(full_id)
+        if ref_uid == uid and start <= query_end and end >= query_start:
+            hits.append((start, end, full_id))
+    return [full_id for _, _, full_id in sorted(hits)]
+
+
+@pytest.mark.parametrize("count", [1, 2, 7, 16, 17, 100, 1000])
+def test_find_covering_matches_brute_force(count):
+    rng = random.Random(count)
+    full_ids = ["dn16#1.1-99.99"]
+    for _ in range(count):
+        a, b = rng.randrange(1, 60), rng.randrange(1, 60)
+        start, end = sorted((a, b))
+        full_ids.append(
+            f"dn16#{start}.{rng.randrange(1, 9)}-{end}.{rng.randrange(1, 9)}"
+        )
+    index = build_interval_index(full_ids)
+
+    for _ in range(200):
+        segment = f"{rng.randrange(1, 70)}.{rng.randrange(1, 9)}"
+        assert find_covering(index, "dn16", segment) == brute_force(
+            set(full_ids), "dn16", segment
+        )
+
+
+@pytest.mark.parametrize("count", [40, 43, 1000])
+def test_long_early_interval_does_not_hide_the_tail(count):
+    full_ids = ["sn1#1-9999"] + [f"sn1#{i}.1-{i}.2" for i in range(2, count)]
+    index = build_interval_index(full_ids)
+
+    for i in range(2, count):
+        assert find_covering(index, "sn1", f"{i}.1") == [
+            "sn1#1-9999",
+            f"sn1#{i}.1-{i}.2",
+        ]
+
+
+def test_letters_are_encoded_as_levels():
+    index = build_interval_index(["t26#0421a12-0421b03", "t26#0421c01", "t26"])
+
+    assert find_covering(index, "t26", "0421a20") == ["t26", "t26#0421a12-0421b03"]
+    assert find_covering(index, "t26", "0421c") == ["t26", "t26#0421c01"]
+    assert find_covering(index, "t26", "0422a01") == ["t26"]
+
+
+def test_unencodable_segments_are_rejected():
+    with pytest.raises(ValueError):
+        parse_segment_range("mn1#1.2xyz")
+
+    index = build_interval_index(["mn1#1.2xyz", "mn1#1.2"])
+
+    assert index["mn1"]["refs"] == ["mn1#1.2"]
@@ -0,0 +1,48 @@
+# Path: tests/test_translation_resolver.py
+from src.shared import TranslationIdResolver
+
+SUTTAPLEX = {
+    "mn1": {
+        "translations": [
+            {
+                "id": "mn1_translation-en-sujato",
+                "lang": "en",
+                "author_uid": "sujato",
+                "author": "Bhikkhu Sujato",
+                "author_short": "Sujato",
+                "segmented": True,
+            },
+            {
+                "id": "en_mn1_bodhi",
+                "lang": "en",
+                "author_uid": "bodhi",
+                "author": "Bhikkhu Bodhi",
+                "author_short": "Bodhi",
+                "segmented": False,
+            },
+        ]
+    }
+}
+
+
+def test_html_file_resolves_by_id_layout():
+    resolver = TranslationIdResolver.from_suttaplex(SUTTAPLEX)
+
+    assert (
+        resolver.resolve_file(
+            "sc-data/html_text/en/pli/sutta/mn/mn1.html", "Bhikkhu Bodhi"
+        )
+        == "en_mn1_bodhi"
+    )
+
+
+def test_html_file_does_not_resolve_to_segmented_translation():
+    resolver = TranslationIdResolver.from_suttaplex(SUTTAPLEX)
+
+    assert (
+        resolver.resolve_file(
+            "sc-data/html_text/en/pli/sutta/mn/mn1.html", "Bhikkhu Sujato"
+        )
+        is None
+    )
+    assert resolver.summarize() == {"no_translation": 1}